@@ -13,8 +13,25 @@ NEW IN THIS VERSION:
 - Validation results returned in generate_adaptive_financials()
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional, Union
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from functools import lru_cache
 import logging
+import math
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import chain
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
 
 try:
     from grounder_profile import (
@@ -24,23 +41,31 @@ try:
         NetworkStrength
     )
 except ImportError:
-    # Fallback for testing
-    class IndustryType:
-        CONSULTING = "consulting"
-        COACHING = "coaching"
-        HANDWERK = "handwerk"
-    
-    class ExperienceLevel:
-        EXPERT = "expert"
-        SENIOR = "senior"
-        JUNIOR = "junior"
-        EINSTEIGER = "einsteiger"
-    
-    class NetworkStrength:
-        STRONG = "strong"
-        MEDIUM = "medium"
-        WEAK = "weak"
-        NONE = "none"
+    # Fallback for testing. IntEnum members compare as ints; IndustryType ordinals
+    # follow the row order of INDUSTRY_RAMP_PROFILES so they index it directly.
+    class IndustryType(IntEnum):
+        CONSULTING = 0
+        COACHING = 1
+        HANDWERK = 2
+        FREIBERUFLER = 3
+        ONLINE = 4
+        DIENSTLEISTUNG = 5
+        SOFTWARE = 6
+        GASTRONOMIE = 7
+        EINZELHANDEL = 8
+        ECOMMERCE = 9
+    
+    class ExperienceLevel(IntEnum):
+        EXPERT = 0
+        SENIOR = 1
+        JUNIOR = 2
+        EINSTEIGER = 3
+    
+    class NetworkStrength(IntEnum):
+        STRONG = 0
+        MEDIUM = 1
+        WEAK = 2
+        NONE = 3
 
 logger = logging.getLogger(__name__)
 
@@ -77,53 +102,58 @@ LEGAL_CITATIONS_SUBSET = {
     }
 }
 
+# Citation texts end up in every validation result; intern them so all results
+# share one copy of each string.
+for _citation in LEGAL_CITATIONS_SUBSET.values():
+    for _key, _value in _citation.items():
+        _citation[_key] = sys.intern(_value)
+
+# Severity codes, ordered so the most severe finding is the max(); results and
+# batch arrays carry the int, to_dict() renders the name
+SEV_OK, SEV_INFO, SEV_WARNING, SEV_HIGH, SEV_CRITICAL = range(5)
+SEVERITY_NAMES = ('OK', 'INFO', 'WARNING', 'HIGH', 'CRITICAL')
+
 
 # ====================================================================================
-# VALIDATION FUNCTIONS WITH LEGAL CITATIONS
+# VALIDATION TEMPLATES - BUILT ONCE AT IMPORT
 # ====================================================================================
+# Citations are constant, so their text is baked into the templates here and
+# only the per-call numbers are formatted (via str.format_map) when a text is read.
 
-def validate_hauptberuflich_hours(hours_per_week: int) -> Dict:
-    """
-    Validate if hours meet Hauptberuflichkeit requirement
-    
-    Args:
-        hours_per_week: Hours per week dedicated to business
-    
-    Returns:
-        {
-            'valid': bool,
-            'error': Optional[str],
-            'warning': Optional[str],
-            'legal_citation': str,
-            'official_source': str,
-            'requirement': str,
-            'recommendation': Optional[str]
-        }
-    
-    Examples:
-        >>> validate_hauptberuflich_hours(30)
-        {'valid': True, 'legal_citation': 'SGB III Â§ 93 Abs. 2', ...}
-        
-        >>> validate_hauptberuflich_hours(12)
-        {'valid': False, 'error': 'âš ï¸ Mind. 15 Stunden/Woche erforderlich...', ...}
-    """
-    citation = LEGAL_CITATIONS_SUBSET['gz_hauptberuflich']
-    
-    result = {
-        'legal_citation': citation['format'],
-        'official_source': citation['official_source'],
-        'requirement': citation['short_text']
-    }
-    
-    if hours_per_week < 15:
-        result.update({
-            'valid': False,
-            'error': f"""âš ï¸ GZ-ANFORDERUNG NICHT ERFÃœLLT!
+_CIT_HAUPT_FMT = LEGAL_CITATIONS_SUBSET['gz_hauptberuflich']['format']
+_CIT_HAUPT_SRC = LEGAL_CITATIONS_SUBSET['gz_hauptberuflich']['official_source']
+_CIT_HAUPT_SHORT = LEGAL_CITATIONS_SUBSET['gz_hauptberuflich']['short_text']
+
+_CIT_ALLOWED_FMT = LEGAL_CITATIONS_SUBSET['gz_nebentaetigkeit_allowed']['format']
+_CIT_ALLOWED_SRC = LEGAL_CITATIONS_SUBSET['gz_nebentaetigkeit_allowed']['official_source']
+_CIT_ALLOWED_SHORT = LEGAL_CITATIONS_SUBSET['gz_nebentaetigkeit_allowed']['short_text']
+
+_CIT_WARNING_FMT = LEGAL_CITATIONS_SUBSET['gz_teilzeit_warning']['format']
+_CIT_WARNING_SRC = LEGAL_CITATIONS_SUBSET['gz_teilzeit_warning']['official_source']
+_CIT_WARNING_SHORT = LEGAL_CITATIONS_SUBSET['gz_teilzeit_warning']['short_text']
+
+_CIT_TRAG_FMT = LEGAL_CITATIONS_SUBSET['gz_tragfaehigkeit']['format']
+_CIT_TRAG_SRC = LEGAL_CITATIONS_SUBSET['gz_tragfaehigkeit']['official_source']
+_CIT_TRAG_SHORT = LEGAL_CITATIONS_SUBSET['gz_tragfaehigkeit']['short_text']
+
+_PTJ_CITATIONS = (_CIT_ALLOWED_FMT, _CIT_WARNING_FMT)
+_PTJ_SOURCES = (_CIT_ALLOWED_SRC, _CIT_WARNING_SRC)
+_PTJ_REQUIREMENTS = (
+    'NebentÃ¤tigkeit < 15 Stunden wÃ¶chentlich',
+    'Nebeneinkommen < 50% des Gesamteinkommens',
+    'UnverzÃ¼glich bei Agentur fÃ¼r Arbeit melden (Â§ 60 SGB III)'
+)
 
-Sie haben {hours_per_week} Stunden pro Woche angegeben.
 
-Rechtsgrundlage: {citation['format']}
-Anforderung: {citation['short_text']}
+# All validation texts by outcome. Kept out of the builder functions so their
+# code objects stay small.
+_ERROR_TEMPLATES: Dict[str, str] = {
+    'hours_too_low': f"""âš ï¸ GZ-ANFORDERUNG NICHT ERFÃœLLT!
+
+Sie haben {{hours}} Stunden pro Woche angegeben.
+
+Rechtsgrundlage: {_CIT_HAUPT_FMT}
+Anforderung: {_CIT_HAUPT_SHORT}
 
 FÃ¼r den GrÃ¼ndungszuschuss ist eine hauptberufliche selbstÃ¤ndige TÃ¤tigkeit erforderlich.
 Dies ist in der Regel bei mindestens 15 Stunden wÃ¶chentlich der Fall.
@@ -132,20 +162,13 @@ WICHTIG: Bei weniger als 15 Stunden droht:
 â€¢ Ablehnung des GrÃ¼ndungszuschuss-Antrags
 â€¢ RÃ¼ckforderung bereits gezahlter BetrÃ¤ge
 
-Quelle: {citation['official_source']}""",
-            'severity': 'CRITICAL',
-            'recommendation': 'ErhÃ¶hen Sie Ihre wÃ¶chentlichen Stunden auf mindestens 15 (besser 20-30 Stunden).'
-        })
-        return result
-    
-    if hours_per_week < 20:
-        result.update({
-            'valid': True,
-            'warning': f"""ðŸ’¡ HINWEIS: Niedrige Stundenzahl
+Quelle: {_CIT_HAUPT_SRC}""",
+
+    'hours_warning': f"""ðŸ’¡ HINWEIS: Niedrige Stundenzahl
 
-Sie haben {hours_per_week} Stunden pro Woche angegeben.
+Sie haben {{hours}} Stunden pro Woche angegeben.
 
-Dies erfÃ¼llt zwar das Minimum von 15 Stunden ({citation['format']}), 
+Dies erfÃ¼llt zwar das Minimum von 15 Stunden ({_CIT_HAUPT_FMT}), 
 aber die Agentur fÃ¼r Arbeit kÃ¶nnte kritisch prÃ¼fen ob die Hauptberuflichkeit 
 tatsÃ¤chlich gegeben ist.
 
@@ -153,95 +176,24 @@ EMPFEHLUNG:
 â€¢ 20-30 Stunden pro Woche sind sicherer
 â€¢ Dokumentieren Sie Ihre Arbeitszeiten
 â€¢ Zeigen Sie intensive GeschÃ¤ftstÃ¤tigkeit""",
-            'severity': 'INFO',
-            'recommendation': '20-30 Stunden pro Woche empfohlen fÃ¼r sichere GZ-Bewilligung.'
-        })
-        return result
-    
-    # All good
-    result.update({
-        'valid': True,
-        'note': f"""âœ… GZ-KONFORM
 
-{hours_per_week} Stunden pro Woche erfÃ¼llen die Hauptberuflichkeits-Anforderung.
+    'hours_ok': f"""âœ… GZ-KONFORM
 
-Rechtsgrundlage: {citation['format']}"""
-    })
-    
-    return result
+{{hours}} Stunden pro Woche erfÃ¼llen die Hauptberuflichkeits-Anforderung.
 
+Rechtsgrundlage: {_CIT_HAUPT_FMT}""",
 
-def validate_part_time_job(
-    part_time_hours: int,
-    part_time_income: float,
-    main_income_expected: float
-) -> Dict:
-    """
-    Validate if part-time activity meets GZ rules
-    
-    Args:
-        part_time_hours: Hours per week for part-time job
-        part_time_income: Monthly income from part-time job
-        main_income_expected: Expected monthly income from main business
-    
-    Returns:
-        {
-            'valid': bool,
-            'error': Optional[str],
-            'warning': Optional[str],
-            'legal_citations': List[str],
-            'requirements': List[str],
-            'recommendation': str
-        }
-    
-    Examples:
-        >>> validate_part_time_job(10, 500, 2000)
-        {'valid': True, 'note': 'NebentÃ¤tigkeit ist GZ-konform...'}
-        
-        >>> validate_part_time_job(20, 1500, 1000)
-        {'valid': False, 'error': 'ðŸš¨ KRITISCH: NebentÃ¤tigkeit gefÃ¤hrdet...'}
-    """
-    
-    allowed = LEGAL_CITATIONS_SUBSET['gz_nebentaetigkeit_allowed']
-    warning = LEGAL_CITATIONS_SUBSET['gz_teilzeit_warning']
-    
-    result = {
-        'legal_citations': [allowed['format'], warning['format']],
-        'official_sources': [allowed['official_source'], warning['official_source']],
-        'requirements': [
-            'NebentÃ¤tigkeit < 15 Stunden wÃ¶chentlich',
-            'Nebeneinkommen < 50% des Gesamteinkommens',
-            'UnverzÃ¼glich bei Agentur fÃ¼r Arbeit melden (Â§ 60 SGB III)'
-        ]
-    }
-    
-    # Check hours
-    hours_violation = part_time_hours >= 15
-    
-    # Check income ratio
-    total_income = part_time_income + main_income_expected
-    if total_income > 0:
-        part_time_ratio = (part_time_income / total_income) * 100
-    else:
-        part_time_ratio = 0
-    
-    income_violation = part_time_ratio > 50
-    
-    # CRITICAL: Both violations
-    if hours_violation and income_violation:
-        result.update({
-            'valid': False,
-            'error': f"""ðŸš¨ KRITISCH: NebentÃ¤tigkeit gefÃ¤hrdet Hauptberuflichkeit!
+    'part_time_both': f"""ðŸš¨ KRITISCH: NebentÃ¤tigkeit gefÃ¤hrdet Hauptberuflichkeit!
 
 DOPPELTE VERLETZUNG der GZ-Anforderungen:
 
-1. STUNDEN: {part_time_hours}h/Woche (Limit: < 15h)
-   Rechtsgrundlage: {allowed['format']}
+1. STUNDEN: {{hours}}h/Woche (Limit: < 15h)
+   Rechtsgrundlage: {_CIT_ALLOWED_FMT}
    
-2. EINKOMMEN: {part_time_ratio:.0f}% des Gesamteinkommens (Limit: < 50%)
-   Rechtsgrundlage: {warning['format']}
+2. EINKOMMEN: {{ratio:.0f}}% des Gesamteinkommens (Limit: < 50%)
+   Rechtsgrundlage: {_CIT_WARNING_FMT}
 
-{warning['short_text']}
+{_CIT_WARNING_SHORT}
 
 âš ï¸ RISIKO:
 â€¢ RÃ¼ckforderung des gesamten GrÃ¼ndungszuschusses
@@ -249,94 +201,65 @@ DOPPELTE VERLETZUNG der GZ-Anforderungen:
 â€¢ Rechtliche Konsequenzen
 
 Quellen: 
-{allowed['official_source']}
-{warning['official_source']}""",
-            'severity': 'CRITICAL',
-            'recommendation': 'Reduzieren Sie ENTWEDER Stunden auf max. 14h/Woche ODER Einkommen auf max. 40% des Gesamteinkommens.'
-        })
-        return result
-    
-    # CRITICAL: Hours violation only
-    if hours_violation:
-        result.update({
-            'valid': False,
-            'error': f"""ðŸš¨ KRITISCH: Zu viele Stunden NebentÃ¤tigkeit!
-
-Sie haben {part_time_hours} Stunden pro Woche angegeben.
-
-Rechtsgrundlage: {allowed['format']}
+{_CIT_ALLOWED_SRC}
+{_CIT_WARNING_SRC}""",
+
+    'part_time_hours': f"""ðŸš¨ KRITISCH: Zu viele Stunden NebentÃ¤tigkeit!
+
+Sie haben {{hours}} Stunden pro Woche angegeben.
+
+Rechtsgrundlage: {_CIT_ALLOWED_FMT}
 Anforderung: NebentÃ¤tigkeit < 15 Stunden wÃ¶chentlich
 
-{warning['short_text']}
+{_CIT_WARNING_SHORT}
 
 Bei mehr als 15 Stunden wÃ¶chentlich ist die Hauptberuflichkeit der selbstÃ¤ndigen 
 TÃ¤tigkeit gefÃ¤hrdet. Dies kann zur RÃ¼ckforderung des GrÃ¼ndungszuschusses fÃ¼hren.
 
-Quelle: {allowed['official_source']}""",
-            'severity': 'CRITICAL',
-            'recommendation': 'MAXIMUM: 14 Stunden pro Woche (besser 10-12 Stunden)'
-        })
-        return result
-    
-    # CRITICAL: Income violation only
-    if income_violation:
-        result.update({
-            'valid': False,
-            'error': f"""ðŸš¨ KRITISCH: Nebeneinkommen zu hoch!
+Quelle: {_CIT_ALLOWED_SRC}""",
 
-Nebeneinkommen: {part_time_ratio:.0f}% des Gesamteinkommens
-(Nebenjob: {part_time_income:.0f} EUR, HauptgeschÃ¤ft: {main_income_expected:.0f} EUR)
+    'part_time_income': f"""ðŸš¨ KRITISCH: Nebeneinkommen zu hoch!
 
-Rechtsgrundlage: {warning['format']}
+Nebeneinkommen: {{ratio:.0f}}% des Gesamteinkommens
+(Nebenjob: {{income:.0f}} EUR, HauptgeschÃ¤ft: {{main:.0f}} EUR)
+
+Rechtsgrundlage: {_CIT_WARNING_FMT}
 Anforderung: Nebeneinkommen < 50% des Gesamteinkommens
 
-{warning['short_text']}
+{_CIT_WARNING_SHORT}
 
 Wenn die NebentÃ¤tigkeit mehr als 50% des Gesamteinkommens generiert, gefÃ¤hrdet 
 dies die Hauptberuflichkeit der selbstÃ¤ndigen TÃ¤tigkeit.
 
-Quelle: {warning['official_source']}""",
-            'severity': 'CRITICAL',
-            'recommendation': f'Reduzieren Sie Nebeneinkommen auf max. {main_income_expected * 0.8:.0f} EUR/Monat (40% des Gesamteinkommens)'
-        })
-        return result
-    
-    # WARNING: Close to limits
-    if part_time_hours >= 12 or part_time_ratio > 40:
-        result.update({
-            'valid': True,
-            'warning': f"""âš ï¸ VORSICHT: Nahe an GZ-Grenzen!
+Quelle: {_CIT_WARNING_SRC}""",
+
+    'part_time_income_recommendation': 'Reduzieren Sie Nebeneinkommen auf max. {max_income:.0f} EUR/Monat (40% des Gesamteinkommens)',
+
+    'part_time_warning': f"""âš ï¸ VORSICHT: Nahe an GZ-Grenzen!
 
 Aktuelle Situation:
-â€¢ Stunden: {part_time_hours}h/Woche (Limit: < 15h)
-â€¢ Einkommen: {part_time_ratio:.0f}% (Limit: < 50%)
+â€¢ Stunden: {{hours}}h/Woche (Limit: < 15h)
+â€¢ Einkommen: {{ratio:.0f}}% (Limit: < 50%)
 
 Sie sind noch GZ-konform, aber nahe an den Grenzen.
 
 Rechtsgrundlagen:
-{allowed['format']}: {allowed['short_text']}
-{warning['format']}: {warning['short_text']}
+{_CIT_ALLOWED_FMT}: {_CIT_ALLOWED_SHORT}
+{_CIT_WARNING_FMT}: {_CIT_WARNING_SHORT}
 
 WICHTIG:
 â€¢ Melden Sie die NebentÃ¤tigkeit unverzÃ¼glich bei der Agentur fÃ¼r Arbeit (Â§ 60 SGB III)
 â€¢ Dokumentieren Sie Ihre Arbeitszeiten
 â€¢ Beobachten Sie das EinkommensverhÃ¤ltnis""",
-            'severity': 'WARNING',
-            'recommendation': 'Halten Sie Abstand zu den Grenzen (max. 12h/Woche, max. 40% Einkommen).'
-        })
-        return result
-    
-    # All good
-    result.update({
-        'valid': True,
-        'note': f"""âœ… NEBENTÃ„TIGKEIT GZ-KONFORM
+
+    'part_time_ok': f"""âœ… NEBENTÃ„TIGKEIT GZ-KONFORM
 
 Ihre NebentÃ¤tigkeit erfÃ¼llt die GZ-Anforderungen:
-â€¢ {part_time_hours}h/Woche (< 15h) âœ“
-â€¢ {part_time_ratio:.0f}% des Einkommens (< 50%) âœ“
+â€¢ {{hours}}h/Woche (< 15h) âœ“
+â€¢ {{ratio:.0f}}% des Einkommens (< 50%) âœ“
 
 Rechtsgrundlagen:
-{allowed['format']}: {allowed['short_text']}
+{_CIT_ALLOWED_FMT}: {_CIT_ALLOWED_SHORT}
 
 âš ï¸ WICHTIG: UnverzÃ¼glich bei Agentur fÃ¼r Arbeit melden!
 
@@ -344,15 +267,505 @@ Meldepflicht nach Â§ 60 SGB III:
 Alle Ã„nderungen der persÃ¶nlichen und wirtschaftlichen VerhÃ¤ltnisse mÃ¼ssen 
 der Agentur fÃ¼r Arbeit unverzÃ¼glich gemeldet werden.
 
-Quelle: {allowed['official_source']}""",
-        'reminder': 'Meldung bei Agentur fÃ¼r Arbeit nicht vergessen!',
-        'recommendation': 'Dokumentieren Sie Arbeitszeiten und Einnahmen fortlaufend.'
-    })
+Quelle: {_CIT_ALLOWED_SRC}""",
+
+    'capital_too_low': f"""âš ï¸ STARTKAPITAL ZU NIEDRIG
+
+VerfÃ¼gbar: {{capital:.0f}} EUR
+Monatliche Lebenshaltungskosten: {{living:.0f}} EUR
+Reichweite: {{months:.1f}} Monate
+
+Rechtsgrundlage: {_CIT_TRAG_FMT}
+Anforderung: {_CIT_TRAG_SHORT}
+
+EMPFEHLUNG: Mindestens 10.000 EUR Startkapital
+â†’ Deckt ca. 3 Monate Lebenshaltungskosten + GeschÃ¤ftskosten
+
+Quelle: {_CIT_TRAG_SRC}""",
+
+    'capital_warning': f"""ðŸ’¡ HINWEIS: Geringe Kapitalreserve
+
+Startkapital: {{capital:.0f}} EUR
+Reichweite: {{months:.1f}} Monate Lebenshaltungskosten
+
+Die fachkundige Stelle kÃ¶nnte dies als zu knapp bewerten.
+
+Rechtsgrundlage: {_CIT_TRAG_FMT}
+Anforderung: {_CIT_TRAG_SHORT}
+
+EMPFEHLUNG: 3-6 Monate Lebenshaltungskosten als Puffer
+â†’ Mindestens {{buffer:.0f}} EUR
+
+Quelle: {_CIT_TRAG_SRC}""",
+
+    'capital_warning_recommendation': 'Puffer von {buffer:.0f} EUR empfohlen',
+
+    'capital_ok': f"""âœ… STARTKAPITAL AUSREICHEND
+
+{{capital:.0f}} EUR = {{months:.1f}} Monate Lebenshaltungskosten
+
+Dies bietet eine solide Grundlage fÃ¼r die GrÃ¼ndung.
+
+Rechtsgrundlage: {_CIT_TRAG_FMT}"""
+}
+
+
+class _LazyStr:
+    """
+    Validation text that is only formatted when first read
+    
+    Most callers only look at 'valid'/'severity', so the long error/warning/note
+    texts are kept as template + arguments until str(), format(), slicing or
+    comparison needs the actual text. The formatted text is cached.
+    """
+    
+    __slots__ = ('_template', '_args', '_text')
+    
+    def __init__(self, template: str, args: Dict):
+        self._template = template
+        self._args = args
+        self._text = None
     
-    return result
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._template.format_map(self._args)
+        return self._text
+    
+    def __repr__(self) -> str:
+        return repr(str(self))
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+    
+    def __getitem__(self, index):
+        return str(self)[index]
+    
+    def __len__(self) -> int:
+        return len(str(self))
+    
+    def __contains__(self, item: str) -> bool:
+        return item in str(self)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (_LazyStr, str)):
+            return str(self) == str(other)
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(str(self))
+    
+    def __add__(self, other: str) -> str:
+        return str(self) + other
+    
+    def __radd__(self, other: str) -> str:
+        return other + str(self)
+
+
+# Validation text fields hold either a plain str or a _LazyStr; str() gives the text
+_Text = Union[str, _LazyStr]
 
 
-def validate_startup_capital(capital: float, living_costs_monthly: float) -> Dict:
+# ====================================================================================
+# VALIDATION RESULTS
+# ====================================================================================
+
+@dataclass(slots=True, frozen=True)
+class ValidationResult:
+    """Result of a single GZ validation (hours, capital)"""
+    valid: bool
+    legal_citation: str
+    official_source: str
+    requirement: str
+    severity: int = SEV_OK
+    error: Optional[_Text] = None
+    warning: Optional[_Text] = None
+    note: Optional[_Text] = None
+    recommendation: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """JSON-ready dict with all texts formatted; unset fields are omitted"""
+        return _result_to_dict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class PartTimeValidationResult:
+    """Result of the part-time (NebentÃ¤tigkeit) validation, citing two rules"""
+    valid: bool
+    legal_citations: Tuple[str, ...]
+    official_sources: Tuple[str, ...]
+    requirements: Tuple[str, ...]
+    severity: int = SEV_OK
+    error: Optional[_Text] = None
+    warning: Optional[_Text] = None
+    note: Optional[_Text] = None
+    reminder: Optional[str] = None
+    recommendation: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """JSON-ready dict with all texts formatted; unset fields are omitted"""
+        return _result_to_dict(self)
+
+
+def _result_to_dict(result) -> Dict:
+    data = {}
+    for f in fields(result):
+        value = getattr(result, f.name)
+        if value is None:
+            continue
+        if f.name == 'severity':
+            if value == SEV_OK:
+                continue
+            value = SEVERITY_NAMES[value]
+        elif isinstance(value, _LazyStr):
+            value = str(value)
+        elif isinstance(value, tuple):
+            value = list(value)
+        data[f.name] = value
+    return data
+
+
+def validation_result_to_json(result) -> bytes:
+    """
+    Serialize a validation result to UTF-8 JSON
+    
+    Uses orjson when installed, json otherwise; both produce the to_dict() shape.
+    
+    Args:
+        result: ValidationResult or PartTimeValidationResult
+    
+    Returns:
+        JSON document as bytes
+    """
+    data = result.to_dict()
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# ====================================================================================
+# VALIDATION OUTCOMES
+# ====================================================================================
+# One builder per validation outcome. Shared by the scalar validators and the batch
+# API so both produce identical results. Each builder binds its templates as
+# keyword-only defaults, so the per-row batch calls read them as locals.
+
+def _haupt_critical(hours: int, *, _template=_ERROR_TEMPLATES['hours_too_low']) -> ValidationResult:
+    return ValidationResult(
+        legal_citation=_CIT_HAUPT_FMT,
+        official_source=_CIT_HAUPT_SRC,
+        requirement=_CIT_HAUPT_SHORT,
+        valid=False,
+        error=_LazyStr(_template, {'hours': hours}),
+        severity=SEV_CRITICAL,
+        recommendation='ErhÃ¶hen Sie Ihre wÃ¶chentlichen Stunden auf mindestens 15 (besser 20-30 Stunden).'
+    )
+
+
+def _haupt_info(hours: int, *, _template=_ERROR_TEMPLATES['hours_warning']) -> ValidationResult:
+    return ValidationResult(
+        legal_citation=_CIT_HAUPT_FMT,
+        official_source=_CIT_HAUPT_SRC,
+        requirement=_CIT_HAUPT_SHORT,
+        valid=True,
+        warning=_LazyStr(_template, {'hours': hours}),
+        severity=SEV_INFO,
+        recommendation='20-30 Stunden pro Woche empfohlen fÃ¼r sichere GZ-Bewilligung.'
+    )
+
+
+def _haupt_ok(hours: int, *, _template=_ERROR_TEMPLATES['hours_ok']) -> ValidationResult:
+    return ValidationResult(
+        legal_citation=_CIT_HAUPT_FMT,
+        official_source=_CIT_HAUPT_SRC,
+        requirement=_CIT_HAUPT_SHORT,
+        valid=True,
+        note=_LazyStr(_template, {'hours': hours})
+    )
+
+
+def _ptj_critical_both(
+    hours: int,
+    ratio: float,
+    income: float,
+    main: float,
+    *,
+    _template=_ERROR_TEMPLATES['part_time_both']
+) -> PartTimeValidationResult:
+    return PartTimeValidationResult(
+        legal_citations=_PTJ_CITATIONS,
+        official_sources=_PTJ_SOURCES,
+        requirements=_PTJ_REQUIREMENTS,
+        valid=False,
+        error=_LazyStr(_template, {'hours': hours, 'ratio': ratio}),
+        severity=SEV_CRITICAL,
+        recommendation='Reduzieren Sie ENTWEDER Stunden auf max. 14h/Woche ODER Einkommen auf max. 40% des Gesamteinkommens.'
+    )
+
+
+def _ptj_critical_hours(
+    hours: int,
+    ratio: float,
+    income: float,
+    main: float,
+    *,
+    _template=_ERROR_TEMPLATES['part_time_hours']
+) -> PartTimeValidationResult:
+    return PartTimeValidationResult(
+        legal_citations=_PTJ_CITATIONS,
+        official_sources=_PTJ_SOURCES,
+        requirements=_PTJ_REQUIREMENTS,
+        valid=False,
+        error=_LazyStr(_template, {'hours': hours}),
+        severity=SEV_CRITICAL,
+        recommendation='MAXIMUM: 14 Stunden pro Woche (besser 10-12 Stunden)'
+    )
+
+
+def _ptj_critical_income(
+    hours: int,
+    ratio: float,
+    income: float,
+    main: float,
+    *,
+    _template=_ERROR_TEMPLATES['part_time_income'],
+    _recommendation=_ERROR_TEMPLATES['part_time_income_recommendation']
+) -> PartTimeValidationResult:
+    return PartTimeValidationResult(
+        legal_citations=_PTJ_CITATIONS,
+        official_sources=_PTJ_SOURCES,
+        requirements=_PTJ_REQUIREMENTS,
+        valid=False,
+        error=_LazyStr(_template, {'ratio': ratio, 'income': income, 'main': main}),
+        severity=SEV_CRITICAL,
+        recommendation=_recommendation.format_map({'max_income': main * 0.8})
+    )
+
+
+def _ptj_warning(
+    hours: int,
+    ratio: float,
+    income: float,
+    main: float,
+    *,
+    _template=_ERROR_TEMPLATES['part_time_warning']
+) -> PartTimeValidationResult:
+    return PartTimeValidationResult(
+        legal_citations=_PTJ_CITATIONS,
+        official_sources=_PTJ_SOURCES,
+        requirements=_PTJ_REQUIREMENTS,
+        valid=True,
+        warning=_LazyStr(_template, {'hours': hours, 'ratio': ratio}),
+        severity=SEV_WARNING,
+        recommendation='Halten Sie Abstand zu den Grenzen (max. 12h/Woche, max. 40% Einkommen).'
+    )
+
+
+def _ptj_ok(
+    hours: int,
+    ratio: float,
+    income: float,
+    main: float,
+    *,
+    _template=_ERROR_TEMPLATES['part_time_ok']
+) -> PartTimeValidationResult:
+    return PartTimeValidationResult(
+        legal_citations=_PTJ_CITATIONS,
+        official_sources=_PTJ_SOURCES,
+        requirements=_PTJ_REQUIREMENTS,
+        valid=True,
+        note=_LazyStr(_template, {'hours': hours, 'ratio': ratio}),
+        reminder='Meldung bei Agentur fÃ¼r Arbeit nicht vergessen!',
+        recommendation='Dokumentieren Sie Arbeitszeiten und Einnahmen fortlaufend.'
+    )
+
+
+def _capital_error(
+    capital: float,
+    living: float,
+    months: float,
+    *,
+    _template=_ERROR_TEMPLATES['capital_too_low']
+) -> ValidationResult:
+    return ValidationResult(
+        legal_citation=_CIT_TRAG_FMT,
+        official_source=_CIT_TRAG_SRC,
+        requirement=_CIT_TRAG_SHORT,
+        valid=False,
+        error=_LazyStr(_template, {'capital': capital, 'living': living, 'months': months}),
+        severity=SEV_HIGH,
+        recommendation='ErhÃ¶hen Sie Startkapital auf mind. 10.000 EUR'
+    )
+
+
+def _capital_warning(
+    capital: float,
+    living: float,
+    months: float,
+    *,
+    _template=_ERROR_TEMPLATES['capital_warning'],
+    _recommendation=_ERROR_TEMPLATES['capital_warning_recommendation']
+) -> ValidationResult:
+    buffer = living * 3
+    return ValidationResult(
+        legal_citation=_CIT_TRAG_FMT,
+        official_source=_CIT_TRAG_SRC,
+        requirement=_CIT_TRAG_SHORT,
+        valid=True,
+        warning=_LazyStr(_template, {'capital': capital, 'months': months, 'buffer': buffer}),
+        severity=SEV_INFO,
+        recommendation=_recommendation.format_map({'buffer': buffer})
+    )
+
+
+def _capital_ok(
+    capital: float,
+    living: float,
+    months: float,
+    *,
+    _template=_ERROR_TEMPLATES['capital_ok']
+) -> ValidationResult:
+    return ValidationResult(
+        legal_citation=_CIT_TRAG_FMT,
+        official_source=_CIT_TRAG_SRC,
+        requirement=_CIT_TRAG_SHORT,
+        valid=True,
+        note=_LazyStr(_template, {'capital': capital, 'months': months})
+    )
+
+
+# Outcome order matches the state codes returned by the state kernels below
+_HAUPT_OUTCOMES = (_haupt_critical, _haupt_info, _haupt_ok)
+_CAPITAL_OUTCOMES = (_capital_error, _capital_warning, _capital_ok)
+
+# Part-time state bits: hours >= 15, ratio > 50%, hours >= 12, ratio > 40%
+_PTJ_HOURS_VIOLATION = 0b1000
+_PTJ_INCOME_VIOLATION = 0b0100
+_PTJ_CLOSE_HOURS = 0b0010
+_PTJ_CLOSE_INCOME = 0b0001
+
+
+def _ptj_outcome(state: int):
+    """Resolve a 4-bit part-time state to its outcome builder (used at import only)"""
+    match (bool(state & _PTJ_HOURS_VIOLATION), bool(state & _PTJ_INCOME_VIOLATION)):
+        case (True, True):
+            return _ptj_critical_both
+        case (True, False):
+            return _ptj_critical_hours
+        case (False, True):
+            return _ptj_critical_income
+        case _ if state & (_PTJ_CLOSE_HOURS | _PTJ_CLOSE_INCOME):
+            return _ptj_warning
+        case _:
+            return _ptj_ok
+
+
+# All 16 states resolved once, so validation is a single tuple index
+_PTJ_DECISION_TABLE = tuple(_ptj_outcome(state) for state in range(16))
+
+
+# ====================================================================================
+# VALIDATION STATE KERNELS
+# ====================================================================================
+# Pure numeric threshold checks, written with bool arithmetic only so the same
+# function works on Python scalars (single validation) and NumPy arrays (batch).
+
+def _haupt_state(hours):
+    """0 = critical (< 15h), 1 = info (< 20h), 2 = ok"""
+    return (hours >= 15) * (1 + (hours >= 20))
+
+
+def _ptj_state(hours, ratio):
+    """4-bit index into _PTJ_DECISION_TABLE"""
+    return (hours >= 15) << 3 | (ratio > 50) << 2 | (hours >= 12) << 1 | (ratio > 40)
+
+
+def _capital_state(capital, months_covered):
+    """0 = error (< 5000 EUR), 1 = warning (< 2 months covered), 2 = ok"""
+    return (capital >= 5000) * (1 + (months_covered >= 2))
+
+
+# ====================================================================================
+# VALIDATION FUNCTIONS WITH LEGAL CITATIONS
+# ====================================================================================
+# Validators are pure functions of their inputs and are memoized. Results are frozen
+# dataclasses, so cached instances can be shared between callers. The caches are
+# typed because the messages format their inputs: 13 and 13.0 render differently.
+
+@lru_cache(maxsize=1024, typed=True)
+def validate_hauptberuflich_hours(hours_per_week: int) -> ValidationResult:
+    """
+    Validate if hours meet Hauptberuflichkeit requirement
+    
+    Args:
+        hours_per_week: Hours per week dedicated to business
+    
+    Returns:
+        ValidationResult(
+            valid: bool,
+            error: Optional[str],
+            warning: Optional[str],
+            legal_citation: str,
+            official_source: str,
+            requirement: str,
+            recommendation: Optional[str]
+        )
+    
+    Examples:
+        >>> validate_hauptberuflich_hours(30).to_dict()
+        {'valid': True, 'legal_citation': 'SGB III Â§ 93 Abs. 2', ...}
+        
+        >>> validate_hauptberuflich_hours(12).to_dict()
+        {'valid': False, 'error': 'âš ï¸ Mind. 15 Stunden/Woche erforderlich...', ...}
+    """
+    return _HAUPT_OUTCOMES[_haupt_state(hours_per_week)](hours_per_week)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def validate_part_time_job(
+    part_time_hours: int,
+    part_time_income: float,
+    main_income_expected: float
+) -> PartTimeValidationResult:
+    """
+    Validate if part-time activity meets GZ rules
+    
+    Args:
+        part_time_hours: Hours per week for part-time job
+        part_time_income: Monthly income from part-time job
+        main_income_expected: Expected monthly income from main business
+    
+    Returns:
+        PartTimeValidationResult(
+            valid: bool,
+            error: Optional[str],
+            warning: Optional[str],
+            legal_citations: Tuple[str, ...],
+            requirements: Tuple[str, ...],
+            recommendation: str
+        )
+    
+    Examples:
+        >>> validate_part_time_job(10, 500, 2000).to_dict()
+        {'valid': True, 'note': 'NebentÃ¤tigkeit ist GZ-konform...'}
+        
+        >>> validate_part_time_job(20, 1500, 1000).to_dict()
+        {'valid': False, 'error': 'ðŸš¨ KRITISCH: NebentÃ¤tigkeit gefÃ¤hrdet...'}
+    """
+    
+    # Check income ratio (no income at all -> infinite denominator -> 0%)
+    total_income = part_time_income + main_income_expected
+    denominator = total_income if total_income > 0 else math.inf
+    part_time_ratio = (part_time_income / denominator) * 100
+    
+    state = _ptj_state(part_time_hours, part_time_ratio)
+    
+    return _PTJ_DECISION_TABLE[state](
+        part_time_hours, part_time_ratio, part_time_income, main_income_expected
+    )
+
+
+@lru_cache(maxsize=1024, typed=True)
+def validate_startup_capital(capital: float, living_costs_monthly: float) -> ValidationResult:
     """
     Validate if startup capital is sufficient
     
@@ -364,74 +777,172 @@ def validate_startup_capital(capital: float, living_costs_monthly: float) -> Dic
         living_costs_monthly: Monthly living costs (EUR)
     
     Returns:
-        Validation result with recommendations
+        ValidationResult with recommendations
+    """
+    denominator = living_costs_monthly if living_costs_monthly > 0 else math.inf
+    months_covered = capital / denominator
+    state = _capital_state(capital, months_covered)
+    
+    return _CAPITAL_OUTCOMES[state](capital, living_costs_monthly, months_covered)
+
+
+def make_capital_validator(living_costs_monthly: float) -> Callable[[float], ValidationResult]:
     """
+    Specialize validate_startup_capital() for a fixed living-cost policy
     
-    citation = LEGAL_CITATIONS_SUBSET['gz_tragfaehigkeit']
+    The denominator and its zero guard are resolved once, so the returned
+    function only divides and dispatches on the state.
     
-    months_covered = capital / living_costs_monthly if living_costs_monthly > 0 else 0
+    Args:
+        living_costs_monthly: Monthly living costs (EUR) applied to every call
     
-    result = {
-        'legal_citation': citation['format'],
-        'official_source': citation['official_source'],
-        'requirement': citation['short_text']
-    }
+    Returns:
+        Function mapping capital (EUR) to the same ValidationResult as
+        validate_startup_capital(capital, living_costs_monthly)
+    """
+    denominator = living_costs_monthly if living_costs_monthly > 0 else math.inf
     
-    if capital < 5000:
-        result.update({
-            'valid': False,
-            'error': f"""âš ï¸ STARTKAPITAL ZU NIEDRIG
-
-VerfÃ¼gbar: {capital:.0f} EUR
-Monatliche Lebenshaltungskosten: {living_costs_monthly:.0f} EUR
-Reichweite: {months_covered:.1f} Monate
+    def validate(capital: float) -> ValidationResult:
+        months_covered = capital / denominator
+        state = _capital_state(capital, months_covered)
+        return _CAPITAL_OUTCOMES[state](capital, living_costs_monthly, months_covered)
+    
+    return validate
 
-Rechtsgrundlage: {citation['format']}
-Anforderung: {citation['short_text']}
 
-EMPFEHLUNG: Mindestens 10.000 EUR Startkapital
-â†’ Deckt ca. 3 Monate Lebenshaltungskosten + GeschÃ¤ftskosten
+# ====================================================================================
+# BATCH VALIDATION
+# ====================================================================================
 
-Quelle: {citation['official_source']}""",
-            'severity': 'HIGH',
-            'recommendation': 'ErhÃ¶hen Sie Startkapital auf mind. 10.000 EUR'
-        })
-        return result
+def validate_hauptberuflich_batch(hours_per_week) -> List[ValidationResult]:
+    """
+    Validate many hour values at once
     
-    if months_covered < 2:
-        result.update({
-            'valid': True,
-            'warning': f"""ðŸ’¡ HINWEIS: Geringe Kapitalreserve
-
-Startkapital: {capital:.0f} EUR
-Reichweite: {months_covered:.1f} Monate Lebenshaltungskosten
+    Thresholds are evaluated with NumPy; only the outcome text is formatted per row.
+    
+    Args:
+        hours_per_week: Sequence or array of hours per week
+    
+    Returns:
+        List of ValidationResult, same as validate_hauptberuflich_hours()
+    """
+    hours = np.asarray(hours_per_week)
+    states = _haupt_state(hours)
+    
+    outcomes = _HAUPT_OUTCOMES
+    return [
+        outcomes[state](h)
+        for state, h in zip(states.tolist(), hours.tolist())
+    ]
 
-Die fachkundige Stelle kÃ¶nnte dies als zu knapp bewerten.
 
-Rechtsgrundlage: {citation['format']}
-Anforderung: {citation['short_text']}
+def validate_part_time_batch(part_time_hours, part_time_income, main_income_expected) -> List[PartTimeValidationResult]:
+    """
+    Validate many part-time activities at once
+    
+    Args:
+        part_time_hours: Sequence or array of part-time hours per week
+        part_time_income: Sequence or array of monthly part-time income
+        main_income_expected: Sequence or array of expected monthly main income
+    
+    Returns:
+        List of PartTimeValidationResult, same as validate_part_time_job()
+    """
+    hours = np.asarray(part_time_hours)
+    income = np.asarray(part_time_income, dtype=float)
+    main = np.asarray(main_income_expected, dtype=float)
+    
+    total = income + main
+    ratios = (income / np.where(total > 0, total, np.inf)) * 100
+    
+    states = _ptj_state(hours, ratios)
+    
+    outcomes = _PTJ_DECISION_TABLE
+    return [
+        outcomes[state](h, r, i, m)
+        for state, h, r, i, m in zip(
+            states.tolist(), hours.tolist(), ratios.tolist(), income.tolist(), main.tolist()
+        )
+    ]
 
-EMPFEHLUNG: 3-6 Monate Lebenshaltungskosten als Puffer
-â†’ Mindestens {living_costs_monthly * 3:.0f} EUR
 
-Quelle: {citation['official_source']}""",
-            'severity': 'INFO',
-            'recommendation': f'Puffer von {living_costs_monthly * 3:.0f} EUR empfohlen'
-        })
-        return result
+def validate_startup_capital_batch(capital, living_costs_monthly) -> List[ValidationResult]:
+    """
+    Validate many capital/living-cost pairs at once
+    
+    Args:
+        capital: Sequence or array of available startup capital (EUR)
+        living_costs_monthly: Sequence or array of monthly living costs (EUR)
+    
+    Returns:
+        List of ValidationResult, same as validate_startup_capital()
+    """
+    capital_arr = np.asarray(capital, dtype=float)
+    living = np.asarray(living_costs_monthly, dtype=float)
+    
+    months = capital_arr / np.where(living > 0, living, np.inf)
     
-    result.update({
-        'valid': True,
-        'note': f"""âœ… STARTKAPITAL AUSREICHEND
+    states = _capital_state(capital_arr, months)
+    
+    outcomes = _CAPITAL_OUTCOMES
+    return [
+        outcomes[state](c, l, mo)
+        for state, c, l, mo in zip(
+            states.tolist(), capital_arr.tolist(), living.tolist(), months.tolist()
+        )
+    ]
 
-{capital:.0f} EUR = {months_covered:.1f} Monate Lebenshaltungskosten
 
-Dies bietet eine solide Grundlage fÃ¼r die GrÃ¼ndung.
+def validate_batch(profiles: List[Dict]) -> List[Dict]:
+    """
+    Run all GZ validations for many applicants
+    
+    Args:
+        profiles: [{'hours_per_week_available': 30, 'startup_capital': 10000,
+                    'monthly_living_costs': 2000, 'part_time_job_possible': True,
+                    'part_time_hours_per_week': 10, 'part_time_income_monthly': 500,
+                    'main_income_expected': 3000}, ...]
+    
+    Returns:
+        One {'hours': ValidationResult, 'part_time': PartTimeValidationResult or None,
+        'capital': ValidationResult} dict per profile
+    """
+    hours = validate_hauptberuflich_batch(
+        [p.get('hours_per_week_available', 0) for p in profiles]
+    )
+    capital = validate_startup_capital_batch(
+        [p.get('startup_capital', 0) for p in profiles],
+        [p.get('monthly_living_costs', 0) for p in profiles]
+    )
+    
+    part_time_idx = [i for i, p in enumerate(profiles) if p.get('part_time_job_possible')]
+    part_time = [None] * len(profiles)
+    if part_time_idx:
+        results = validate_part_time_batch(
+            [profiles[i].get('part_time_hours_per_week', 0) for i in part_time_idx],
+            [profiles[i].get('part_time_income_monthly', 0) for i in part_time_idx],
+            [profiles[i].get('main_income_expected', 0) for i in part_time_idx]
+        )
+        for i, result in zip(part_time_idx, results):
+            part_time[i] = result
+    
+    return [
+        {'hours': h, 'part_time': pt, 'capital': c}
+        for h, pt, c in zip(hours, part_time, capital)
+    ]
+
 
-Rechtsgrundlage: {citation['format']}"""
-    })
+def severity_codes(results) -> np.ndarray:
+    """
+    Severity codes of many results as an array (None entries count as SEV_OK)
     
-    return result
+    The most severe finding of a batch is severity_codes(results).max().
+    """
+    return np.fromiter(
+        (SEV_OK if r is None else r.severity for r in results),
+        dtype=np.int8,
+        count=len(results)
+    )
 
 
 # ====================================================================================
@@ -501,6 +1012,339 @@ INDUSTRY_RAMP_PROFILES = {
     }
 }
 
+# Starting utilization bonus by founder experience / network strength
+# (other levels, e.g. 'einsteiger' / 'none', get no bonus)
+EXPERIENCE_BONUS = {
+    'expert': 0.10,
+    'senior': 0.07,
+    'junior': 0.03
+}
+
+NETWORK_BONUS = {
+    'strong': 0.08,
+    'medium': 0.05,
+    'weak': 0.02
+}
+
+# Struct-of-arrays view of INDUSTRY_RAMP_PROFILES (one row per industry) so ramp
+# curves can be computed for whole month ranges in one NumPy expression.
+_INDUSTRY_KEYS = tuple(INDUSTRY_RAMP_PROFILES)
+_INDUSTRY_INDEX = {key: idx for idx, key in enumerate(_INDUSTRY_KEYS)}
+_DEFAULT_INDUSTRY_INDEX = _INDUSTRY_INDEX['dienstleistung']
+
+# Flat row-major table: base, growth, max, months_to_max per industry, with
+# NumPy column views over the same buffer for the vectorized paths
+_INDUSTRY_FIELDS = 4
+_INDUSTRY_DATA = array('d', chain.from_iterable(
+    (p['base'], p['growth'], p['max'], p['months_to_max'])
+    for p in INDUSTRY_RAMP_PROFILES.values()
+))
+_INDUSTRY_TABLE = np.frombuffer(_INDUSTRY_DATA, dtype=np.float64).reshape(-1, _INDUSTRY_FIELDS)
+_INDUSTRY_TABLE.flags.writeable = False
+
+_INDUSTRY_BASE = _INDUSTRY_TABLE[:, 0]
+_INDUSTRY_GROWTH = _INDUSTRY_TABLE[:, 1]
+_INDUSTRY_MAX = _INDUSTRY_TABLE[:, 2]
+_INDUSTRY_MONTHS_TO_MAX = _INDUSTRY_TABLE[:, 3]
+
+
+def _enum_value(member, default):
+    """
+    Key string of an enum-like profile value
+    
+    IntEnum members map to their lowercase name ('expert', 'strong', ...);
+    str-valued enums to their .value; anything else to `default`.
+    """
+    if isinstance(member, IntEnum):
+        return member.name.lower()
+    return getattr(member, 'value', default)
+
+
+_MISSING = object()
+
+
+def _profile_key(profile, attr: str, default):
+    """
+    Normalized key of an enum-like profile attribute
+    
+    Enum members map like _enum_value(); plain strings are used as-is and
+    a missing attribute gives `default`.
+    """
+    member = getattr(profile, attr, _MISSING)
+    if member is _MISSING:
+        return default
+    return _enum_value(member, member)
+
+
+def _industry_row(industry) -> int:
+    """Row of `industry` in the ramp tables (IndustryType, enum with .value or str)"""
+    if isinstance(industry, IntEnum):
+        return int(industry)
+    return _INDUSTRY_INDEX.get(getattr(industry, 'value', industry), _DEFAULT_INDUSTRY_INDEX)
+
+
+def get_ramp(industry) -> Tuple[float, float, float, int]:
+    """
+    Ramp parameters of an industry
+    
+    Args:
+        industry: IndustryType or key of INDUSTRY_RAMP_PROFILES (unknown keys use 'dienstleistung')
+    
+    Returns:
+        (base, growth, max, months_to_max)
+    """
+    off = _industry_row(industry) * _INDUSTRY_FIELDS
+    data = _INDUSTRY_DATA
+    return data[off], data[off + 1], data[off + 2], int(data[off + 3])
+
+
+def ramp_curve(industry, months: int = 12) -> np.ndarray:
+    """
+    Industry base ramp-up (without founder bonuses) for the first `months` months
+    
+    Args:
+        industry: IndustryType or key of INDUSTRY_RAMP_PROFILES (unknown keys use 'dienstleistung')
+        months: Number of months
+    
+    Returns:
+        Array of utilization rates, month 1 first, capped at the industry max
+    """
+    idx = _industry_row(industry)
+    m = np.arange(months)
+    return np.minimum(_INDUSTRY_BASE[idx] + _INDUSTRY_GROWTH[idx] * m, _INDUSTRY_MAX[idx])
+
+
+# Confidence score buckets: bisect_left over the sorted thresholds gives the
+# number of thresholds strictly below the value, i.e. the index of its score
+# (end balance > 10000 -> 30, ..., <= -5000 -> 0; break-even <= 3 -> 25, ...)
+_BALANCE_THRESHOLDS = (-5000, 0, 5000, 10000)
+_BALANCE_SCORES = (0, 5, 15, 25, 30)
+_BREAK_EVEN_THRESHOLDS = (3, 6, 9)
+_BREAK_EVEN_SCORES = (25, 20, 15, 10)
+_PROFIT_THRESHOLDS = (0, 10000, 20000, 30000)
+_PROFIT_SCORES = (0, 5, 10, 15, 20)
+
+
+# Plans always cover 12 months: month numbers and the linear fade-out of the
+# start bonus are shared, read-only arrays
+_MONTHS_12 = np.arange(1, 13)
+_BONUS_DECAY_12 = np.maximum(0, 1 - _MONTHS_12 / 12)
+_MONTHS_12.flags.writeable = False
+_BONUS_DECAY_12.flags.writeable = False
+
+
+@lru_cache(maxsize=256)
+def _utilization_curve(
+    row: int,
+    exp_level: str,
+    net_strength: str,
+    first_customers: int,
+    prev_self: bool,
+    months: int
+) -> Tuple[float, ...]:
+    """
+    Utilization curve for one combination of curve inputs (see
+    AdaptiveFinancialCalculator.calculate_utilization_curve)
+    """
+    off = row * _INDUSTRY_FIELDS
+    base_rate, growth_rate, max_util = _INDUSTRY_DATA[off:off + 3]
+    
+    # === MODIFIERS ===
+    experience_bonus = EXPERIENCE_BONUS.get(exp_level, 0)
+    network_bonus = NETWORK_BONUS.get(net_strength, 0)
+    first_customer_bonus = min(0.10, first_customers * 0.03)
+    self_emp_bonus = 0.05 if prev_self else 0
+    
+    # Total starting bonus
+    total_start_bonus = (
+        experience_bonus +
+        network_bonus +
+        first_customer_bonus +
+        self_emp_bonus
+    )
+    
+    # Adjusted max
+    adjusted_max = min(0.90, max_util + (total_start_bonus * 0.5))
+    
+    # Generate curve: linear ramp plus start bonus fading out over the first year
+    if months == 12:
+        month, bonus_decay = _MONTHS_12, _BONUS_DECAY_12
+    else:
+        month = np.arange(1, months + 1)
+        bonus_decay = np.maximum(0, 1 - month / 12)
+    util = base_rate + growth_rate * (month - 1)
+    util += total_start_bonus * bonus_decay
+    # Python's round() (correctly rounded) rather than ndarray.round(), which
+    # scales by 1000 first and can land on the other side of a .0005 tie
+    return tuple(round(u, 3) for u in np.minimum(adjusted_max, util).tolist())
+
+
+def _aggregate_sources(revenue_sources: List[Dict]) -> Tuple[float, float, float]:
+    """Summed prices of the (hourly, monthly, project) revenue sources; other types are ignored"""
+    price_sums = {'hourly': 0, 'monthly': 0, 'project': 0}
+    for source in revenue_sources:
+        if source['type'] in price_sums:
+            price_sums[source['type']] += source['price']
+    return price_sums['hourly'], price_sums['monthly'], price_sums['project']
+
+
+def _revenue(
+    source_prices: Tuple[float, float, float],
+    utilization: np.ndarray,
+    month: np.ndarray
+) -> np.ndarray:
+    """Monthly revenue from aggregated (hourly, monthly, project) prices"""
+    hourly_price, monthly_price, project_price = source_prices
+    
+    # Hourly: 80 billable hours at full utilization
+    total = (80 * utilization) * hourly_price
+    
+    # Retainers start in month 4
+    total += np.where(month >= 4, np.minimum(utilization * 1.5, 1.0) * monthly_price, 0)
+    
+    # Projects start in month 7
+    total += np.where(month >= 7, (utilization * 0.3) * project_price, 0)
+    
+    return total
+
+
+# Column order of _scenario_kernel()'s result
+_SCENARIO_COLUMNS = (
+    'umsatz',
+    'kosten_geschaeft',
+    'gewinn_geschaeft',
+    'privatentnahme',
+    'zusatz_einkommen',
+    'saldo',
+    'kontostand'
+)
+
+
+# Keys of one month row in the plan output
+_MONTH_KEYS = ('monat',) + _SCENARIO_COLUMNS + ('auslastung',)
+
+
+def _scenario_kernel(
+    umsatz: np.ndarray,
+    business_costs: np.ndarray,
+    living_costs: np.ndarray,
+    startup_capital,
+    part_time_income: np.ndarray,
+    part_time_months: np.ndarray
+) -> np.ndarray:
+    """
+    Numeric core of several 12-month scenarios at once (arrays in, arrays out)
+    
+    Args:
+        umsatz: (scenarios, 12) monthly revenue
+        business_costs: (scenarios,) monthly business costs
+        living_costs: (12,) monthly private drawings shared by all scenarios, or (scenarios, 12)
+        startup_capital: Opening balance, shared or (scenarios,)
+        part_time_income: (scenarios,) monthly part-time income
+        part_time_months: (scenarios,) months with part-time income
+    
+    Returns:
+        (scenarios, len(_SCENARIO_COLUMNS), 12) array, columns in _SCENARIO_COLUMNS order
+    """
+    month = _MONTHS_12
+    
+    # All columns stay float64: balances reach 1e5 EUR, where float32 steps are
+    # ~0.008 and would no longer round to the right cent
+    
+    # Business costs (+530 setup in month 1)
+    kosten_geschaeft = np.empty_like(umsatz)
+    kosten_geschaeft[:] = business_costs[:, None]
+    kosten_geschaeft[:, 0] += 530
+    
+    gewinn_geschaeft = umsatz - kosten_geschaeft
+    privatentnahme = np.broadcast_to(living_costs, umsatz.shape)
+    
+    # Part-time income for the first part_time_months
+    pt_income = part_time_income[:, None]
+    zusatz_einkommen = np.where(
+        (pt_income > 0) & (month <= part_time_months[:, None]), pt_income, 0.0
+    )
+    
+    # Net cashflow; the running balance starts from the capital
+    saldo = gewinn_geschaeft - privatentnahme + zusatz_einkommen
+    opening = np.empty((len(umsatz), 1))
+    opening[:, 0] = startup_capital
+    kontostand = np.cumsum(np.concatenate((opening, saldo), axis=1), axis=1)[:, 1:]
+    
+    return np.stack((
+        umsatz, kosten_geschaeft, gewinn_geschaeft, privatentnahme,
+        zusatz_einkommen, saldo, kontostand
+    ), axis=1)
+
+
+def _scenario_arrays(
+    util: np.ndarray,
+    business_costs: np.ndarray,
+    living_costs: np.ndarray,
+    startup_capital,
+    part_time_income: np.ndarray,
+    part_time_months: np.ndarray,
+    source_prices
+) -> Tuple[List, List, List]:
+    """
+    Rounded monthly tables, yearly totals and utilization (%) for a set of scenarios
+    
+    Args:
+        util: (scenarios, 12) utilization
+        source_prices: (hourly, monthly, project) shared by all scenarios, or a
+            (3, scenarios, 1) array with one price triple per scenario
+        others: see _scenario_kernel()
+    
+    Returns:
+        Nested lists, one entry per scenario
+    """
+    tables = _scenario_kernel(
+        _revenue(source_prices, util, _MONTHS_12),
+        business_costs,
+        living_costs,
+        startup_capital,
+        part_time_income,
+        part_time_months
+    )
+    # One rounding pass for the month rows and one reduction for all yearly
+    # totals (from the unrounded values). On an exact half-cent tie np.round()
+    # may land one cent away from round(); that is accepted for the amounts.
+    # The utilization percentage keeps round(), like the curve it comes from,
+    # so the displayed value is always the correctly rounded one.
+    return (
+        np.round(tables, 2).tolist(),
+        tables.sum(axis=2).tolist(),
+        [[round(u * 100, 1) for u in row] for row in util.tolist()]
+    )
+
+
+@lru_cache(maxsize=128)
+def _scenario_numbers(
+    curves: Tuple[Tuple[float, ...], ...],
+    business_costs: Tuple[float, ...],
+    living_costs: Tuple[float, ...],
+    startup_capital: float,
+    part_time_income: Tuple[float, ...],
+    part_time_months: Tuple[int, ...],
+    source_prices: Tuple[float, float, float]
+) -> Tuple[List, List, List]:
+    """
+    _scenario_arrays() for the scenarios of one plan, memoized on the full input
+    
+    Regenerating an unchanged plan (or a degenerate one where scenarios coincide)
+    skips the array work. The result is shared between calls: callers read it
+    and build their own dicts from it.
+    """
+    return _scenario_arrays(
+        np.array(curves, dtype=float),
+        np.array(business_costs, dtype=float),
+        np.array(living_costs, dtype=float),
+        startup_capital,
+        np.array(part_time_income, dtype=float),
+        np.array(part_time_months, dtype=float),
+        source_prices
+    )
+
 
 # ====================================================================================
 # ADAPTIVE FINANCIAL CALCULATOR - WITH VALIDATIONS
@@ -543,75 +1387,25 @@ class AdaptiveFinancialCalculator:
         """
         
         # Get industry profile
-        industry_key = getattr(profile.industry, 'value', profile.industry) if hasattr(profile, 'industry') else 'consulting'
-        industry_profile = INDUSTRY_RAMP_PROFILES.get(
-            industry_key,
-            INDUSTRY_RAMP_PROFILES['dienstleistung']  # Default
-        )
-        
-        base_rate = industry_profile['base']
-        growth_rate = industry_profile['growth']
-        max_util = industry_profile['max']
-        
-        # === MODIFIERS ===
-        
-        # 1. Experience bonus
-        exp_level = getattr(profile.experience_level, 'value', profile.experience_level) if hasattr(profile, 'experience_level') else 'junior'
-        
-        experience_bonus = 0
-        if exp_level == 'expert':
-            experience_bonus = 0.10
-        elif exp_level == 'senior':
-            experience_bonus = 0.07
-        elif exp_level == 'junior':
-            experience_bonus = 0.03
-        
-        # 2. Network bonus
-        net_strength = getattr(profile.network_strength, 'value', profile.network_strength) if hasattr(profile, 'network_strength') else 'medium'
+        industry = profile.industry if hasattr(profile, 'industry') else 'consulting'
         
-        network_bonus = 0
-        if net_strength == 'strong':
-            network_bonus = 0.08
-        elif net_strength == 'medium':
-            network_bonus = 0.05
-        elif net_strength == 'weak':
-            network_bonus = 0.02
-        
-        # 3. First customers bonus
+        # Bonus inputs; the first-customer bonus is capped at 4 customers, so
+        # larger pipelines share a cache entry
+        exp_level = _profile_key(profile, 'experience_level', 'junior')
+        net_strength = _profile_key(profile, 'network_strength', 'medium')
         first_customers = getattr(profile, 'first_customers_pipeline', 0)
-        first_customer_bonus = min(0.10, first_customers * 0.03)
-        
-        # 4. Previous self-employment
         prev_self = getattr(profile, 'previous_self_employment', False)
-        self_emp_bonus = 0.05 if prev_self else 0
-        
-        # Total starting bonus
-        total_start_bonus = (
-            experience_bonus +
-            network_bonus +
-            first_customer_bonus +
-            self_emp_bonus
-        )
-        
-        # Adjusted max
-        adjusted_max = min(0.90, max_util + (total_start_bonus * 0.5))
         
-        # Generate curve
-        curve = []
-        for month in range(1, months + 1):
-            # Base calculation
-            util = base_rate + (growth_rate * (month - 1))
-            
-            # Add bonuses (diminishing over time)
-            bonus_factor = max(0, 1 - (month / 12))
-            util += total_start_bonus * bonus_factor
-            
-            # Cap at max
-            util = min(adjusted_max, util)
-            
-            curve.append(round(util, 3))
+        curve = list(_utilization_curve(
+            _industry_row(industry),  # Unknown: 'dienstleistung'
+            exp_level,
+            net_strength,
+            min(first_customers, 4),
+            bool(prev_self),
+            months
+        ))
         
-        logger.info(f"ðŸ“ˆ Utilization: {curve[0]:.1%} â†’ {curve[-1]:.1%}")
+        logger.info("ðŸ“ˆ Utilization: %.1f%% â†’ %.1f%%", curve[0] * 100, curve[-1] * 100)
         
         return curve
     
@@ -633,7 +1427,6 @@ class AdaptiveFinancialCalculator:
             (monthly_costs, metadata)
         """
         
-        costs = []
         metadata = {
             'base_monthly': base_living_monthly,
             'effective_base': base_living_monthly,
@@ -656,16 +1449,12 @@ class AdaptiveFinancialCalculator:
         reduction_months = getattr(profile, 'living_reduction_months', 0)
         reduction_percent = getattr(profile, 'living_reduction_percent', 0)
         
-        for month in range(1, months + 1):
-            monthly_cost = effective_need
-            
-            # Apply temporary reduction
-            if can_reduce and month <= reduction_months:
-                reduction = effective_need * (reduction_percent / 100)
-                monthly_cost -= reduction
-                metadata['reduction_applied'] = True
-            
-            costs.append(round(monthly_cost, 2))
+        costs = np.full(months, effective_need, dtype=float)
+        reduced = max(0, min(months, math.floor(reduction_months))) if can_reduce else 0
+        if reduced:
+            costs[:reduced] -= effective_need * (reduction_percent / 100)
+            metadata['reduction_applied'] = True
+        costs = [round(c, 2) for c in costs.tolist()]
         
         # 3. Part-time info (separate from costs)
         part_time_possible = getattr(profile, 'part_time_job_possible', False)
@@ -677,7 +1466,8 @@ class AdaptiveFinancialCalculator:
                 metadata['part_time_income'] = pt_income
                 metadata['part_time_months'] = pt_months
         
-        logger.info(f"ðŸ’° Living costs: {costs[0]:,.0f} EUR/Monat (effective)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"ðŸ’° Living costs: {costs[0]:,.0f} EUR/Monat (effective)")
         
         return costs, metadata
     
@@ -705,32 +1495,115 @@ class AdaptiveFinancialCalculator:
         
         logger.info("ðŸš€ Generating adaptive financial plan WITH VALIDATIONS...")
         
+        plan = self._prepare_plan(
+            profile,
+            revenue_sources,
+            base_living_costs,
+            business_costs_monthly,
+            startup_capital
+        )
+        if 'error' in plan:
+            return plan
+        
+        generated = self._generate_scenarios(
+            plan['scenarios'],
+            plan['source_prices'],
+            plan['living_costs'],
+            startup_capital
+        )
+        return self._finish_plan(plan, generated)
+    
+    def generate_adaptive_financials_batch(self, plans: List[Dict]) -> List[Dict]:
+        """
+        Generate many plans, computing the scenarios of all of them in one array pass
+        
+        Args:
+            plans: [{'profile': ..., 'revenue_sources': [...], 'base_living_costs': 2000,
+                     'business_costs_monthly': 500, 'startup_capital': 10000}, ...]
+                   (keyword arguments of generate_adaptive_financials())
+        
+        Returns:
+            One result per plan, same as generate_adaptive_financials()
+        """
+        logger.info("ðŸš€ Generating %d adaptive financial plans WITH VALIDATIONS...", len(plans))
+        
+        prepared = [self._prepare_plan(**plan) for plan in plans]
+        ready = [
+            (plan, request['startup_capital'])
+            for plan, request in zip(prepared, plans)
+            if 'error' not in plan
+        ]
+        if not ready:
+            return prepared
+        
+        # One row per scenario of every plan
+        rows = [
+            (spec, plan['living_costs'][:12], capital, plan['source_prices'])
+            for plan, capital in ready
+            for spec in plan['scenarios']
+        ]
+        names, curves, business_costs, pt_income, pt_months = zip(*(row[0] for row in rows))
+        numbers = _scenario_arrays(
+            np.array([np.asarray(curve, dtype=float) for curve in curves]),
+            np.array(business_costs, dtype=float),
+            np.array([row[1] for row in rows], dtype=float),
+            np.array([row[2] for row in rows], dtype=float),
+            np.array(pt_income, dtype=float),
+            np.array(pt_months, dtype=float),
+            np.array([row[3] for row in rows], dtype=float).T[:, :, None]
+        )
+        generated = self._scenario_dicts(names, *numbers)
+        
+        results = iter(generated)
+        return [
+            plan if 'error' in plan
+            else self._finish_plan(plan, [next(results) for _ in plan['scenarios']])
+            for plan in prepared
+        ]
+    
+    def _prepare_plan(
+        self,
+        profile: 'GrounderProfile',
+        revenue_sources: List[Dict],
+        base_living_costs: float,
+        business_costs_monthly: float,
+        startup_capital: float
+    ) -> Dict:
+        """
+        Validate the inputs and set up the scenarios of one plan
+        
+        Returns:
+            The VALIDATION_FAILED response, or the plan state consumed by
+            _generate_scenarios() and _finish_plan()
+        """
+        
         # ========================================
         # NEW: VALIDATE INPUTS WITH LEGAL CITATIONS
         # ========================================
         
+        # Inputs of the validations, read once
+        hours_per_week = getattr(profile, 'hours_per_week_available', 0)
+        part_time_possible = getattr(profile, 'part_time_job_possible', False)
+        pt_hours = getattr(profile, 'part_time_hours_per_week', 0)
+        pt_income_monthly = getattr(profile, 'part_time_income_monthly', 0)
+        
         validations = {}
         warnings = []
         critical_errors = []
         
         # 1. Validate hours
-        hours_per_week = getattr(profile, 'hours_per_week_available', 0)
         hours_validation = validate_hauptberuflich_hours(hours_per_week)
-        validations['hours'] = hours_validation
+        validations['hours'] = hours_validation.to_dict()
         
-        if not hours_validation['valid']:
-            critical_errors.append(hours_validation['error'])
-            logger.error(f"âŒ CRITICAL: Hours validation failed: {hours_validation['error'][:100]}...")
-        elif 'warning' in hours_validation:
-            warnings.append(hours_validation['warning'])
-            logger.warning(f"âš ï¸ Hours validation warning")
+        if not hours_validation.valid:
+            critical_errors.append(str(hours_validation.error))
+            logger.error("âŒ CRITICAL: Hours validation failed: %.100s...", hours_validation.error)
+        elif hours_validation.warning is not None:
+            warnings.append(str(hours_validation.warning))
+            logger.warning("âš ï¸ Hours validation warning")
         
         # 2. Validate part-time (if applicable)
-        part_time_possible = getattr(profile, 'part_time_job_possible', False)
         if part_time_possible:
-            pt_hours = getattr(profile, 'part_time_hours_per_week', 0)
-            pt_income = getattr(profile, 'part_time_income_monthly', 0)
-            
             # Estimate main income for validation
             # Use average monthly revenue from base scenario
             avg_hourly_rate = revenue_sources[0]['price'] if revenue_sources else 120
@@ -738,17 +1611,17 @@ class AdaptiveFinancialCalculator:
             
             pt_validation = validate_part_time_job(
                 pt_hours,
-                pt_income,
+                pt_income_monthly,
                 estimated_main_income
             )
-            validations['part_time'] = pt_validation
+            validations['part_time'] = pt_validation.to_dict()
             
-            if not pt_validation['valid']:
-                critical_errors.append(pt_validation['error'])
-                logger.error(f"âŒ CRITICAL: Part-time validation failed")
-            elif 'warning' in pt_validation:
-                warnings.append(pt_validation['warning'])
-                logger.warning(f"âš ï¸ Part-time validation warning")
+            if not pt_validation.valid:
+                critical_errors.append(str(pt_validation.error))
+                logger.error("âŒ CRITICAL: Part-time validation failed")
+            elif pt_validation.warning is not None:
+                warnings.append(str(pt_validation.warning))
+                logger.warning("âš ï¸ Part-time validation warning")
         else:
             validations['part_time'] = None
         
@@ -757,20 +1630,20 @@ class AdaptiveFinancialCalculator:
             startup_capital,
             base_living_costs
         )
-        validations['capital'] = capital_validation
+        validations['capital'] = capital_validation.to_dict()
         
-        if not capital_validation['valid']:
-            warnings.append(capital_validation['error'])
-            logger.warning(f"âš ï¸ Capital validation: Not sufficient")
-        elif 'warning' in capital_validation:
-            warnings.append(capital_validation['warning'])
+        if not capital_validation.valid:
+            warnings.append(str(capital_validation.error))
+            logger.warning("âš ï¸ Capital validation: Not sufficient")
+        elif capital_validation.warning is not None:
+            warnings.append(str(capital_validation.warning))
         
         # ========================================
         # IF CRITICAL ERRORS: RETURN ERROR RESPONSE
         # ========================================
         
         if critical_errors:
-            logger.error(f"ðŸš¨ Cannot generate financials: {len(critical_errors)} critical validation errors")
+            logger.error("ðŸš¨ Cannot generate financials: %d critical validation errors", len(critical_errors))
             return {
                 'error': 'VALIDATION_FAILED',
                 'critical_errors': critical_errors,
@@ -782,6 +1655,12 @@ class AdaptiveFinancialCalculator:
         # CONTINUE WITH FINANCIAL PLANNING
         # ========================================
         
+        # Profile summary inputs, only needed for a valid plan
+        experience = _profile_key(profile, 'experience_level', 'unknown')
+        network = _profile_key(profile, 'network_strength', 'unknown')
+        first_customers = getattr(profile, 'first_customers_pipeline', 0)
+        partner_support = getattr(profile, 'partner_income_monthly', None) is not None
+        
         # 1. Utilization curve
         utilization_curve = self.calculate_utilization_curve(profile)
         
@@ -791,58 +1670,49 @@ class AdaptiveFinancialCalculator:
             base_living_costs
         )
         
-        # 3. Base Scenario
-        base_scenario = self._generate_scenario(
-            "Base (Adaptive)",
-            utilization_curve,
-            revenue_sources,
-            business_costs_monthly,
-            living_costs_monthly,
-            startup_capital,
-            part_time_income=0
-        )
-        
-        # 4. Best Case (+20%)
-        best_util = [min(0.90, u * 1.2) for u in utilization_curve]
-        best_scenario = self._generate_scenario(
-            "Best Case (+20%)",
-            best_util,
-            revenue_sources,
-            business_costs_monthly,
-            living_costs_monthly,
-            startup_capital,
-            part_time_income=0
-        )
-        
-        # 5. Worst Case (-30%)
-        worst_util = [u * 0.7 for u in utilization_curve]
-        worst_scenario = self._generate_scenario(
-            "Worst Case (-30%)",
-            worst_util,
-            revenue_sources,
-            business_costs_monthly * 1.05,
-            living_costs_monthly,
-            startup_capital,
-            part_time_income=0
-        )
+        # Revenue sources aggregated once for all scenarios
+        source_prices = _aggregate_sources(revenue_sources)
         
-        # 6. Optimal (mit Teilzeit)
+        # 3.-6. Base, best case (+20%), worst case (-30%) and optimal (mit Teilzeit)
+        # are independent, so they are computed together in one array pass
+        curve_arr = np.asarray(utilization_curve)
         pt_income = living_meta.get('part_time_income', 0)
         pt_months = living_meta.get('part_time_months', 0)
         
+        scenarios = [
+            ("Base (Adaptive)", curve_arr, business_costs_monthly, 0, 0),
+            ("Best Case (+20%)", np.minimum(0.90, curve_arr * 1.2), business_costs_monthly, 0, 0),
+            ("Worst Case (-30%)", curve_arr * 0.7, business_costs_monthly * 1.05, 0, 0)
+        ]
         if pt_income > 0:
-            optimal_scenario = self._generate_scenario(
-                "Optimal (mit Teilzeit)",
-                utilization_curve,
-                revenue_sources,
-                business_costs_monthly,
-                living_costs_monthly,
-                startup_capital,
-                part_time_income=pt_income,
-                part_time_months=pt_months
+            scenarios.append(
+                ("Optimal (mit Teilzeit)", curve_arr, business_costs_monthly, pt_income, pt_months)
             )
-        else:
-            optimal_scenario = base_scenario
+        
+        return {
+            'scenarios': scenarios,
+            'source_prices': source_prices,
+            'living_costs': living_costs_monthly,
+            'living_meta': living_meta,
+            'utilization_curve': utilization_curve,
+            'pt_income': pt_income,
+            'profile': profile,
+            'experience': experience,
+            'network': network,
+            'first_customers': first_customers,
+            'partner_support': partner_support,
+            'validations': validations,
+            'warnings': warnings,
+            'critical_errors': critical_errors
+        }
+    
+    def _finish_plan(self, plan: Dict, generated: List[Dict]) -> Dict:
+        """Pick the recommendation and assemble the plan response from generated scenarios"""
+        profile = plan['profile']
+        pt_income = plan['pt_income']
+        
+        base_scenario, best_scenario, worst_scenario = generated[:3]
+        optimal_scenario = generated[3] if pt_income > 0 else base_scenario
         
         # 7. Recommendation
         recommended = self._determine_best_scenario(
@@ -855,9 +1725,9 @@ class AdaptiveFinancialCalculator:
         confidence = self._calculate_confidence(recommended, profile)
         
         # 9. Include warnings in recommendation
-        recommendation_text = self._explain_recommendation(recommended, profile)
-        if warnings:
-            recommendation_text += "\n\nâš ï¸ HINWEISE:\n" + "\n".join(warnings)
+        recommendation_text = self._explain_recommendation(
+            recommended, plan['network'], plan['first_customers'], plan['warnings']
+        )
         
         return {
             'recommended_scenario': recommended,
@@ -867,26 +1737,26 @@ class AdaptiveFinancialCalculator:
                 'worst': worst_scenario,
                 'optimal': optimal_scenario if pt_income > 0 else None
             },
-            'utilization_curve': utilization_curve,
-            'living_costs_strategy': living_meta,
+            'utilization_curve': plan['utilization_curve'],
+            'living_costs_strategy': plan['living_meta'],
             'confidence_score': confidence,
             'profile_summary': {
-                'experience': getattr(profile.experience_level, 'value', 'unknown'),
-                'network': getattr(profile.network_strength, 'value', 'unknown'),
-                'first_customers': getattr(profile, 'first_customers_pipeline', 0),
-                'partner_support': getattr(profile, 'partner_income_monthly', None) is not None
+                'experience': plan['experience'],
+                'network': plan['network'],
+                'first_customers': plan['first_customers'],
+                'partner_support': plan['partner_support']
             },
             'recommendation_reasoning': recommendation_text,
-            'validations': validations,  # NEW! Include validation results
-            'warnings': warnings,  # NEW! Separate warnings list
-            'gz_compliant': len(critical_errors) == 0  # NEW! Quick check
+            'validations': plan['validations'],  # NEW! Include validation results
+            'warnings': plan['warnings'],  # NEW! Separate warnings list
+            'gz_compliant': len(plan['critical_errors']) == 0  # NEW! Quick check
         }
     
     def _generate_scenario(
         self,
         name: str,
         utilization_curve: List[float],
-        revenue_sources: List[Dict],
+        source_prices: Tuple[float, float, float],
         business_costs: float,
         living_costs: List[float],
         startup_capital: float,
@@ -894,97 +1764,98 @@ class AdaptiveFinancialCalculator:
         part_time_months: int = 0
     ) -> Dict:
         """Generate single financial scenario"""
+        return self._generate_scenarios(
+            [(name, utilization_curve, business_costs, part_time_income, part_time_months)],
+            source_prices,
+            living_costs,
+            startup_capital
+        )[0]
+    
+    def _generate_scenarios(
+        self,
+        scenarios: List[Tuple],
+        source_prices: Tuple[float, float, float],
+        living_costs: List[float],
+        startup_capital: float
+    ) -> List[Dict]:
+        """
+        Generate several financial scenarios in one pass
         
-        monate = []
-        kontostand = startup_capital
+        Args:
+            scenarios: [(name, utilization_curve, business_costs, part_time_income,
+                         part_time_months), ...]
         
-        for month in range(1, 13):
-            util = utilization_curve[month - 1]
-            
-            # Revenue
-            umsatz = self._calculate_revenue(revenue_sources, util, month)
-            
-            # Business costs
-            kosten_geschaeft = business_costs
-            if month == 1:
-                kosten_geschaeft += 530  # Setup
-            
-            # Business profit
-            gewinn_geschaeft = umsatz - kosten_geschaeft
-            
-            # Living costs
-            privatentnahme = living_costs[month - 1]
+        Returns:
+            One scenario dict per entry, same order
+        """
+        names, curves, business_costs, pt_income, pt_months = zip(*scenarios)
+        
+        numbers = _scenario_numbers(
+            tuple(tuple(np.asarray(curve, dtype=float).tolist()) for curve in curves),
+            business_costs,
+            tuple(living_costs[:12]),
+            startup_capital,
+            pt_income,
+            pt_months,
+            tuple(source_prices)
+        )
+        
+        return self._scenario_dicts(names, *numbers)
+    
+    def _scenario_dicts(
+        self,
+        names: Tuple[str, ...],
+        rounded_tables: List,
+        totals_tables: List,
+        auslastung_rows: List
+    ) -> List[Dict]:
+        """Build the scenario dicts from _scenario_arrays() output"""
+        month = _MONTHS_12
+        
+        results = []
+        for name, table, total_row, auslastung in zip(
+            names, rounded_tables, totals_tables, auslastung_rows
+        ):
+            rounded = dict(zip(_SCENARIO_COLUMNS, table))
+            totals = dict(zip(_SCENARIO_COLUMNS, total_row))
             
-            # Part-time income
-            zusatz_einkommen = 0
-            if part_time_income > 0 and month <= part_time_months:
-                zusatz_einkommen = part_time_income
+            monate = [
+                dict(zip(_MONTH_KEYS, row))
+                for row in zip(month.tolist(), *table, auslastung)
+            ]
             
-            # Net cashflow
-            saldo = gewinn_geschaeft - privatentnahme + zusatz_einkommen
-            kontostand += saldo
+            # Break-even
+            break_even = self._find_break_even(rounded['gewinn_geschaeft'])
             
-            monate.append({
-                'monat': month,
-                'umsatz': round(umsatz, 2),
-                'kosten_geschaeft': round(kosten_geschaeft, 2),
-                'gewinn_geschaeft': round(gewinn_geschaeft, 2),
-                'privatentnahme': round(privatentnahme, 2),
-                'zusatz_einkommen': round(zusatz_einkommen, 2),
-                'saldo': round(saldo, 2),
-                'kontostand': round(kontostand, 2),
-                'auslastung': round(util * 100, 1)
+            results.append({
+                'name': name,
+                'monate': monate,
+                'gesamt_umsatz': round(totals['umsatz'], 2),
+                'gesamt_kosten_geschaeft': round(totals['kosten_geschaeft'], 2),
+                'gesamt_gewinn_geschaeft': round(totals['gewinn_geschaeft'], 2),
+                'gesamt_privatentnahme': round(totals['privatentnahme'], 2),
+                'gesamt_zusatz_einkommen': round(totals['zusatz_einkommen'], 2),
+                'jahresergebnis': round(totals['saldo'], 2),
+                'endkontostand': rounded['kontostand'][-1],
+                'break_even_month': break_even,
+                'break_even_monat': f"Monat {break_even}" if break_even else "Nicht in Jahr 1"
             })
         
-        # Break-even
-        break_even = self._find_break_even(monate)
-        
-        return {
-            'name': name,
-            'monate': monate,
-            'gesamt_umsatz': round(sum(m['umsatz'] for m in monate), 2),
-            'gesamt_kosten_geschaeft': round(sum(m['kosten_geschaeft'] for m in monate), 2),
-            'gesamt_gewinn_geschaeft': round(sum(m['gewinn_geschaeft'] for m in monate), 2),
-            'gesamt_privatentnahme': round(sum(m['privatentnahme'] for m in monate), 2),
-            'gesamt_zusatz_einkommen': round(sum(m['zusatz_einkommen'] for m in monate), 2),
-            'jahresergebnis': round(sum(m['saldo'] for m in monate), 2),
-            'endkontostand': round(monate[-1]['kontostand'], 2),
-            'break_even_monat': break_even
-        }
+        return results
     
     def _calculate_revenue(
         self,
-        revenue_sources: List[Dict],
-        utilization: float,
-        month: int
-    ) -> float:
-        """Calculate monthly revenue"""
-        
-        total = 0
-        for source in revenue_sources:
-            if source['type'] == 'hourly':
-                hours = 80 * utilization
-                total += hours * source['price']
-            
-            elif source['type'] == 'monthly':
-                if month >= 4:
-                    total += source['price'] * min(utilization * 1.5, 1.0)
-            
-            elif source['type'] == 'project':
-                if month >= 7:
-                    projects = utilization * 0.3
-                    total += projects * source['price']
-        
-        return total
-    
-    def _find_break_even(self, monate: List[Dict]) -> str:
-        """Find break-even month"""
-        kumuliert = 0
-        for m in monate:
-            kumuliert += m['gewinn_geschaeft']
-            if kumuliert > 0:
-                return f"Monat {m['monat']}"
-        return "Nicht in Jahr 1"
+        source_prices: Tuple[float, float, float],
+        utilization: np.ndarray,
+        month: np.ndarray
+    ) -> np.ndarray:
+        """Calculate monthly revenue for all months at once"""
+        return _revenue(source_prices, utilization, month)
+    
+    def _find_break_even(self, gewinn_geschaeft: List[float]) -> int:
+        """Find break-even month (first month with positive cumulative business profit, 0 = not in year 1)"""
+        positive = np.cumsum(gewinn_geschaeft) > 0
+        return int(positive.argmax()) + 1 if positive.any() else 0
     
     def _determine_best_scenario(
         self,
@@ -1010,53 +1881,30 @@ class AdaptiveFinancialCalculator:
         score = 0
         
         # End balance
-        if scenario['endkontostand'] > 10000:
-            score += 30
-        elif scenario['endkontostand'] > 5000:
-            score += 25
-        elif scenario['endkontostand'] > 0:
-            score += 15
-        elif scenario['endkontostand'] > -5000:
-            score += 5
+        score += _BALANCE_SCORES[bisect_left(_BALANCE_THRESHOLDS, scenario['endkontostand'])]
         
         # Break-even speed
-        if "Monat" in scenario['break_even_monat']:
-            try:
-                month_num = int(scenario['break_even_monat'].split()[1])
-                if month_num <= 3:
-                    score += 25
-                elif month_num <= 6:
-                    score += 20
-                elif month_num <= 9:
-                    score += 15
-                else:
-                    score += 10
-            except:
-                pass
+        month_num = scenario['break_even_month']
+        if month_num:
+            score += _BREAK_EVEN_SCORES[bisect_left(_BREAK_EVEN_THRESHOLDS, month_num)]
         
         # Profile strength
         profile_confidence = getattr(profile, 'get_confidence_score', lambda: 50)()
         score += int(profile_confidence * 0.25)
         
         # Business profit
-        gewinn = scenario['gesamt_gewinn_geschaeft']
-        if gewinn > 30000:
-            score += 20
-        elif gewinn > 20000:
-            score += 15
-        elif gewinn > 10000:
-            score += 10
-        elif gewinn > 0:
-            score += 5
+        score += _PROFIT_SCORES[bisect_left(_PROFIT_THRESHOLDS, scenario['gesamt_gewinn_geschaeft'])]
         
         return min(100, int(score))
     
     def _explain_recommendation(
         self,
         scenario: Dict,
-        profile: 'GrounderProfile'
+        network: str,
+        first_customers: int,
+        warnings: Optional[List[str]] = None
     ) -> str:
-        """Explain recommendation"""
+        """Explain recommendation (validation warnings appended as HINWEISE)"""
         
         reasons = []
         
@@ -1068,20 +1916,21 @@ class AdaptiveFinancialCalculator:
         if scenario['gesamt_gewinn_geschaeft'] > 0:
             reasons.append(f"âœ… Business profitabel ({scenario['gesamt_gewinn_geschaeft']:,.0f} EUR)")
         
-        if "Monat" in scenario['break_even_monat']:
+        if scenario['break_even_month']:
             reasons.append(f"âœ… Break-Even: {scenario['break_even_monat']}")
         
-        net_strength = getattr(profile.network_strength, 'value', 'unknown') if hasattr(profile, 'network_strength') else 'unknown'
-        if net_strength == 'strong':
+        if network == 'strong':
             reasons.append("âœ… Starkes Netzwerk ermÃ¶glicht schnelleren Ramp-up")
         
-        first_customers = getattr(profile, 'first_customers_pipeline', 0)
         if first_customers > 0:
             reasons.append(f"âœ… {first_customers} Kunden bereits im Pipeline")
         
         if scenario.get('gesamt_zusatz_einkommen', 0) > 0:
             reasons.append(f"âœ… Teilzeit-Job trÃ¤gt {scenario['gesamt_zusatz_einkommen']:,.0f} EUR bei")
         
+        if warnings:
+            reasons += ["", "âš ï¸ HINWEISE:", *warnings]
+        
         return "\n".join(reasons)
 
 
@@ -1091,10 +1940,30 @@ class AdaptiveFinancialCalculator:
 
 __all__ = [
     'AdaptiveFinancialCalculator',
+    'ValidationResult',
+    'PartTimeValidationResult',
+    'validation_result_to_json',
     'validate_hauptberuflich_hours',
     'validate_part_time_job',
     'validate_startup_capital',
-    'LEGAL_CITATIONS_SUBSET'
+    'make_capital_validator',
+    'validate_hauptberuflich_batch',
+    'validate_part_time_batch',
+    'validate_startup_capital_batch',
+    'validate_batch',
+    'severity_codes',
+    'get_ramp',
+    'ramp_curve',
+    'INDUSTRY_RAMP_PROFILES',
+    'EXPERIENCE_BONUS',
+    'NETWORK_BONUS',
+    'LEGAL_CITATIONS_SUBSET',
+    'SEV_OK',
+    'SEV_INFO',
+    'SEV_WARNING',
+    'SEV_HIGH',
+    'SEV_CRITICAL',
+    'SEVERITY_NAMES'
 ]
 
 
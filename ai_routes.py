@@ -8,14 +8,19 @@ Endpoints:
 - POST /api/v1/intake - Speichert Nutzerdaten
 - POST /api/v1/ai/chat - Claude AI Chat
 - GET /api/v1/ai/health - Health Check
+- POST /api/v1/plans/batch - Finanzpläne für mehrere Profile
 """
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, EmailStr
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 import os
+import re
+import random
 import logging
 
+from adaptive_financial_calculator_full import AdaptiveFinancialCalculator
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -70,6 +75,41 @@ class AIChatResponse(BaseModel):
     tokens_used: Optional[int] = None
 
 
+class RevenueSource(BaseModel):
+    """Single revenue source of a financial plan"""
+    type: Literal['hourly', 'monthly', 'project']
+    price: float
+
+
+class PlanRequest(BaseModel):
+    """Founder profile and budget for one financial plan"""
+    # Profile
+    industry: str = 'dienstleistung'
+    experience_level: str = 'junior'
+    previous_self_employment: bool = False
+    network_strength: str = 'medium'
+    first_customers_pipeline: int = 0
+    hours_per_week_available: int = 20
+    partner_income_monthly: Optional[float] = None
+
+    # Part-time (optional)
+    part_time_job_possible: bool = False
+    part_time_hours_per_week: int = 0
+    part_time_income_monthly: float = 0
+    part_time_duration_months: int = 0
+
+    # Temporary living-cost reduction (optional)
+    can_reduce_living_costs: bool = False
+    living_reduction_months: int = 0
+    living_reduction_percent: float = 0
+
+    # Budget
+    revenue_sources: List[RevenueSource]
+    monthly_living_costs: float = 2000
+    business_costs_monthly: float = 500
+    startup_capital: float = 10000
+
+
 # ============================================================================
 # ANTHROPIC CLIENT INITIALIZATION
 # ============================================================================
@@ -203,6 +243,55 @@ async def ai_chat(request: AIChatRequest):
         return generate_fallback_response(request)
 
 
+# ============================================================================
+# FINANCIAL PLAN BATCH ENDPOINT
+# ============================================================================
+
+MAX_PLANS_PER_BATCH = 500
+
+calculator = AdaptiveFinancialCalculator()
+
+
+@router.post("/plans/batch")
+def generate_plans_batch(requests: List[PlanRequest]):
+    """
+    Generate adaptive financial plans for many profiles at once.
+    
+    All scenarios of all plans are computed in one array pass. The
+    endpoint is synchronous so FastAPI runs this CPU-bound work in its
+    threadpool instead of blocking the event loop.
+    
+    Results keep the request order; plans failing the GZ validation
+    come back with their validation error instead of scenarios.
+    """
+    if len(requests) > MAX_PLANS_PER_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Maximal {MAX_PLANS_PER_BATCH} Pläne pro Anfrage"
+        )
+    
+    logger.info("📊 Plan batch received: %d profiles", len(requests))
+    
+    plans = [
+        {
+            'profile': request,
+            'revenue_sources': [source.dict() for source in request.revenue_sources],
+            'base_living_costs': request.monthly_living_costs,
+            'business_costs_monthly': request.business_costs_monthly,
+            'startup_capital': request.startup_capital,
+        }
+        for request in requests
+    ]
+    
+    try:
+        results = calculator.generate_adaptive_financials_batch(plans)
+    except Exception as e:
+        logger.error(f"❌ Plan batch error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to generate financial plans")
+    
+    return {"count": len(results), "plans": results}
+
+
 # ============================================================================
 # HEALTH CHECK ENDPOINT
 # ============================================================================
@@ -226,6 +315,45 @@ async def ai_health_check():
 # FALLBACK RESPONSE GENERATOR
 # ============================================================================
 
+# Placeholders: {customer} = target customer label, {category} = business category label
+FALLBACK_QUESTIONS = (
+    "Was ist das größte Problem, das {customer} aktuell haben und das du mit {category} lösen möchtest?",
+    "Wenn {customer} deine {category} nutzen - was soll danach anders sein als vorher?",
+    "Was unterscheidet deinen Ansatz von dem, was {customer} aktuell als Alternative nutzen?",
+    "Warum bist gerade du die richtige Person, um dieses Problem für {customer} zu lösen?",
+)
+
+# Own generator for the fallback copy rotation, independent of the shared
+# module-level random state
+_fallback_rng = random.Random()
+
+FALLBACK_EXTRACTION_JSON = '''{
+  "problem_description": "Lösung für Zielgruppe im gewählten Bereich",
+  "unique_approach": "Personalisierter, professioneller Ansatz",
+  "confidence": 0.7
+}'''
+
+# Keywords that identify the kind of system prompt, matched in one pass
+FALLBACK_PROMPT_KEYWORDS = re.compile(
+    r"(?P<question>frage|question)|(?P<extraction>extrahiere|extract)",
+    re.IGNORECASE
+)
+
+
+def classify_system_prompt(system_prompt: str) -> Optional[str]:
+    """
+    Classify a system prompt for the fallback: 'question', 'extraction' or None.
+    
+    Question keywords win over extraction keywords anywhere in the prompt.
+    """
+    kind = None
+    for match in FALLBACK_PROMPT_KEYWORDS.finditer(system_prompt):
+        if match.lastgroup == "question":
+            return "question"
+        kind = "extraction"
+    return kind
+
+
 def generate_fallback_response(request: AIChatRequest) -> AIChatResponse:
     """
     Generate intelligent fallback when Claude is unavailable.
@@ -241,26 +369,16 @@ def generate_fallback_response(request: AIChatRequest) -> AIChatResponse:
     user_name = context.get("userName", "")
     
     # Check what kind of prompt this is based on keywords
-    system_prompt_lower = request.system_prompt.lower()
+    prompt_kind = classify_system_prompt(request.system_prompt)
     
-    if "frage" in system_prompt_lower or "question" in system_prompt_lower:
+    if prompt_kind == "question":
         # This is a question generation request
-        import random
-        fallback_questions = [
-            f"Was ist das größte Problem, das {target_customer_label} aktuell haben und das du mit {category_label} lösen möchtest?",
-            f"Wenn {target_customer_label} deine {category_label} nutzen - was soll danach anders sein als vorher?",
-            f"Was unterscheidet deinen Ansatz von dem, was {target_customer_label} aktuell als Alternative nutzen?",
-            f"Warum bist gerade du die richtige Person, um dieses Problem für {target_customer_label} zu lösen?",
-        ]
-        response = random.choice(fallback_questions)
+        template = FALLBACK_QUESTIONS[_fallback_rng.randrange(len(FALLBACK_QUESTIONS))]
+        response = template.format(customer=target_customer_label, category=category_label)
         
-    elif "extrahiere" in system_prompt_lower or "extract" in system_prompt_lower:
+    elif prompt_kind == "extraction":
         # This is a data extraction request - return structured JSON
-        response = '''{
-  "problem_description": "Lösung für Zielgruppe im gewählten Bereich",
-  "unique_approach": "Personalisierter, professioneller Ansatz",
-  "confidence": 0.7
-}'''
+        response = FALLBACK_EXTRACTION_JSON
         
     else:
         # Generic fallback response
@@ -8,13 +8,58 @@ that creates unique, business-context-aware scenarios for each user.
 
 import os
 import json
-from typing import Dict, Any, List, Optional
-from anthropic import Anthropic
-from dataclasses import dataclass
+import asyncio
+import heapq
+import logging
+import math
+from collections import deque
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
+from anthropic import Anthropic, AsyncAnthropic
+from dataclasses import astuple, dataclass
 import hashlib
+import re
+import numpy as np
 
-# Initialize Anthropic client
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from scipy.special import ndtr
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Initialize Anthropic clients (sync and async)
 client = Anthropic()
+async_client = AsyncAnthropic()
+
+# Scenarios asked per dimension (14 items in total)
+ITEMS_PER_DIMENSION = 2
+
+# Only the most recent themes are listed in the prompt, which keeps the
+# dynamic prompt tail short and bounded
+MAX_AVOID_THEMES = 5
+
+# Pre-generated follow-up items are dropped once theta moves further than this
+# from the difficulty they were generated for (0.0)
+POOL_THETA_TOLERANCE = 0.5
+
+# Sessions kept in Redis expire after an hour without activity
+SESSION_TTL_SECONDS = 3600
 
 # Howard's 7 Entrepreneurial Personality Dimensions
 DIMENSIONS = {
@@ -70,15 +115,8 @@ BUSINESS_CONTEXTS = {
         "typical_challenges": ["Standortwahl", "Personalfindung", "Lieferanten", "Stammkunden aufbauen"],
         "typical_decisions": ["Speisekarte", "Öffnungszeiten", "Preisgestaltung", "Events"],
         "stakeholders": ["Gäste", "Lieferanten", "Mitarbeiter", "Nachbarn"],
-        "success_metrics": ["Tagesumsatz", "Auslastung", "Bewertungen", "Stammkundenanteil"]
-    },
-    "saas": {
-        "label_de": "Software-Unternehmen",
-        "industry_de": "Tech/SaaS",
-        "typical_challenges": ["Feature-Entwicklung", "Kundenbindung", "Skalierung", "Konkurrenz"],
-        "typical_decisions": ["Roadmap", "Pricing", "Vertriebskanal", "Support-Level"],
-        "stakeholders": ["Nutzer", "Entwickler", "Investoren", "Partner"],
-        "success_metrics": ["MRR", "Churn Rate", "NPS", "Aktivierungsrate"]
+        "success_metrics": ["Tagesumsatz", "Auslastung", "Bewertungen", "Stammkundenanteil"],
+        "example_numbers": ["35 Sitzplätze", "€2.500 Tagesumsatz", "3 Mitarbeiter", "6 Monate"]
     },
     "consulting": {
         "label_de": "Beratung",
@@ -86,7 +124,8 @@ BUSINESS_CONTEXTS = {
         "typical_challenges": ["Akquise", "Positionierung", "Preisgestaltung", "Skalierung"],
         "typical_decisions": ["Spezialisierung", "Tagessätze", "Kundenauswahl", "Team aufbauen"],
         "stakeholders": ["Kunden", "Auftraggeber", "Partner", "Mitbewerber"],
-        "success_metrics": ["Auslastung", "Tagessatz", "Empfehlungsrate", "Folgeaufträge"]
+        "success_metrics": ["Auslastung", "Tagessatz", "Empfehlungsrate", "Folgeaufträge"],
+        "example_numbers": ["€1.200 Tagessatz", "4 Projekte/Monat", "2 Mitarbeiter", "€8.000 Auftrag"]
     },
     "ecommerce": {
         "label_de": "Online-Shop",
@@ -94,7 +133,17 @@ BUSINESS_CONTEXTS = {
         "typical_challenges": ["Traffic", "Conversion", "Logistik", "Retouren"],
         "typical_decisions": ["Sortiment", "Plattform", "Marketing", "Fulfillment"],
         "stakeholders": ["Käufer", "Lieferanten", "Logistikpartner", "Marktplätze"],
-        "success_metrics": ["Conversion Rate", "AOV", "Retourenquote", "CAC"]
+        "success_metrics": ["Conversion Rate", "AOV", "Retourenquote", "CAC"],
+        "example_numbers": ["€45 Warenkorbwert", "3% Conversion", "500 Besucher/Tag", "15% Retourenquote"]
+    },
+    "saas": {
+        "label_de": "Software-Unternehmen",
+        "industry_de": "Tech/SaaS",
+        "typical_challenges": ["Feature-Entwicklung", "Kundenbindung", "Skalierung", "Konkurrenz"],
+        "typical_decisions": ["Roadmap", "Pricing", "Vertriebskanal", "Support-Level"],
+        "stakeholders": ["Nutzer", "Entwickler", "Investoren", "Partner"],
+        "success_metrics": ["MRR", "Churn Rate", "NPS", "Aktivierungsrate"],
+        "example_numbers": ["€49/Monat", "200 Nutzer", "5% Churn", "€10.000 MRR"]
     },
     "services": {
         "label_de": "Dienstleistung",
@@ -102,7 +151,8 @@ BUSINESS_CONTEXTS = {
         "typical_challenges": ["Kundengewinnung", "Termintreue", "Qualität", "Konkurrenz"],
         "typical_decisions": ["Preise", "Einzugsgebiet", "Spezialisierung", "Tools"],
         "stakeholders": ["Kunden", "Auftraggeber", "Lieferanten", "Mitbewerber"],
-        "success_metrics": ["Aufträge/Monat", "Kundenzufriedenheit", "Weiterempfehlungen"]
+        "success_metrics": ["Aufträge/Monat", "Kundenzufriedenheit", "Weiterempfehlungen"],
+        "example_numbers": ["€80/Stunde", "15 Aufträge/Monat", "4,8 Sterne", "30% Empfehlungen"]
     },
     "creative": {
         "label_de": "Kreativagentur",
@@ -110,7 +160,8 @@ BUSINESS_CONTEXTS = {
         "typical_challenges": ["Akquise", "Kreativität vs. Budget", "Kundenwünsche", "Projektmanagement"],
         "typical_decisions": ["Stil/Nische", "Preise", "Kundenauswahl", "Teamaufbau"],
         "stakeholders": ["Auftraggeber", "Kreativpartner", "Lieferanten"],
-        "success_metrics": ["Projektmarge", "Folgeaufträge", "Portfolio-Qualität"]
+        "success_metrics": ["Projektmarge", "Folgeaufträge", "Portfolio-Qualität"],
+        "example_numbers": ["€3.500 Projekt", "2 Freelancer", "40% Marge", "6 Wochen Projekt"]
     },
     "health": {
         "label_de": "Gesundheitsunternehmen",
@@ -118,74 +169,105 @@ BUSINESS_CONTEXTS = {
         "typical_challenges": ["Zulassungen", "Vertrauen aufbauen", "Abrechnung", "Konkurrenz"],
         "typical_decisions": ["Spezialisierung", "Standort", "Kassenzulassung", "Behandlungsspektrum"],
         "stakeholders": ["Patienten", "Krankenkassen", "Zuweiser", "Kollegen"],
-        "success_metrics": ["Patientenzahl", "Terminauslastung", "Patientenzufriedenheit"]
+        "success_metrics": ["Patientenzahl", "Terminauslastung", "Patientenzufriedenheit"],
+        "example_numbers": ["25 Patienten/Tag", "€85/Behandlung", "3 Monate Warteliste", "4,9 Sterne"]
     }
 }
 
-@dataclass
+# Lists as they appear in the v1 and v2 prompts
+for _biz_info in BUSINESS_CONTEXTS.values():
+    _biz_info['challenges_joined'] = ', '.join(_biz_info['typical_challenges'])
+    _biz_info['decisions_joined'] = ', '.join(_biz_info['typical_decisions'])
+    _biz_info['stakeholders_joined'] = ', '.join(_biz_info['stakeholders'])
+    _biz_info['example_numbers_joined'] = ', '.join(
+        _biz_info.get('example_numbers', ['€1.000', '3 Monate'])
+    )
+del _biz_info
+
+# Read-only from here on - both are shared with v2
+DIMENSIONS = MappingProxyType({dim: MappingProxyType(info) for dim, info in DIMENSIONS.items()})
+BUSINESS_CONTEXTS = MappingProxyType({
+    business_type: MappingProxyType(info) for business_type, info in BUSINESS_CONTEXTS.items()
+})
+
+# Dimensions in assessment order
+DIMENSION_ORDER = tuple(DIMENSIONS)
+TOTAL_ITEMS = len(DIMENSION_ORDER) * ITEMS_PER_DIMENSION
+
+# Markdown fences around Claude's JSON: a ```json block wins over a plain one;
+# an unterminated fence runs to the end of the text
+_JSON_FENCE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+_CODE_FENCE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+# The complete "situation" string in a partially streamed response
+_SITUATION_FIELD = re.compile(r'"situation"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+_json_dumps = orjson.dumps if ORJSON_AVAILABLE else json.dumps
+
+# Scenario ID prefix per dimension, e.g. "AI_INNO_"
+_SCENARIO_ID_PREFIXES = {dim: f"AI_{dim.upper()[:4]}_" for dim in DIMENSIONS}
+
+
+@dataclass(slots=True, frozen=True)
 class GeneratedScenario:
-    """A generated scenario with IRT parameters"""
+    """A generated scenario with IRT parameters (options stored as parallel tuples)"""
     scenario_id: str
     dimension: str
     difficulty: float
     discrimination: float
     situation: str
     question: str
-    options: List[Dict[str, Any]]
+    option_ids: Tuple[str, ...]
+    option_texts: Tuple[str, ...]
+    option_thetas: Tuple[float, ...]
     business_type: str
+    theme: str = ""
+    
+    @property
+    def options(self) -> List[Dict[str, Any]]:
+        """Options in Claude's response format"""
+        return [
+            {'id': option_id, 'text': text, 'theta_value': theta}
+            for option_id, text, theta in zip(self.option_ids, self.option_texts, self.option_thetas)
+        ]
 
 
-def generate_scenario_prompt(
-    dimension: str,
-    target_difficulty: float,
-    business_context: Dict[str, Any],
-    previously_seen_themes: List[str] = None
-) -> str:
-    """Generate the prompt for Claude to create a personalized scenario"""
-    
-    business_type = business_context.get('business_type', 'services')
-    biz_info = BUSINESS_CONTEXTS.get(business_type, BUSINESS_CONTEXTS['services'])
-    dim_info = DIMENSIONS.get(dimension, DIMENSIONS['innovativeness'])
-    
-    # Map difficulty to scenario complexity
-    if target_difficulty < -0.5:
-        difficulty_hint = "ein einfaches Alltagsszenario"
-    elif target_difficulty < 0.5:
-        difficulty_hint = "eine mittelschwere strategische Entscheidung"
-    else:
-        difficulty_hint = "eine komplexe, herausfordernde Situation"
-    
-    # Get target customer info
-    target_customer = business_context.get('target_customer', 'Kunden')
-    stage = business_context.get('stage', 'Planung')
-    description = business_context.get('description', '')
+def _scenario_preamble(dimension: str, business_type: str) -> str:
+    """
+    Static part of the scenario prompt for one (dimension, business type) pair.
     
-    # Avoid repeating themes
-    avoid_themes = ""
-    if previously_seen_themes:
-        avoid_themes = f"\n\nVERMEIDE diese bereits verwendeten Themen: {', '.join(previously_seen_themes)}"
+    Sent as a prompt-cache block, so it must not contain any per-user data.
+    """
+    # Unknown keys fall back before the cache lookup, so the cache holds at
+    # most one entry per known pair
+    if business_type not in BUSINESS_CONTEXTS:
+        business_type = 'services'
+    if dimension not in DIMENSIONS:
+        dimension = 'innovativeness'
+    return _build_scenario_preamble(dimension, business_type)
+
+
+@lru_cache(maxsize=len(DIMENSIONS) * len(BUSINESS_CONTEXTS))
+def _build_scenario_preamble(dimension: str, business_type: str) -> str:
+    biz_info = BUSINESS_CONTEXTS[business_type]
+    dim_info = DIMENSIONS[dimension]
     
     return f"""Du bist ein Experte für psychometrische Persönlichkeitstests und Unternehmensgründung.
 
 AUFGABE: Erstelle ein realistisches Geschäftsszenario für eine {biz_info['label_de']} ({biz_info['industry_de']}), das die Persönlichkeitsdimension "{dim_info['name_de']}" misst.
 
-BUSINESS-KONTEXT:
+BRANCHE:
 - Geschäftstyp: {biz_info['label_de']}
 - Branche: {biz_info['industry_de']}
-- Zielkunden: {target_customer}
-- Phase: {stage}
-- Beschreibung: {description or 'Neugründung'}
-- Typische Herausforderungen: {', '.join(biz_info['typical_challenges'])}
-- Typische Entscheidungen: {', '.join(biz_info['typical_decisions'])}
+- Typische Herausforderungen: {biz_info['challenges_joined']}
+- Typische Entscheidungen: {biz_info['decisions_joined']}
 
 DIMENSION "{dim_info['name_de']}":
 - Beschreibung: {dim_info['description']}
 - Niedrige Ausprägung: {dim_info['low_behavior']}
 - Hohe Ausprägung: {dim_info['high_behavior']}
 
-SCHWIERIGKEIT: {difficulty_hint} (IRT Difficulty: {target_difficulty:.1f})
-{avoid_themes}
-
 ANFORDERUNGEN:
 1. Das Szenario muss sich wie eine echte Geschäftsentscheidung anfühlen, NICHT wie ein Persönlichkeitstest
 2. Die Situation muss spezifisch für {biz_info['label_de']} sein (erwähne konkrete branchentypische Details)
@@ -225,6 +307,153 @@ ANTWORTE NUR MIT DIESEM JSON-FORMAT (keine andere Erklärung):
 }}"""
 
 
+def _scenario_request(
+    target_difficulty: float,
+    business_context: Dict[str, Any],
+    previously_seen_themes: List[str] = None
+) -> str:
+    """Per-user part of the scenario prompt (follows the cached preamble)"""
+    
+    # Map difficulty to scenario complexity
+    if target_difficulty < -0.5:
+        difficulty_hint = "ein einfaches Alltagsszenario"
+    elif target_difficulty < 0.5:
+        difficulty_hint = "eine mittelschwere strategische Entscheidung"
+    else:
+        difficulty_hint = "eine komplexe, herausfordernde Situation"
+    
+    # The prompt only shows the difficulty to one decimal, so users of the
+    # same business context share cached tails
+    return _build_scenario_request(
+        difficulty_hint,
+        f"{target_difficulty:.1f}",
+        business_context.get('target_customer', 'Kunden'),
+        business_context.get('stage', 'Planung'),
+        business_context.get('description', ''),
+        tuple(previously_seen_themes) if previously_seen_themes else ()
+    )
+
+
+@lru_cache(maxsize=512)
+def _build_scenario_request(
+    difficulty_hint: str,
+    difficulty: str,
+    target_customer: str,
+    stage: str,
+    description: str,
+    seen_themes: Tuple[str, ...]
+) -> str:
+    # Avoid repeating themes
+    avoid_themes = ""
+    if seen_themes:
+        avoid_themes = f"\n\nVERMEIDE diese bereits verwendeten Themen: {', '.join(seen_themes)}"
+    
+    return f"""BUSINESS-KONTEXT:
+- Zielkunden: {target_customer}
+- Phase: {stage}
+- Beschreibung: {description or 'Neugründung'}
+
+SCHWIERIGKEIT: {difficulty_hint} (IRT Difficulty: {difficulty}){avoid_themes}"""
+
+
+def generate_scenario_prompt(
+    dimension: str,
+    target_difficulty: float,
+    business_context: Dict[str, Any],
+    previously_seen_themes: List[str] = None
+) -> str:
+    """Generate the prompt for Claude to create a personalized scenario"""
+    
+    business_type = business_context.get('business_type', 'services')
+    return "\n\n".join((
+        _scenario_preamble(dimension, business_type),
+        _scenario_request(target_difficulty, business_context, previously_seen_themes)
+    ))
+
+
+def _scenario_params(
+    dimension: str,
+    target_difficulty: float,
+    business_context: Dict[str, Any],
+    previously_seen_themes: List[str] = None
+) -> Dict[str, Any]:
+    """
+    System prompt and messages for one scenario.
+    
+    The static preamble is the cached system prompt, the user turn only
+    carries the per-user request.
+    """
+    business_type = business_context.get('business_type', 'services')
+    return {
+        "system": [
+            {
+                "type": "text",
+                "text": _scenario_preamble(dimension, business_type),
+                "cache_control": {"type": "ephemeral"}
+            }
+        ],
+        "messages": [
+            {
+                "role": "user",
+                "content": _scenario_request(
+                    target_difficulty, business_context, previously_seen_themes
+                )
+            }
+        ]
+    }
+
+
+def _scenario_from_message(
+    message,
+    dimension: str,
+    target_difficulty: float,
+    business_context: Dict[str, Any],
+    session_id: str = None
+) -> GeneratedScenario:
+    """Parse a Claude response into a GeneratedScenario"""
+    
+    usage = getattr(message, 'usage', None)
+    if usage is not None:
+        logger.debug(
+            "Scenario prompt cache: %s tokens read, %s written",
+            getattr(usage, 'cache_read_input_tokens', 0),
+            getattr(usage, 'cache_creation_input_tokens', 0)
+        )
+    
+    # Parse response
+    response_text = message.content[0].text
+    
+    # Extract JSON from response (handle potential markdown formatting)
+    fence = _JSON_FENCE.search(response_text) or _CODE_FENCE.search(response_text)
+    if fence:
+        response_text = fence.group(1)
+    
+    scenario_data = _json_loads(response_text.strip())
+    options = scenario_data['options']
+    
+    # Generate unique scenario ID
+    context_hash = hashlib.blake2b(
+        f"{dimension}_{business_context.get('business_type')}_{target_difficulty}_{session_id}".encode(),
+        digest_size=4
+    ).hexdigest()
+    prefix = _SCENARIO_ID_PREFIXES.get(dimension) or f"AI_{dimension.upper()[:4]}_"
+    scenario_id = prefix + context_hash
+    
+    return GeneratedScenario(
+        scenario_id=scenario_id,
+        dimension=dimension,
+        difficulty=target_difficulty,
+        discrimination=1.6,  # Standard discrimination for AI-generated items
+        situation=scenario_data['situation'],
+        question=scenario_data['question'],
+        option_ids=tuple(opt['id'] for opt in options),
+        option_texts=tuple(opt['text'] for opt in options),
+        option_thetas=tuple(opt.get('theta_value', 0.0) for opt in options),
+        business_type=business_context.get('business_type', 'services'),
+        theme=scenario_data.get('theme', '')
+    )
+
+
 def generate_scenario(
     dimension: str,
     target_difficulty: float,
@@ -246,51 +475,123 @@ def generate_scenario(
         GeneratedScenario with all data needed for IRT calculation
     """
     
-    prompt = generate_scenario_prompt(
-        dimension=dimension,
-        target_difficulty=target_difficulty,
-        business_context=business_context,
-        previously_seen_themes=previously_seen_themes
-    )
-    
-    # Call Claude API
     message = client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=1024,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
+        **_scenario_params(
+            dimension, target_difficulty, business_context, previously_seen_themes
+        )
     )
     
-    # Parse response
-    response_text = message.content[0].text
+    return _scenario_from_message(
+        message, dimension, target_difficulty, business_context, session_id
+    )
+
+
+async def generate_scenario_async(
+    dimension: str,
+    target_difficulty: float,
+    business_context: Dict[str, Any],
+    previously_seen_themes: List[str] = None,
+    session_id: str = None
+) -> GeneratedScenario:
+    """Async variant of generate_scenario() using the AsyncAnthropic client"""
     
-    # Extract JSON from response (handle potential markdown formatting)
-    if "```json" in response_text:
-        response_text = response_text.split("```json")[1].split("```")[0]
-    elif "```" in response_text:
-        response_text = response_text.split("```")[1].split("```")[0]
+    message = await async_client.messages.create(
+        model="claude-sonnet-4-20250514",
+        max_tokens=1024,
+        **_scenario_params(
+            dimension, target_difficulty, business_context, previously_seen_themes
+        )
+    )
     
-    scenario_data = json.loads(response_text.strip())
+    return _scenario_from_message(
+        message, dimension, target_difficulty, business_context, session_id
+    )
+
+
+async def stream_scenario_async(
+    dimension: str,
+    target_difficulty: float,
+    business_context: Dict[str, Any],
+    previously_seen_themes: List[str] = None,
+    session_id: str = None
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Streaming variant of generate_scenario_async().
     
-    # Generate unique scenario ID
-    context_hash = hashlib.md5(
-        f"{dimension}_{business_context.get('business_type')}_{target_difficulty}_{session_id}".encode()
-    ).hexdigest()[:8]
-    scenario_id = f"AI_{dimension.upper()[:4]}_{context_hash}"
+    Yields ('situation', text) as soon as the situation has been streamed,
+    so it can be shown while the options are still being generated, and
+    finally ('scenario', GeneratedScenario).
+    """
     
-    return GeneratedScenario(
-        scenario_id=scenario_id,
-        dimension=dimension,
-        difficulty=target_difficulty,
-        discrimination=1.6,  # Standard discrimination for AI-generated items
-        situation=scenario_data['situation'],
-        question=scenario_data['question'],
-        options=scenario_data['options'],
-        business_type=business_context.get('business_type', 'services')
+    async with async_client.messages.stream(
+        model="claude-sonnet-4-20250514",
+        max_tokens=1024,
+        **_scenario_params(
+            dimension, target_difficulty, business_context, previously_seen_themes
+        )
+    ) as stream:
+        buffer = ''
+        situation_sent = False
+        async for text in stream.text_stream:
+            if situation_sent:
+                continue
+            buffer += text
+            field = _SITUATION_FIELD.search(buffer)
+            if field:
+                situation_sent = True
+                yield 'situation', _json_loads(f'"{field.group(1)}"')
+        
+        message = await stream.get_final_message()
+    
+    yield 'scenario', _scenario_from_message(
+        message, dimension, target_difficulty, business_context, session_id
     )
 
 
+async def pre_generate_scenario_pool(
+    business_context: Dict[str, Any],
+    session_id: str
+) -> Dict[str, List[GeneratedScenario]]:
+    """
+    Generate 2 scenarios per dimension concurrently at session start.
+    
+    Items are generated in waves, all dimensions at once per wave. Each
+    later item avoids the themes of the items already pooled for its
+    dimension, so the two items of a dimension do not come from the
+    same prompt.
+    
+    Failed generations are logged and left out - those items are
+    generated on demand by get_next_scenario().
+    """
+    pool: Dict[str, List[GeneratedScenario]] = {}
+    for item in range(1, ITEMS_PER_DIMENSION + 1):
+        results = await asyncio.gather(
+            *(
+                generate_scenario_async(
+                    dimension=dimension,
+                    target_difficulty=0.0,
+                    business_context=business_context,
+                    previously_seen_themes=[
+                        scenario.theme for scenario in pool.get(dimension, ()) if scenario.theme
+                    ],
+                    session_id=f"{session_id}_{dimension}_{item}"
+                )
+                for dimension in DIMENSION_ORDER
+            ),
+            return_exceptions=True
+        )
+        
+        for dimension, result in zip(DIMENSION_ORDER, results):
+            if isinstance(result, Exception):
+                logger.error("Pre-generating %s scenario %d failed: %s", dimension, item, result)
+                continue
+            pool.setdefault(dimension, []).append(result)
+    
+    return pool
+
+
 def format_for_frontend(scenario: GeneratedScenario, include_metadata: bool = False) -> Dict[str, Any]:
     """Format scenario for frontend display (hides IRT parameters)"""
     
@@ -299,8 +600,8 @@ def format_for_frontend(scenario: GeneratedScenario, include_metadata: bool = Fa
         'situation': scenario.situation,
         'question': scenario.question,
         'options': [
-            {'id': opt['id'], 'text': opt['text']}
-            for opt in scenario.options
+            {'id': option_id, 'text': text}
+            for option_id, text in zip(scenario.option_ids, scenario.option_texts)
         ]
     }
     
@@ -312,10 +613,140 @@ def format_for_frontend(scenario: GeneratedScenario, include_metadata: bool = Fa
 
 def get_theta_for_option(scenario: GeneratedScenario, option_id: str) -> float:
     """Get the theta value for a selected option"""
-    for opt in scenario.options:
-        if opt['id'] == option_id:
-            return opt['theta_value']
-    return 0.0  # Default if not found
+    try:
+        return scenario.option_thetas[scenario.option_ids.index(option_id)]
+    except ValueError:
+        return 0.0  # Default if not found
+
+
+_INV_SQRT2 = 1 / math.sqrt(2)
+
+
+def theta_to_percentile(theta: float) -> int:
+    """Convert theta to a percentile (1-99), assuming a standard normal distribution"""
+    # erfc(-x) == 1 + erf(x), without the cancellation for very negative theta
+    percentile = int(50 * math.erfc(-theta * _INV_SQRT2))
+    if percentile < 1:
+        return 1
+    if percentile > 99:
+        return 99
+    return percentile
+
+
+def theta_to_percentiles(thetas: np.ndarray) -> np.ndarray:
+    """Vectorized theta_to_percentile() for an array of theta estimates"""
+    if SCIPY_AVAILABLE:
+        percentiles = ndtr(thetas) * 100
+    else:
+        percentiles = np.array([50 * math.erfc(-z * _INV_SQRT2) for z in thetas.tolist()])
+    return np.clip(percentiles.astype(int), 1, 99)
+
+
+def update_theta_estimate(
+    prior_theta: float,
+    prior_se: float,
+    items_answered: int,
+    theta: float
+) -> Tuple[float, float]:
+    """Simplified Bayesian update of one dimension, returns (theta, se)"""
+    # Weight new information by reliability
+    weight = 0.6 / (1 + items_answered)
+    new_theta = prior_theta * (1 - weight) + theta * weight
+    new_se = prior_se * 0.85  # SE decreases with each item
+    return new_theta, new_se
+
+
+# ============================================================================
+# SESSION STORE
+# ============================================================================
+
+def _dump_session(session: Dict[str, Any]):
+    """Serialize a session, storing scenarios as plain field tuples"""
+    data = dict(session)
+    data['seen_themes'] = list(session['seen_themes'])
+    data['scenario_pool'] = {
+        dim: [astuple(scenario) for scenario in items]
+        for dim, items in session['scenario_pool'].items()
+    }
+    current = session.get('current_scenario')
+    data['current_scenario'] = astuple(current) if current else None
+    return _json_dumps(data)
+
+
+def _scenario_from_fields(fields: List[Any]) -> GeneratedScenario:
+    """Rebuild a scenario from its serialized fields (JSON turns tuples into lists)"""
+    return GeneratedScenario(*(tuple(v) if isinstance(v, list) else v for v in fields))
+
+
+def _load_session(data) -> Dict[str, Any]:
+    """Inverse of _dump_session()"""
+    session = _json_loads(data)
+    session['seen_themes'] = deque(session['seen_themes'], maxlen=MAX_AVOID_THEMES)
+    session['scenario_pool'] = {
+        dim: [_scenario_from_fields(fields) for fields in items]
+        for dim, items in session['scenario_pool'].items()
+    }
+    if session['current_scenario']:
+        session['current_scenario'] = _scenario_from_fields(session['current_scenario'])
+    return session
+
+
+class RedisSessionStore:
+    """
+    Session mapping backed by Redis, so sessions are shared between workers
+    and do not pile up in process memory.
+    
+    Supports the dict operations AIScenarioCAT uses. Sessions are returned as
+    copies - changes only persist once the session is assigned back.
+    
+    Subclasses for other session layouts override key_prefix and the
+    _dump/_load serializers.
+    """
+    
+    key_prefix = "gv:ai_cat"
+    _dump = staticmethod(_dump_session)
+    _load = staticmethod(_load_session)
+    
+    def __init__(self, client, ttl: int = SESSION_TTL_SECONDS):
+        self.client = client
+        self.ttl = ttl
+    
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}:{session_id}"
+    
+    def get(self, session_id: str, default=None) -> Optional[Dict[str, Any]]:
+        data = self.client.get(self._key(session_id))
+        return self._load(data) if data else default
+    
+    def __getitem__(self, session_id: str) -> Dict[str, Any]:
+        session = self.get(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        return session
+    
+    def __setitem__(self, session_id: str, session: Dict[str, Any]):
+        self.client.setex(self._key(session_id), self.ttl, self._dump(session))
+    
+    def __contains__(self, session_id: str) -> bool:
+        return bool(self.client.exists(self._key(session_id)))
+
+
+def create_session_store(store_class=RedisSessionStore):
+    """Redis session store if REDIS_URL is set and reachable, else a process-local dict"""
+    
+    redis_url = os.getenv("REDIS_URL")
+    if not (REDIS_AVAILABLE and redis_url):
+        return {}
+    
+    try:
+        redis_client = redis.from_url(redis_url)
+        redis_client.ping()
+    except Exception as e:
+        logger.error("Redis connection failed, keeping sessions in memory: %s", e)
+        return {}
+    
+    logger.info("AI CAT sessions stored in Redis: %s", redis_url)
+    return store_class(redis_client)
 
 
 class AIScenarioCAT:
@@ -324,10 +755,14 @@ class AIScenarioCAT:
     
     This is the main class that manages the assessment flow with
     dynamically generated, fully personalized scenarios.
+    
+    Sessions live in a plain dict by default; pass a RedisSessionStore to
+    share them between workers. Every method writes a changed session back
+    with `self.sessions[session_id] = session`.
     """
     
-    def __init__(self):
-        self.sessions: Dict[str, Dict] = {}
+    def __init__(self, sessions=None):
+        self.sessions = sessions if sessions is not None else {}
     
     def create_session(
         self,
@@ -342,13 +777,32 @@ class AIScenarioCAT:
             'theta_estimates': {dim: 0.0 for dim in DIMENSIONS},
             'se_estimates': {dim: 1.0 for dim in DIMENSIONS},
             'items_per_dimension': {dim: 0 for dim in DIMENSIONS},
-            'seen_themes': [],
+            'total_items': 0,
+            'dims_touched': 0,
+            'seen_themes': deque(maxlen=MAX_AVOID_THEMES),
+            'scenario_pool': {},
             'current_dimension_index': 0,
             'complete': False
         }
         
         return {'session_id': session_id, 'status': 'created'}
     
+    async def create_session_async(
+        self,
+        session_id: str,
+        business_context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create a session and pre-generate its scenarios concurrently"""
+        
+        result = self.create_session(session_id, business_context)
+        pool = await pre_generate_scenario_pool(business_context, session_id)
+        session = self.sessions[session_id]
+        session['scenario_pool'] = pool
+        self.sessions[session_id] = session
+        
+        result['scenarios_ready'] = sum(len(items) for items in pool.values())
+        return result
+    
     def get_next_scenario(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get the next adaptively selected scenario"""
         
@@ -356,38 +810,46 @@ class AIScenarioCAT:
         if not session or session['complete']:
             return None
         
-        # Select dimension that needs more items
-        dimensions_order = list(DIMENSIONS.keys())
-        current_dim = None
+        # Select dimension that needs more items - dimensions are filled in
+        # order, so the search resumes where the previous one stopped
+        items = session['items_per_dimension']
+        index = session['current_dimension_index']
+        while index < len(DIMENSION_ORDER) and items[DIMENSION_ORDER[index]] >= ITEMS_PER_DIMENSION:
+            index += 1
+        session['current_dimension_index'] = index
         
-        for dim in dimensions_order:
-            if session['items_per_dimension'][dim] < 2:  # Target 2 items per dimension
-                current_dim = dim
-                break
-        
-        if current_dim is None:
+        if index == len(DIMENSION_ORDER):
             # All dimensions have enough items
             session['complete'] = True
+            self.sessions[session_id] = session
             return None
         
-        # Get current theta estimate for adaptive difficulty
-        current_theta = session['theta_estimates'][current_dim]
+        current_dim = DIMENSION_ORDER[index]
         
-        # Generate scenario
-        scenario = generate_scenario(
-            dimension=current_dim,
-            target_difficulty=current_theta,  # Adaptive: target current ability
-            business_context=session['business_context'],
-            previously_seen_themes=session['seen_themes'],
-            session_id=session_id
-        )
+        pooled = session['scenario_pool'].get(current_dim)
+        if pooled:
+            # Pre-generated at session start
+            scenario = pooled.pop(0)
+        else:
+            # Get current theta estimate for adaptive difficulty
+            current_theta = session['theta_estimates'][current_dim]
+            
+            # Generate scenario
+            scenario = generate_scenario(
+                dimension=current_dim,
+                target_difficulty=current_theta,  # Adaptive: target current ability
+                business_context=session['business_context'],
+                previously_seen_themes=session['seen_themes'],
+                session_id=session_id
+            )
         
         # Store for later response processing
         session['current_scenario'] = scenario
+        self.sessions[session_id] = session
         
         # Calculate progress
-        total_items = sum(session['items_per_dimension'].values())
-        total_needed = len(DIMENSIONS) * 2  # 14 items total
+        total_items = session['total_items']
+        total_needed = TOTAL_ITEMS
         
         return {
             'scenario': format_for_frontend(scenario, include_metadata=True),
@@ -395,7 +857,7 @@ class AIScenarioCAT:
                 'current_item': total_items + 1,
                 'estimated_total': total_needed,
                 'percentage': int((total_items / total_needed) * 100),
-                'dimensions_assessed': sum(1 for v in session['items_per_dimension'].values() if v > 0)
+                'dimensions_assessed': session['dims_touched']
             }
         }
     
@@ -417,22 +879,29 @@ class AIScenarioCAT:
         # Get theta value for selected option
         theta = get_theta_for_option(scenario, option_id)
         
-        # Update estimates (simplified Bayesian update)
+        # Update estimates
         dim = scenario.dimension
-        prior_theta = session['theta_estimates'][dim]
-        prior_se = session['se_estimates'][dim]
-        
-        # Weight new information by reliability
-        weight = 0.6 / (1 + session['items_per_dimension'][dim])
-        new_theta = prior_theta * (1 - weight) + theta * weight
-        new_se = prior_se * 0.85  # SE decreases with each item
+        new_theta, new_se = update_theta_estimate(
+            session['theta_estimates'][dim],
+            session['se_estimates'][dim],
+            session['items_per_dimension'][dim],
+            theta
+        )
         
         session['theta_estimates'][dim] = new_theta
         session['se_estimates'][dim] = new_se
+        if session['items_per_dimension'][dim] == 0:
+            session['dims_touched'] += 1
         session['items_per_dimension'][dim] += 1
+        session['total_items'] += 1
+        
+        # Pooled items were generated for theta 0 - once the estimate has moved
+        # away, the next item of this dimension is generated for the new theta
+        if abs(new_theta) > POOL_THETA_TOLERANCE:
+            session['scenario_pool'].pop(dim, None)
         
         # Track theme to avoid repetition
-        if hasattr(scenario, 'theme'):
+        if scenario.theme:
             session['seen_themes'].append(scenario.theme)
         
         # Store response
@@ -447,14 +916,16 @@ class AIScenarioCAT:
         session['current_scenario'] = None
         
         # Check if complete
-        total_items = sum(session['items_per_dimension'].values())
-        if total_items >= len(DIMENSIONS) * 2:
+        if session['total_items'] >= TOTAL_ITEMS:
             session['complete'] = True
+            self.sessions[session_id] = session
             return {
                 'complete': True,
                 'results': self.get_results(session_id)
             }
         
+        self.sessions[session_id] = session
+        
         # Get next scenario
         next_data = self.get_next_scenario(session_id)
         return {
@@ -469,24 +940,23 @@ class AIScenarioCAT:
         if not session:
             raise ValueError("Session not found")
         
-        # Convert theta to percentiles
-        def theta_to_percentile(theta: float) -> int:
-            # Approximate normal distribution mapping
-            import math
-            z = theta / 1.0  # Assuming SD = 1
-            percentile = 50 * (1 + math.erf(z / math.sqrt(2)))
-            return max(1, min(99, int(percentile)))
-        
-        dimensions = {}
-        for dim, theta in session['theta_estimates'].items():
-            percentile = theta_to_percentile(theta)
-            level = 'high' if percentile >= 70 else ('medium' if percentile >= 40 else 'low')
-            dimensions[dim] = {
+        # Convert all theta estimates to percentiles at once
+        dims = tuple(session['theta_estimates'])
+        thetas = np.fromiter(session['theta_estimates'].values(), dtype=float, count=len(dims))
+        percentiles = theta_to_percentiles(thetas)
+        levels = np.where(percentiles >= 70, 'high', np.where(percentiles >= 40, 'medium', 'low'))
+        
+        dimensions = {
+            dim: {
                 'theta': round(theta, 2),
                 'percentile': percentile,
                 'level': level,
                 'level_de': DIMENSIONS[dim]['name_de']
             }
+            for dim, theta, percentile, level in zip(
+                dims, thetas.tolist(), percentiles.tolist(), levels.tolist()
+            )
+        }
         
         # Calculate average
         avg_theta = sum(session['theta_estimates'].values()) / len(DIMENSIONS)
@@ -512,19 +982,18 @@ class AIScenarioCAT:
         
         key_avg = sum(dimensions[d]['percentile'] for d in key_dims) / len(key_dims)
         
-        # Strengths are high dimensions
+        # Strengths are the highest dimensions, development areas the lowest
+        entries = dimensions.values()
         strengths = [
-            dimensions[d]['level_de'] 
-            for d, data in dimensions.items() 
+            data['level_de']
+            for data in heapq.nlargest(3, entries, key=itemgetter('percentile'))
             if data['percentile'] >= 65
-        ][:3]
-        
-        # Development areas are lower dimensions
+        ]
         development = [
-            dimensions[d]['level_de']
-            for d, data in dimensions.items()
+            data['level_de']
+            for data in heapq.nsmallest(2, entries, key=itemgetter('percentile'))
             if data['percentile'] < 50
-        ][:2]
+        ]
         
         return {
             'approval_probability': int(min(95, max(35, key_avg + 10))),
@@ -540,7 +1009,7 @@ def get_ai_cat_engine() -> AIScenarioCAT:
     """Get or create the AI CAT engine singleton"""
     global _ai_cat_engine
     if _ai_cat_engine is None:
-        _ai_cat_engine = AIScenarioCAT()
+        _ai_cat_engine = AIScenarioCAT(create_session_store())
     return _ai_cat_engine
 
 
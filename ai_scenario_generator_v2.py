@@ -16,140 +16,55 @@ Performance Improvements:
 import os
 import json
 import asyncio
-import hashlib
-import math
+import heapq
+import re
+import secrets
+import threading
 import time
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
-from anthropic import Anthropic, AsyncAnthropic
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from dataclasses import astuple, dataclass, field, replace
 import logging
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Howard's dimensions and the business contexts are shared with v1
+from ai_scenario_generator import DIMENSIONS, BUSINESS_CONTEXTS
+
+# As are the theta update and the theta -> percentile conversion (scalar
+# and vectorized)
+from ai_scenario_generator import (
+    update_theta_estimate, theta_to_percentile, theta_to_percentiles
+)
+
+# So are the Anthropic clients (sync and async): one connection pool each
+# per process, reused by every call
+from ai_scenario_generator import client as sync_client, async_client
+
+# And the Redis session store, specialised below for v2 sessions
+import ai_scenario_generator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize Anthropic clients (sync and async)
-sync_client = Anthropic()
-async_client = AsyncAnthropic()
+# Concurrent Claude calls during batch pre-generation
+MAX_CONCURRENT_GENERATIONS = 6
 
-# ============================================================================
-# HOWARD'S 7 ENTREPRENEURIAL PERSONALITY DIMENSIONS
-# ============================================================================
+# Generated scenarios kept for reuse by requests with the same prompt
+SCENARIO_CACHE_SIZE = 256
 
-DIMENSIONS = {
-    "innovativeness": {
-        "name_de": "Innovationsfreude",
-        "description": "Tendency to generate and embrace novel ideas and solutions",
-        "low_behavior": "Prefers proven, established methods",
-        "high_behavior": "Seeks new approaches, disrupts conventions"
-    },
-    "risk_taking": {
-        "name_de": "Risikobereitschaft", 
-        "description": "Comfort with uncertainty and willingness to take chances",
-        "low_behavior": "Careful, prefers security and predictability",
-        "high_behavior": "Bold, embraces uncertainty for potential gains"
-    },
-    "achievement_orientation": {
-        "name_de": "Leistungsorientierung",
-        "description": "Drive for excellence and high standards",
-        "low_behavior": "Satisfied with good enough, work-life balance focused",
-        "high_behavior": "Pushes for excellence, goal-driven"
-    },
-    "autonomy_orientation": {
-        "name_de": "Autonomieorientierung",
-        "description": "Preference for independence and self-direction",
-        "low_behavior": "Values guidance, team input, consensus",
-        "high_behavior": "Prefers independence, own decisions"
-    },
-    "proactiveness": {
-        "name_de": "Proaktivität",
-        "description": "Initiative and forward-thinking action",
-        "low_behavior": "Reactive, responds to situations",
-        "high_behavior": "Anticipates, initiates, shapes environment"
-    },
-    "locus_of_control": {
-        "name_de": "Kontrollüberzeugung",
-        "description": "Belief in personal control over outcomes",
-        "low_behavior": "Attributes outcomes to external factors",
-        "high_behavior": "Takes full ownership of results"
-    },
-    "self_efficacy": {
-        "name_de": "Selbstwirksamkeit",
-        "description": "Confidence in ability to succeed",
-        "low_behavior": "Doubts ability, seeks validation",
-        "high_behavior": "Strong belief in own capabilities"
-    }
-}
-
-# ============================================================================
-# BUSINESS TYPE CONTEXTS
-# ============================================================================
-
-BUSINESS_CONTEXTS = {
-    "restaurant": {
-        "label_de": "Restaurant",
-        "industry_de": "Gastronomie",
-        "typical_challenges": ["Standortwahl", "Personalfindung", "Lieferanten", "Stammkunden aufbauen"],
-        "typical_decisions": ["Speisekarte", "Öffnungszeiten", "Preisgestaltung", "Events"],
-        "stakeholders": ["Gäste", "Lieferanten", "Mitarbeiter", "Nachbarn"],
-        "success_metrics": ["Tagesumsatz", "Auslastung", "Bewertungen", "Stammkundenanteil"],
-        "example_numbers": ["35 Sitzplätze", "€2.500 Tagesumsatz", "3 Mitarbeiter", "6 Monate"]
-    },
-    "consulting": {
-        "label_de": "Beratung",
-        "industry_de": "Beratungsbranche", 
-        "typical_challenges": ["Akquise", "Positionierung", "Preisgestaltung", "Skalierung"],
-        "typical_decisions": ["Spezialisierung", "Tagessätze", "Kundenauswahl", "Team aufbauen"],
-        "stakeholders": ["Kunden", "Auftraggeber", "Partner", "Mitbewerber"],
-        "success_metrics": ["Auslastung", "Tagessatz", "Empfehlungsrate", "Folgeaufträge"],
-        "example_numbers": ["€1.200 Tagessatz", "4 Projekte/Monat", "2 Mitarbeiter", "€8.000 Auftrag"]
-    },
-    "ecommerce": {
-        "label_de": "Online-Shop",
-        "industry_de": "E-Commerce",
-        "typical_challenges": ["Traffic", "Conversion", "Logistik", "Retouren"],
-        "typical_decisions": ["Sortiment", "Plattform", "Marketing", "Fulfillment"],
-        "stakeholders": ["Käufer", "Lieferanten", "Logistikpartner", "Marktplätze"],
-        "success_metrics": ["Conversion Rate", "AOV", "Retourenquote", "CAC"],
-        "example_numbers": ["€45 Warenkorbwert", "3% Conversion", "500 Besucher/Tag", "15% Retourenquote"]
-    },
-    "saas": {
-        "label_de": "Software-Unternehmen",
-        "industry_de": "Tech/SaaS",
-        "typical_challenges": ["Feature-Entwicklung", "Kundenbindung", "Skalierung", "Konkurrenz"],
-        "typical_decisions": ["Roadmap", "Pricing", "Vertriebskanal", "Support-Level"],
-        "stakeholders": ["Nutzer", "Entwickler", "Investoren", "Partner"],
-        "success_metrics": ["MRR", "Churn Rate", "NPS", "Aktivierungsrate"],
-        "example_numbers": ["€49/Monat", "200 Nutzer", "5% Churn", "€10.000 MRR"]
-    },
-    "services": {
-        "label_de": "Dienstleistung",
-        "industry_de": "Dienstleistungssektor",
-        "typical_challenges": ["Kundengewinnung", "Termintreue", "Qualität", "Konkurrenz"],
-        "typical_decisions": ["Preise", "Einzugsgebiet", "Spezialisierung", "Tools"],
-        "stakeholders": ["Kunden", "Auftraggeber", "Lieferanten", "Mitbewerber"],
-        "success_metrics": ["Aufträge/Monat", "Kundenzufriedenheit", "Weiterempfehlungen"],
-        "example_numbers": ["€80/Stunde", "15 Aufträge/Monat", "4,8 Sterne", "30% Empfehlungen"]
-    },
-    "creative": {
-        "label_de": "Kreativagentur",
-        "industry_de": "Kreativwirtschaft",
-        "typical_challenges": ["Akquise", "Kreativität vs. Budget", "Kundenwünsche", "Projektmanagement"],
-        "typical_decisions": ["Stil/Nische", "Preise", "Kundenauswahl", "Teamaufbau"],
-        "stakeholders": ["Auftraggeber", "Kreativpartner", "Lieferanten"],
-        "success_metrics": ["Projektmarge", "Folgeaufträge", "Portfolio-Qualität"],
-        "example_numbers": ["€3.500 Projekt", "2 Freelancer", "40% Marge", "6 Wochen Projekt"]
-    },
-    "health": {
-        "label_de": "Gesundheitsunternehmen",
-        "industry_de": "Gesundheitssektor",
-        "typical_challenges": ["Zulassungen", "Vertrauen aufbauen", "Abrechnung", "Konkurrenz"],
-        "typical_decisions": ["Spezialisierung", "Standort", "Kassenzulassung", "Behandlungsspektrum"],
-        "stakeholders": ["Patienten", "Krankenkassen", "Zuweiser", "Kollegen"],
-        "success_metrics": ["Patientenzahl", "Terminauslastung", "Patientenzufriedenheit"],
-        "example_numbers": ["25 Patienten/Tag", "€85/Behandlung", "3 Monate Warteliste", "4,9 Sterne"]
-    }
-}
+# How long a request waits for an unfinished background batch before the
+# session continues with on-demand generation
+BATCH_WAIT_TIMEOUT_SECONDS = 30.0
 
 # ============================================================================
 # OPTIMIZED SYSTEM PROMPT (CACHED - ~2500 Tokens)
@@ -343,6 +258,16 @@ Bevor du antwortest, prüfe JEDES Kriterium:
 Wenn IRGENDEIN Check fehlschlägt → Korrigiere vor dem Antworten!
 """
 
+# System prompt block sent with every request - built once, the cache_control
+# marker enables prompt caching
+_SYSTEM_BLOCK = (
+    {
+        "type": "text",
+        "text": CACHED_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"}
+    },
+)
+
 # ============================================================================
 # GAP ANALYSIS MAPPING
 # ============================================================================
@@ -434,6 +359,21 @@ GAP_DIMENSION_MAPPING = {
     }
 }
 
+# Read-only gap definitions
+GAP_DIMENSION_MAPPING = MappingProxyType({
+    dim: MappingProxyType({**mapping, "gap": MappingProxyType(mapping["gap"])})
+    for dim, mapping in GAP_DIMENSION_MAPPING.items()
+})
+
+# Total weight if every gap applied (readiness baseline)
+_MAX_GAP_WEIGHT = sum(m["gap"].get("weight", 10) for m in GAP_DIMENSION_MAPPING.values())
+
+# Mapping entries by descending gap weight, equal weights in assessment order
+_GAP_MAPPING_SORTED = tuple(sorted(
+    GAP_DIMENSION_MAPPING.items(),
+    key=lambda item: (-item[1]["gap"].get("weight", 0), list(DIMENSIONS).index(item[0]))
+))
+
 # Personality Archetypes
 ARCHETYPES = {
     "pioneer": {
@@ -486,11 +426,38 @@ ARCHETYPES = {
     }
 }
 
+ARCHETYPES = MappingProxyType({
+    archetype_id: MappingProxyType(archetype) for archetype_id, archetype in ARCHETYPES.items()
+})
+
+# Archetypes as returned in results - built once, shared by every session
+# (the results are only serialized, never modified)
+_ARCHETYPES_WITH_ID = MappingProxyType({
+    archetype_id: {**archetype, "id": archetype_id}
+    for archetype_id, archetype in ARCHETYPES.items()
+})
+
+# ============================================================================
+# RESPONSE PARSING
+# ============================================================================
+
+# Markdown fences around Claude's JSON: a ```json block wins over a plain one;
+# an unterminated fence runs to the end of the text
+_JSON_FENCE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+_CODE_FENCE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+# Outermost braces, for responses with text around the JSON
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+# orjson's decode error subclasses json.JSONDecodeError
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+_json_dumps = orjson.dumps if ORJSON_AVAILABLE else json.dumps
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeneratedScenario:
     """A generated scenario with IRT parameters"""
     scenario_id: str
@@ -501,14 +468,24 @@ class GeneratedScenario:
     question: str
     theme: str
     options: List[Dict[str, Any]]
+    option_thetas: Dict[str, float]  # theta_value by option id
     business_type: str
     cached: bool = False
+    cache_read_tokens: int = 0
     generation_time: float = 0.0
 
 # ============================================================================
 # USER PROMPT GENERATION
 # ============================================================================
 
+# Scenario complexity below -0.5, from -0.5 and from 0.5 difficulty
+_DIFFICULTY_HINTS = (
+    "ein einfaches Alltagsszenario",
+    "eine mittelschwere strategische Entscheidung",
+    "eine komplexe, herausfordernde Situation",
+)
+
+
 def generate_user_prompt(
     dimension: str,
     target_difficulty: float,
@@ -518,42 +495,69 @@ def generate_user_prompt(
     """Generate the dynamic user prompt for a specific scenario"""
     
     business_type = business_context.get('business_type', 'services')
-    biz_info = BUSINESS_CONTEXTS.get(business_type, BUSINESS_CONTEXTS['services'])
-    dim_info = DIMENSIONS.get(dimension, DIMENSIONS['innovativeness'])
+    if business_type not in BUSINESS_CONTEXTS:
+        business_type = 'services'
+    if dimension not in DIMENSIONS:
+        dimension = 'innovativeness'
     
     # Map difficulty to complexity hint
-    if target_difficulty < -0.5:
-        difficulty_hint = "ein einfaches Alltagsszenario"
-    elif target_difficulty < 0.5:
-        difficulty_hint = "eine mittelschwere strategische Entscheidung"
-    else:
-        difficulty_hint = "eine komplexe, herausfordernde Situation"
+    difficulty_hint = _DIFFICULTY_HINTS[(target_difficulty >= -0.5) + (target_difficulty >= 0.5)]
+    
+    # The difficulty is printed to one decimal, so that is all the cache
+    # key needs
+    return _build_user_prompt(
+        dimension,
+        business_type,
+        difficulty_hint,
+        f"{target_difficulty:.1f}",
+        business_context.get('target_customer', 'Privatkunden'),
+        business_context.get('stage', 'Planung'),
+        business_context.get('description', 'Neugründung'),
+        tuple(previously_seen_themes[-5:]) if previously_seen_themes else ()
+    )
+
+
+@lru_cache(maxsize=512)
+def _build_user_prompt(
+    dimension: str,
+    business_type: str,
+    difficulty_hint: str,
+    difficulty: str,
+    target_customer: str,
+    stage: str,
+    description: str,
+    avoid: Tuple[str, ...]
+) -> str:
+    # Kept as one f-string: CPython builds it in a single pass, which measured
+    # faster than joining pre-split template fragments
+    biz_info = BUSINESS_CONTEXTS[business_type]
+    dim_info = DIMENSIONS[dimension]
     
     # Avoid themes
     avoid_themes = ""
-    if previously_seen_themes:
-        avoid_themes = f"\n\nVERMEIDE diese bereits verwendeten Themen: {', '.join(previously_seen_themes[-5:])}"
+    if avoid:
+        avoid_themes = f"\n\nVERMEIDE diese bereits verwendeten Themen: {', '.join(avoid)}"
     
     return f"""## AUFGABE
 Erstelle ein Geschäftsszenario für die Dimension "{dim_info['name_de']}"
 
 ## BUSINESS-KONTEXT
 - Geschäftstyp: {biz_info['label_de']} ({biz_info['industry_de']})
-- Zielkunden: {business_context.get('target_customer', 'Privatkunden')}
-- Phase: {business_context.get('stage', 'Planung')}
-- Beschreibung: {business_context.get('description', 'Neugründung')}
+- Zielkunden: {target_customer}
+- Phase: {stage}
+- Beschreibung: {description}
 
 ## DIMENSION "{dim_info['name_de']}"
 - Niedrige Ausprägung: {dim_info['low_behavior']}
 - Hohe Ausprägung: {dim_info['high_behavior']}
 
 ## SCHWIERIGKEIT
-{difficulty_hint} (IRT Difficulty: {target_difficulty:.1f})
+{difficulty_hint} (IRT Difficulty: {difficulty})
 
 ## BRANCHENSPEZIFISCHE DETAILS (nutze diese!)
-- Typische Entscheidungen: {', '.join(biz_info['typical_decisions'])}
-- Typische Zahlen: {', '.join(biz_info.get('example_numbers', ['€1.000', '3 Monate']))}
-- Stakeholder: {', '.join(biz_info['stakeholders'])}
+- Typische Entscheidungen: {biz_info['decisions_joined']}
+- Typische Zahlen: {biz_info['example_numbers_joined']}
+- Stakeholder: {biz_info['stakeholders_joined']}
 {avoid_themes}
 
 Generiere das Szenario im JSON-Format."""
@@ -562,62 +566,76 @@ Generiere das Szenario im JSON-Format."""
 # SCENARIO GENERATION WITH CACHING
 # ============================================================================
 
-def generate_scenario_sync(
-    dimension: str,
-    target_difficulty: float,
-    business_context: Dict[str, Any],
-    previously_seen_themes: List[str] = None,
-    session_id: str = None
-) -> GeneratedScenario:
-    """Generate a single scenario synchronously WITH CACHING"""
-    
-    start_time = time.time()
-    
-    user_prompt = generate_user_prompt(
-        dimension=dimension,
-        target_difficulty=target_difficulty,
-        business_context=business_context,
-        previously_seen_themes=previously_seen_themes
-    )
-    
-    # Call Claude WITH CACHING
-    response = sync_client.messages.create(
+# LRU cache of generated scenarios: the same prompt yields interchangeable
+# scenarios, so a repeat skips the Claude call. Shared by the sync batch
+# threads, hence the lock.
+_scenario_cache: OrderedDict[Tuple[str, str, str], GeneratedScenario] = OrderedDict()
+_scenario_cache_lock = threading.Lock()
+
+
+def _get_cached_scenario(key: Tuple[str, str, str]) -> Optional[GeneratedScenario]:
+    with _scenario_cache_lock:
+        scenario = _scenario_cache.get(key)
+        if scenario is None:
+            return None
+        _scenario_cache.move_to_end(key)
+    # No API call was made, so no prompt cache was read for this one
+    return replace(scenario, cached=False, cache_read_tokens=0)
+
+
+def _cache_scenario(key: Tuple[str, str, str], scenario: GeneratedScenario):
+    with _scenario_cache_lock:
+        _scenario_cache[key] = scenario
+        _scenario_cache.move_to_end(key)
+        if len(_scenario_cache) > SCENARIO_CACHE_SIZE:
+            _scenario_cache.popitem(last=False)
+
+
+def _build_request_kwargs(user_prompt: str) -> Dict[str, Any]:
+    """Claude request for one scenario: cached system prompt + dynamic user prompt"""
+    return dict(
         model="claude-sonnet-4-20250514",
         max_tokens=1024,
-        system=[
-            {
-                "type": "text",
-                "text": CACHED_SYSTEM_PROMPT,
-                "cache_control": {"type": "ephemeral"}  # ENABLE CACHING!
-            }
-        ],
+        system=list(_SYSTEM_BLOCK),
         messages=[
             {"role": "user", "content": user_prompt}
         ]
     )
+
+
+def _finalize_scenario(
+    response,
+    dimension: str,
+    target_difficulty: float,
+    business_context: Dict[str, Any],
+    start_time: float
+) -> GeneratedScenario:
+    """Turn a Claude response into a GeneratedScenario"""
     
     response_text = response.content[0].text
     generation_time = time.time() - start_time
     
     # Check cache status
     cache_hit = False
-    if hasattr(response, 'usage'):
-        cache_read = getattr(response.usage, 'cache_read_input_tokens', 0)
+    cache_read = 0
+    usage = getattr(response, 'usage', None)
+    if usage is not None:
+        # The SDK reports None when no cache was involved
+        cache_read = getattr(usage, 'cache_read_input_tokens', 0) or 0
         cache_hit = cache_read > 0
-        if cache_hit:
-            logger.info(f"✅ Cache HIT - {cache_read} tokens read from cache")
-        else:
-            cache_write = getattr(response.usage, 'cache_creation_input_tokens', 0)
-            logger.info(f"📝 Cache WRITE - {cache_write} tokens written to cache")
+        if logger.isEnabledFor(logging.INFO):
+            if cache_hit:
+                logger.info(f"✅ Cache HIT - {cache_read} tokens read from cache")
+            else:
+                cache_write = getattr(usage, 'cache_creation_input_tokens', 0) or 0
+                logger.info(f"📝 Cache WRITE - {cache_write} tokens written to cache")
     
     # Parse JSON
     scenario_data = _parse_scenario_json(response_text)
+    options = scenario_data['options']
     
     # Generate unique scenario ID
-    context_hash = hashlib.md5(
-        f"{dimension}_{business_context.get('business_type')}_{target_difficulty}_{session_id}_{time.time()}".encode()
-    ).hexdigest()[:8]
-    scenario_id = f"AI_{dimension.upper()[:4]}_{context_hash}"
+    scenario_id = f"AI_{dimension.upper()[:4]}_{secrets.token_hex(4)}"
     
     return GeneratedScenario(
         scenario_id=scenario_id,
@@ -627,21 +645,23 @@ def generate_scenario_sync(
         situation=scenario_data['situation'],
         question=scenario_data['question'],
         theme=scenario_data.get('theme', 'Allgemein'),
-        options=scenario_data['options'],
+        options=options,
+        option_thetas={opt['id']: opt.get('theta_value', 0.0) for opt in options},
         business_type=business_context.get('business_type', 'services'),
         cached=cache_hit,
+        cache_read_tokens=cache_read,
         generation_time=generation_time
     )
 
 
-async def generate_scenario_async(
+def generate_scenario_sync(
     dimension: str,
     target_difficulty: float,
     business_context: Dict[str, Any],
     previously_seen_themes: List[str] = None,
     session_id: str = None
 ) -> GeneratedScenario:
-    """Generate a single scenario asynchronously WITH CACHING"""
+    """Generate a single scenario synchronously WITH CACHING"""
     
     start_time = time.time()
     
@@ -652,53 +672,46 @@ async def generate_scenario_async(
         previously_seen_themes=previously_seen_themes
     )
     
-    # Call Claude WITH CACHING
-    response = await async_client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=1024,
-        system=[
-            {
-                "type": "text",
-                "text": CACHED_SYSTEM_PROMPT,
-                "cache_control": {"type": "ephemeral"}  # ENABLE CACHING!
-            }
-        ],
-        messages=[
-            {"role": "user", "content": user_prompt}
-        ]
-    )
-    
-    response_text = response.content[0].text
-    generation_time = time.time() - start_time
-    
-    # Check cache status
-    cache_hit = False
-    if hasattr(response, 'usage'):
-        cache_read = getattr(response.usage, 'cache_read_input_tokens', 0)
-        cache_hit = cache_read > 0
+    cache_key = (dimension, business_context.get('business_type', 'services'), user_prompt)
+    scenario = _get_cached_scenario(cache_key)
+    if scenario is None:
+        response = sync_client.messages.create(**_build_request_kwargs(user_prompt))
+        scenario = _finalize_scenario(
+            response, dimension, target_difficulty, business_context, start_time
+        )
+        _cache_scenario(cache_key, scenario)
     
-    # Parse JSON
-    scenario_data = _parse_scenario_json(response_text)
+    return scenario
+
+
+async def generate_scenario_async(
+    dimension: str,
+    target_difficulty: float,
+    business_context: Dict[str, Any],
+    previously_seen_themes: List[str] = None,
+    session_id: str = None
+) -> GeneratedScenario:
+    """Generate a single scenario asynchronously WITH CACHING"""
     
-    # Generate unique scenario ID
-    context_hash = hashlib.md5(
-        f"{dimension}_{business_context.get('business_type')}_{target_difficulty}_{session_id}_{time.time()}".encode()
-    ).hexdigest()[:8]
-    scenario_id = f"AI_{dimension.upper()[:4]}_{context_hash}"
+    start_time = time.time()
     
-    return GeneratedScenario(
-        scenario_id=scenario_id,
+    user_prompt = generate_user_prompt(
         dimension=dimension,
-        difficulty=target_difficulty,
-        discrimination=1.6,
-        situation=scenario_data['situation'],
-        question=scenario_data['question'],
-        theme=scenario_data.get('theme', 'Allgemein'),
-        options=scenario_data['options'],
-        business_type=business_context.get('business_type', 'services'),
-        cached=cache_hit,
-        generation_time=generation_time
+        target_difficulty=target_difficulty,
+        business_context=business_context,
+        previously_seen_themes=previously_seen_themes
     )
+    
+    cache_key = (dimension, business_context.get('business_type', 'services'), user_prompt)
+    scenario = _get_cached_scenario(cache_key)
+    if scenario is None:
+        response = await async_client.messages.create(**_build_request_kwargs(user_prompt))
+        scenario = _finalize_scenario(
+            response, dimension, target_difficulty, business_context, start_time
+        )
+        _cache_scenario(cache_key, scenario)
+    
+    return scenario
 
 
 def _parse_scenario_json(response_text: str) -> Dict[str, Any]:
@@ -706,74 +719,96 @@ def _parse_scenario_json(response_text: str) -> Dict[str, Any]:
     
     # Remove markdown code blocks if present
     text = response_text.strip()
-    if "```json" in text:
-        text = text.split("```json")[1].split("```")[0]
-    elif "```" in text:
-        text = text.split("```")[1].split("```")[0]
+    fence = _JSON_FENCE.search(text) or _CODE_FENCE.search(text)
+    if fence:
+        text = fence.group(1)
     
     try:
-        return json.loads(text.strip())
+        return _json_loads(text.strip())
     except json.JSONDecodeError as e:
         # Fallback: try to extract JSON object
-        import re
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
+        json_match = _JSON_OBJECT.search(text)
         if json_match:
-            return json.loads(json_match.group())
+            return _json_loads(json_match.group())
         raise ValueError(f"Could not parse JSON: {e}\nResponse: {response_text[:500]}")
 
 # ============================================================================
 # BATCH PRE-GENERATION
 # ============================================================================
 
+# Difficulties of the two pre-generated scenarios per dimension
+_SCENARIO_DIFFICULTIES = (0.0, 0.5)
+
+# Items per assessment: two per dimension (14)
+_TOTAL_ITEMS_NEEDED = len(DIMENSIONS) * 2
+
+# Position of each dimension in the assessment order
+_DIMENSION_INDEX = {dim: i for i, dim in enumerate(DIMENSIONS)}
+
+# (dimension, difficulty, session id suffix) of every pre-generated scenario,
+# both scenarios of a dimension back to back
+_SPEC_TEMPLATE = tuple(
+    (dimension, difficulty, f"_{dimension}_{i+1}")
+    for dimension in DIMENSIONS
+    for i, difficulty in enumerate(_SCENARIO_DIFFICULTIES)
+)
+
 async def pre_generate_all_scenarios_async(
     business_context: Dict[str, Any],
-    session_id: str
+    session_id: str,
+    max_concurrent: int = MAX_CONCURRENT_GENERATIONS,
+    on_generated: Optional[Callable[[int, Optional[GeneratedScenario]], None]] = None
 ) -> List[GeneratedScenario]:
-    """Pre-generate all 14 scenarios in PARALLEL at session start"""
+    """
+    Pre-generate all 14 scenarios in PARALLEL at session start.
+    
+    on_generated(index, scenario) is called as each scenario finishes, with
+    None for a failed one, so callers can use early results.
+    """
     
     logger.info(f"🚀 Starting batch pre-generation for session {session_id}")
     start_time = time.time()
     
-    # Define scenario specifications: 2 per dimension
-    scenario_specs = []
-    for i, dimension in enumerate(DIMENSIONS.keys()):
-        # First scenario: medium difficulty
-        scenario_specs.append({
-            "dimension": dimension,
-            "difficulty": 0.0,
-            "session_id": f"{session_id}_{dimension}_1"
-        })
-        # Second scenario: slightly harder
-        scenario_specs.append({
-            "dimension": dimension,
-            "difficulty": 0.5,
-            "session_id": f"{session_id}_{dimension}_2"
-        })
+    # Generate in parallel, with a bounded number of calls in flight
+    semaphore = asyncio.Semaphore(max_concurrent)
     
-    # Generate ALL scenarios in PARALLEL
-    tasks = [
-        generate_scenario_async(
-            dimension=spec["dimension"],
-            target_difficulty=spec["difficulty"],
-            business_context=business_context,
-            previously_seen_themes=[],
-            session_id=spec["session_id"]
-        )
-        for spec in scenario_specs
-    ]
+    async def generate(i: int, dimension: str, difficulty: float, suffix: str):
+        async with semaphore:
+            try:
+                return i, await generate_scenario_async(
+                    dimension=dimension,
+                    target_difficulty=difficulty,
+                    business_context=business_context,
+                    previously_seen_themes=[],
+                    session_id=session_id + suffix
+                )
+            except Exception as e:
+                logger.error(f"❌ Error generating scenario {i}: {e}")
+                return i, None
     
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Start the tasks in specification order, so the semaphore admits the
+    # first scenarios first (as_completed alone would start bare coroutines
+    # in arbitrary order)
+    tasks = [asyncio.create_task(generate(i, *spec)) for i, spec in enumerate(_SPEC_TEMPLATE)]
+    
+    # Collect as they finish, but keep the specification order
+    results: List[Optional[GeneratedScenario]] = [None] * len(_SPEC_TEMPLATE)
+    try:
+        for finished in asyncio.as_completed(tasks):
+            i, scenario = await finished
+            results[i] = scenario
+            if on_generated is not None:
+                on_generated(i, scenario)
+    finally:
+        # A cancelled batch must not leave its calls running
+        for task in tasks:
+            task.cancel()
     
     # Filter out errors
-    scenarios = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            logger.error(f"❌ Error generating scenario {i}: {result}")
-        else:
-            scenarios.append(result)
+    scenarios = [scenario for scenario in results if scenario is not None]
     
     total_time = time.time() - start_time
-    cache_hits = sum(1 for s in scenarios if s.cached)
+    cache_hits = sum(s.cached for s in scenarios)
     
     logger.info(f"✅ Generated {len(scenarios)} scenarios in {total_time:.2f}s")
     logger.info(f"   Cache hits: {cache_hits}/{len(scenarios)}")
@@ -785,30 +820,49 @@ def pre_generate_all_scenarios_sync(
     business_context: Dict[str, Any],
     session_id: str
 ) -> List[GeneratedScenario]:
-    """Synchronous batch pre-generation (generates sequentially for reliability)"""
+    """
+    Synchronous batch pre-generation on a thread pool.
+    
+    Generates in two waves - one scenario per dimension each - so the second
+    wave can still avoid the themes of the first.
+    """
     
     logger.info(f"🚀 Starting sync batch generation for session {session_id}")
     start_time = time.time()
     
-    scenarios = []
+    generated: Dict[Tuple[str, int], GeneratedScenario] = {}
     
     # Generate 2 scenarios per dimension (14 total)
-    for dimension in DIMENSIONS.keys():
-        for i, difficulty in enumerate([0.0, 0.5]):
-            try:
-                scenario = generate_scenario_sync(
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_GENERATIONS) as executor:
+        for i, difficulty in enumerate(_SCENARIO_DIFFICULTIES):
+            seen_themes = [s.theme for s in generated.values()]
+            futures = {
+                dimension: executor.submit(
+                    generate_scenario_sync,
                     dimension=dimension,
                     target_difficulty=difficulty,
                     business_context=business_context,
-                    previously_seen_themes=[s.theme for s in scenarios],
+                    previously_seen_themes=seen_themes,
                     session_id=f"{session_id}_{dimension}_{i+1}"
                 )
-                scenarios.append(scenario)
-            except Exception as e:
-                logger.error(f"❌ Error generating {dimension} scenario {i+1}: {e}")
+                for dimension in DIMENSIONS
+            }
+            for dimension, future in futures.items():
+                try:
+                    generated[dimension, i] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Error generating {dimension} scenario {i+1}: {e}")
+    
+    # Both scenarios of a dimension are served back to back
+    scenarios = [
+        generated[dimension, i]
+        for dimension in DIMENSIONS
+        for i in range(len(_SCENARIO_DIFFICULTIES))
+        if (dimension, i) in generated
+    ]
     
     total_time = time.time() - start_time
-    cache_hits = sum(1 for s in scenarios if s.cached)
+    cache_hits = sum(s.cached for s in scenarios)
     
     logger.info(f"✅ Generated {len(scenarios)} scenarios in {total_time:.2f}s")
     logger.info(f"   Cache hits: {cache_hits}/{len(scenarios)}")
@@ -823,14 +877,14 @@ def calculate_personalized_gaps(dimensions: Dict[str, Dict], business_type: str)
     """Calculate gaps based on actual personality assessment results"""
     
     gaps = []
-    completed = []
+    gap_dims = set()
     
-    for dim_key, dim_data in dimensions.items():
-        percentile = dim_data.get("percentile", 50)
-        mapping = GAP_DIMENSION_MAPPING.get(dim_key)
-        
-        if not mapping:
+    # The mapping is pre-sorted, so gaps come out most important first
+    for dim_key, mapping in _GAP_MAPPING_SORTED:
+        dim_data = dimensions.get(dim_key)
+        if dim_data is None:
             continue
+        percentile = dim_data.get("percentile", 50)
         
         # Check if gap applies
         has_gap = False
@@ -840,24 +894,27 @@ def calculate_personalized_gaps(dimensions: Dict[str, Dict], business_type: str)
             has_gap = True
         
         if has_gap:
-            gap = mapping["gap"].copy()
-            gap["reason"] = mapping["reason_template"].format(percentile=percentile)
-            gap["percentile"] = percentile
-            gaps.append(gap)
-        else:
-            completed.append({
-                "dimension": dim_key,
-                "name": DIMENSIONS[dim_key]["name_de"],
+            gaps.append({
+                **mapping["gap"],
+                "reason": mapping["reason_template"].format(percentile=percentile),
                 "percentile": percentile
             })
+            gap_dims.add(dim_key)
     
-    # Sort gaps by weight (most important first)
-    gaps.sort(key=lambda x: x.get("weight", 0), reverse=True)
+    # Dimensions without a gap, in assessment order
+    completed = [
+        {
+            "dimension": dim_key,
+            "name": DIMENSIONS[dim_key]["name_de"],
+            "percentile": dim_data.get("percentile", 50)
+        }
+        for dim_key, dim_data in dimensions.items()
+        if dim_key in GAP_DIMENSION_MAPPING and dim_key not in gap_dims
+    ]
     
     # Calculate readiness score
     total_weight = sum(g.get("weight", 10) for g in gaps)
-    max_weight = sum(m["gap"].get("weight", 10) for m in GAP_DIMENSION_MAPPING.values())
-    readiness_current = max(30, int(100 - (total_weight / max_weight * 100)))
+    readiness_current = max(30, int(100 - (total_weight / _MAX_GAP_WEIGHT * 100)))
     
     return {
         "readiness": {
@@ -875,24 +932,13 @@ def calculate_personalized_gaps(dimensions: Dict[str, Dict], business_type: str)
 # THETA & RESULTS CALCULATION
 # ============================================================================
 
-def theta_to_percentile(theta: float) -> int:
-    """Convert theta to percentile using normal distribution"""
-    z = theta / 1.0
-    percentile = 50 * (1 + math.erf(z / math.sqrt(2)))
-    return max(1, min(99, int(percentile)))
-
-
 def determine_archetype(dimensions: Dict) -> Dict[str, Any]:
     """Determine entrepreneurial archetype based on dimension profile"""
     
-    # Get dominant dimensions
-    sorted_dims = sorted(
-        dimensions.items(), 
-        key=lambda x: x[1]['percentile'], 
-        reverse=True
-    )
-    
-    top_dims = [d[0] for d in sorted_dims[:3]]
+    # Get dominant dimensions (nlargest keeps the order of ties, like sorted)
+    top_dims = {
+        dim for dim, _ in heapq.nlargest(3, dimensions.items(), key=lambda x: x[1]['percentile'])
+    }
     
     # Archetype selection
     if 'innovativeness' in top_dims and 'risk_taking' in top_dims:
@@ -908,9 +954,7 @@ def determine_archetype(dimensions: Dict) -> Dict[str, Any]:
     else:
         archetype_id = "balanced"
     
-    archetype = ARCHETYPES[archetype_id].copy()
-    archetype["id"] = archetype_id
-    return archetype
+    return _ARCHETYPES_WITH_ID[archetype_id]
 
 
 def generate_cta(gap_analysis: Dict, archetype: Dict) -> Dict[str, Any]:
@@ -946,6 +990,59 @@ def generate_cta(gap_analysis: Dict, archetype: Dict) -> Dict[str, Any]:
             "workshopResult": "Review durch Experten"
         }
 
+# ============================================================================
+# SESSION STORAGE
+# ============================================================================
+
+def _dump_session(session: Dict[str, Any]):
+    """Serialize a session, storing scenarios as plain field tuples"""
+    data = dict(session)
+    data['scenarios'] = [astuple(scenario) for scenario in session['scenarios']]
+    current = session.get('current_scenario')
+    data['current_scenario'] = astuple(current) if current else None
+    return _json_dumps(data)
+
+
+def _load_session(data) -> Dict[str, Any]:
+    """Inverse of _dump_session()"""
+    session = _json_loads(data)
+    session['scenarios'] = [GeneratedScenario(*fields) for fields in session['scenarios']]
+    if session['current_scenario']:
+        session['current_scenario'] = GeneratedScenario(*session['current_scenario'])
+    # Heap entries must compare with the tuples pushed later
+    session['dim_heap'] = [tuple(entry) for entry in session['dim_heap']]
+    return session
+
+
+class RedisSessionStore(ai_scenario_generator.RedisSessionStore):
+    """Redis session store for AIScenarioCATv2 sessions, expiring after SESSION_TTL_SECONDS"""
+    
+    key_prefix = "gv:ai_cat_v2"
+    _dump = staticmethod(_dump_session)
+    _load = staticmethod(_load_session)
+    
+    def set_batch(self, session_id: str, scenarios: List[GeneratedScenario]):
+        """Store a finished background batch under its own key, apart from the session"""
+        self.client.setex(
+            f"{self._key(session_id)}:batch",
+            self.ttl,
+            _json_dumps([astuple(scenario) for scenario in scenarios])
+        )
+    
+    def pop_batch(self, session_id: str) -> Optional[List[GeneratedScenario]]:
+        """Take the finished background batch of a session, if there is one"""
+        key = f"{self._key(session_id)}:batch"
+        data = self.client.get(key)
+        if not data:
+            return None
+        self.client.delete(key)
+        return [GeneratedScenario(*fields) for fields in _json_loads(data)]
+
+
+def create_session_store():
+    """Redis session store if REDIS_URL is set and reachable, else a process-local dict"""
+    return ai_scenario_generator.create_session_store(RedisSessionStore)
+
 # ============================================================================
 # MAIN CAT ENGINE CLASS
 # ============================================================================
@@ -959,43 +1056,99 @@ class AIScenarioCATv2:
     - Prompt caching for cost/latency reduction
     - Dynamic personalized gap analysis
     - 6 advanced prompting techniques
+    
+    Sessions live in a plain dict by default; pass a RedisSessionStore to
+    share them between workers. Every method writes a changed session back
+    with `self.sessions[session_id] = session`.
+    
+    A background batch never writes the session itself: the finished batch
+    is parked (in Redis with a RedisSessionStore) and merged by the next
+    request that loads the session. A batch session that runs out of
+    scenarios before its batch is available - it timed out, or another
+    worker holds the still running batch - continues on demand and ignores
+    the batch from then on.
     """
     
-    def __init__(self):
-        self.sessions: Dict[str, Dict] = {}
+    def __init__(self, sessions=None):
+        self.sessions = sessions if sessions is not None else {}
+        # Background batch pre-generation tasks by session id (process-local)
+        self._pending_batches: Dict[str, asyncio.Task] = {}
+        # Finished batches waiting to be merged, unless parked in Redis
+        self._finished_batches: Dict[str, List[GeneratedScenario]] = {}
         logger.info("🚀 AIScenarioCATv2 initialized")
     
-    def create_session(
+    async def create_session(
         self,
         session_id: str,
         business_context: Dict[str, Any],
         use_batch_generation: bool = True
     ) -> Dict[str, Any]:
-        """Create a new session with optional batch pre-generation"""
+        """
+        Create a new session with optional batch pre-generation.
+        
+        With batch generation this returns as soon as the first scenario is
+        ready; the rest of the batch keeps generating in the background and
+        is picked up by get_next_scenario.
+        """
         
         logger.info(f"Creating session {session_id} (batch={use_batch_generation})")
         
+        scenarios = []
+        batch = None
         if use_batch_generation:
-            # Pre-generate all scenarios
-            scenarios = pre_generate_all_scenarios_sync(business_context, session_id)
-        else:
-            scenarios = []
+            # Pre-generate all scenarios concurrently, waiting only for the first
+            first_ready = asyncio.get_running_loop().create_future()
+            
+            def on_generated(i: int, scenario: Optional[GeneratedScenario]):
+                if i == 0 and not first_ready.done():
+                    first_ready.set_result(scenario)
+            
+            batch = asyncio.create_task(pre_generate_all_scenarios_async(
+                business_context, session_id, on_generated=on_generated
+            ))
+            try:
+                await asyncio.wait((first_ready, batch), return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                batch.cancel()
+                raise
+            
+            if first_ready.done() and first_ready.result() is not None:
+                scenarios = [first_ready.result()]
+            else:
+                # Nothing to serve early - wait for the whole batch
+                scenarios = await batch
+                batch = None
         
         self.sessions[session_id] = {
             'business_context': business_context,
             'scenarios': scenarios,
             'scenario_index': 0,
+            # Plain dicts on purpose: a numpy element update is ~3x slower
+            # than a dict one, and sessions must stay JSON for Redis.
+            # get_results converts the estimates to an array in one go.
             'theta_estimates': {dim: 0.0 for dim in DIMENSIONS},
             'se_estimates': {dim: 1.0 for dim in DIMENSIONS},
             'items_per_dimension': {dim: 0 for dim in DIMENSIONS},
+            # Running totals of items_per_dimension, kept in step with it
+            'total_items': 0,
+            'dims_touched': 0,
+            # Min-heap of (items, dimension index, dimension) for on-demand
+            # dimension selection; outdated entries are skipped lazily
+            'dim_heap': [(0, i, dim) for i, dim in enumerate(DIMENSIONS)],
             'responses': [],
             'seen_themes': [],
             'current_scenario': None,
             'complete': False,
             'use_batch': use_batch_generation,
-            'cache_hits': sum(1 for s in scenarios if s.cached) if scenarios else 0
+            'batch_pending': batch is not None,
+            'cache_hits': sum(s.cached for s in scenarios),
+            'cache_read_tokens': sum(s.cache_read_tokens for s in scenarios)
         }
         
+        if batch is not None:
+            self._pending_batches[session_id] = batch
+            batch.add_done_callback(lambda _: self._park_batch(session_id))
+        
         return {
             'session_id': session_id,
             'status': 'created',
@@ -1004,13 +1157,75 @@ class AIScenarioCATv2:
             'message': 'AI-Powered Assessment bereit'
         }
     
-    def get_next_scenario(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def _park_batch(self, session_id: str):
+        """Keep a finished background batch until its session picks it up (runs once)"""
+        
+        batch = self._pending_batches.pop(session_id, None)
+        if batch is None or batch.cancelled():
+            return
+        if batch.exception() is not None:
+            logger.error(f"❌ Batch pre-generation failed for session {session_id}")
+            return
+        
+        if isinstance(self.sessions, RedisSessionStore):
+            self.sessions.set_batch(session_id, batch.result())
+        else:
+            self._finished_batches[session_id] = batch.result()
+    
+    def _take_batch(self, session_id: str) -> Optional[List[GeneratedScenario]]:
+        if isinstance(self.sessions, RedisSessionStore):
+            return self.sessions.pop_batch(session_id)
+        return self._finished_batches.pop(session_id, None)
+    
+    def _merge_batch(self, session_id: str, session: Dict[str, Any]):
+        """Move a finished background batch into the session being handled"""
+        
+        scenarios = self._take_batch(session_id)
+        if scenarios is None:
+            return
+        
+        # The scenarios already in the session are counted
+        new_scenarios = scenarios[len(session['scenarios']):]
+        session['cache_hits'] += sum(s.cached for s in new_scenarios)
+        session['cache_read_tokens'] += sum(s.cache_read_tokens for s in new_scenarios)
+        session['scenarios'] = scenarios
+        session['batch_pending'] = False
+    
+    async def wait_for_batch(self, session_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the background batch of a session running in this process
+        has finished. Returns False if it is still running after timeout.
+        """
+        batch = self._pending_batches.get(session_id)
+        if batch is None:
+            return True
+        done, _ = await asyncio.wait((batch,), timeout=timeout)
+        if not done:
+            return False
+        self._park_batch(session_id)
+        return True
+    
+    async def get_next_scenario(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get the next scenario (from pre-generated or generate on-demand)"""
         
         session = self.sessions.get(session_id)
         if not session or session['complete']:
             return None
         
+        if session.get('batch_pending'):
+            exhausted = session['scenario_index'] >= len(session['scenarios'])
+            if exhausted:
+                # Served everything generated so far - wait for the rest
+                await self.wait_for_batch(session_id, timeout=BATCH_WAIT_TIMEOUT_SECONDS)
+            self._merge_batch(session_id, session)
+            if exhausted and session['batch_pending']:
+                logger.warning(f"⚠️ Batch for session {session_id} not ready, continuing on demand")
+                batch = self._pending_batches.pop(session_id, None)
+                if batch is not None:
+                    batch.cancel()
+                session['batch_pending'] = False
+                session['use_batch'] = False
+        
         # Check if we have pre-generated scenarios
         if session['use_batch'] and session['scenario_index'] < len(session['scenarios']):
             scenario = session['scenarios'][session['scenario_index']]
@@ -1019,31 +1234,34 @@ class AIScenarioCATv2:
             dimension = self._select_next_dimension(session)
             difficulty = self._calculate_target_difficulty(session, dimension)
             
-            scenario = generate_scenario_sync(
+            scenario = await generate_scenario_async(
                 dimension=dimension,
                 target_difficulty=difficulty,
                 business_context=session['business_context'],
                 previously_seen_themes=session['seen_themes'],
                 session_id=session_id
             )
+            # Prompt cache usage as reported by the API
+            session['cache_hits'] += scenario.cached
+            session['cache_read_tokens'] += scenario.cache_read_tokens
         
         session['current_scenario'] = scenario
+        self.sessions[session_id] = session
         
         # Calculate progress
-        total_items = sum(session['items_per_dimension'].values())
-        total_needed = len(DIMENSIONS) * 2  # 14 items
+        total_items = session['total_items']
         
         return {
             'scenario': self._format_for_frontend(scenario),
             'progress': {
                 'current_item': total_items + 1,
-                'estimated_total': total_needed,
-                'percentage': int((total_items / total_needed) * 100),
-                'dimensions_assessed': sum(1 for v in session['items_per_dimension'].values() if v > 0)
+                'estimated_total': _TOTAL_ITEMS_NEEDED,
+                'percentage': int((total_items / _TOTAL_ITEMS_NEEDED) * 100),
+                'dimensions_assessed': session['dims_touched']
             }
         }
     
-    def submit_response(
+    async def submit_response(
         self,
         session_id: str,
         option_id: str
@@ -1059,21 +1277,27 @@ class AIScenarioCATv2:
             raise ValueError("No current scenario")
         
         # Get theta value for selected option
-        theta = 0.0
-        for opt in scenario.options:
-            if opt['id'] == option_id:
-                theta = opt.get('theta_value', 0.0)
-                break
+        theta = scenario.option_thetas.get(option_id, 0.0)
         
         # Update theta estimates (simplified Bayesian update)
         dim = scenario.dimension
-        prior_theta = session['theta_estimates'][dim]
-        weight = 0.6 / (1 + session['items_per_dimension'][dim])
-        new_theta = prior_theta * (1 - weight) + theta * weight
+        new_theta, new_se = update_theta_estimate(
+            session['theta_estimates'][dim],
+            session['se_estimates'][dim],
+            session['items_per_dimension'][dim],
+            theta
+        )
         
         session['theta_estimates'][dim] = new_theta
-        session['se_estimates'][dim] *= 0.85
+        session['se_estimates'][dim] = new_se
+        if session['items_per_dimension'][dim] == 0:
+            session['dims_touched'] += 1
         session['items_per_dimension'][dim] += 1
+        session['total_items'] += 1
+        heapq.heappush(
+            session['dim_heap'],
+            (session['items_per_dimension'][dim], _DIMENSION_INDEX[dim], dim)
+        )
         
         # Track theme
         session['seen_themes'].append(scenario.theme)
@@ -1091,16 +1315,17 @@ class AIScenarioCATv2:
         session['current_scenario'] = None
         
         # Check if complete
-        total_items = sum(session['items_per_dimension'].values())
-        if total_items >= len(DIMENSIONS) * 2:
+        if session['total_items'] >= _TOTAL_ITEMS_NEEDED:
             session['complete'] = True
+            self.sessions[session_id] = session
             return {
                 'complete': True,
                 'results': self.get_results(session_id)
             }
         
         # Get next scenario
-        next_data = self.get_next_scenario(session_id)
+        self.sessions[session_id] = session
+        next_data = await self.get_next_scenario(session_id)
         return {
             'complete': False,
             **next_data
@@ -1113,17 +1338,23 @@ class AIScenarioCATv2:
         if not session:
             raise ValueError("Session not found")
         
-        # Calculate dimensions
-        dimensions = {}
-        for dim, theta in session['theta_estimates'].items():
-            percentile = theta_to_percentile(theta)
-            level = 'high' if percentile >= 70 else ('medium' if percentile >= 40 else 'low')
-            dimensions[dim] = {
+        # Convert all theta estimates to percentiles at once
+        dims = tuple(session['theta_estimates'])
+        thetas = np.fromiter(session['theta_estimates'].values(), dtype=float, count=len(dims))
+        percentiles = theta_to_percentiles(thetas)
+        levels = np.where(percentiles >= 70, 'high', np.where(percentiles >= 40, 'medium', 'low'))
+        
+        dimensions = {
+            dim: {
                 'theta': round(theta, 2),
                 'percentile': percentile,
                 'level': level,
                 'name_de': DIMENSIONS[dim]['name_de']
             }
+            for dim, theta, percentile, level in zip(
+                dims, thetas.tolist(), percentiles.tolist(), levels.tolist()
+            )
+        }
         
         # Calculate average
         avg_theta = sum(session['theta_estimates'].values()) / len(DIMENSIONS)
@@ -1154,19 +1385,20 @@ class AIScenarioCATv2:
             'cta': cta,
             'session_stats': {
                 'scenarios_generated': len(session['responses']),
-                'cache_hits': session.get('cache_hits', 0)
+                'cache_hits': session.get('cache_hits', 0),
+                'cache_read_tokens': session.get('cache_read_tokens', 0)
             }
         }
     
     def _select_next_dimension(self, session: Dict) -> str:
         """Select dimension for next scenario"""
-        # Find dimension with fewest items
-        min_items = min(session['items_per_dimension'].values())
-        candidates = [
-            dim for dim, count in session['items_per_dimension'].items()
-            if count == min_items
-        ]
-        return candidates[0] if candidates else list(DIMENSIONS.keys())[0]
+        # Dimension with fewest items, ties in assessment order. Counts only
+        # grow, so outdated heap entries surface first and are dropped here.
+        heap = session['dim_heap']
+        items = session['items_per_dimension']
+        while heap[0][0] != items[heap[0][2]]:
+            heapq.heappop(heap)
+        return heap[0][2]
     
     def _calculate_target_difficulty(self, session: Dict, dimension: str) -> float:
         """Calculate target difficulty based on current theta"""
@@ -1188,13 +1420,19 @@ class AIScenarioCATv2:
 # SINGLETON & EXPORTS
 # ============================================================================
 
+async def close_clients():
+    """Close the shared Anthropic clients, draining their connection pools"""
+    await async_client.close()
+    sync_client.close()
+
+
 _ai_cat_engine_v2 = None
 
 def get_ai_cat_engine() -> AIScenarioCATv2:
     """Get or create the AI CAT engine v2 singleton"""
     global _ai_cat_engine_v2
     if _ai_cat_engine_v2 is None:
-        _ai_cat_engine_v2 = AIScenarioCATv2()
+        _ai_cat_engine_v2 = AIScenarioCATv2(create_session_store())
     return _ai_cat_engine_v2
 
 
@@ -1206,10 +1444,14 @@ __all__ = [
     'AIScenarioCATv2',
     'AIScenarioCAT',
     'get_ai_cat_engine',
+    'close_clients',
+    'RedisSessionStore',
+    'create_session_store',
     'DIMENSIONS',
     'BUSINESS_CONTEXTS',
     'generate_scenario_sync',
     'pre_generate_all_scenarios_sync',
+    'pre_generate_all_scenarios_async',
     'calculate_personalized_gaps'
 ]
 
@@ -1286,22 +1528,31 @@ if __name__ == "__main__":
     
     engine = get_ai_cat_engine()
     
-    start = time.time()
-    session_info = engine.create_session(
-        "test_session",
-        {
-            "business_type": "consulting",
-            "target_customer": "KMU",
-            "stage": "Planung",
-            "description": "IT-Beratung"
-        },
-        use_batch_generation=True
-    )
-    total_time = time.time() - start
-    
-    print(f"   Created session in {total_time:.2f}s")
-    print(f"   Scenarios ready: {session_info['scenarios_ready']}")
-    print(f"   Cache hits: {session_info['cache_hits']}")
+    async def batch_session():
+        start = time.time()
+        session_info = await engine.create_session(
+            "test_session",
+            {
+                "business_type": "consulting",
+                "target_customer": "KMU",
+                "stage": "Planung",
+                "description": "IT-Beratung"
+            },
+            use_batch_generation=True
+        )
+        print(f"   First scenario ready in {time.time() - start:.2f}s")
+        
+        await engine.wait_for_batch("test_session")
+        total_time = time.time() - start
+        
+        # The finished batch is merged when the session is next used
+        await engine.get_next_scenario("test_session")
+        session = engine.sessions["test_session"]
+        print(f"   All scenarios ready in {total_time:.2f}s")
+        print(f"   Scenarios ready: {len(session['scenarios'])}")
+        print(f"   Cache hits: {session['cache_hits']}")
+    
+    asyncio.run(batch_session())
     
     print("\n" + "=" * 60)
     print("✅ ALL TESTS COMPLETE")
@@ -18,6 +18,7 @@ import logging
 # Use optimized v2 generator
 from ai_scenario_generator_v2 import (
     get_ai_cat_engine,
+    close_clients,
     AIScenarioCATv2 as AIScenarioCAT,
     DIMENSIONS,
     BUSINESS_CONTEXTS
@@ -25,7 +26,12 @@ from ai_scenario_generator_v2 import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/ai-assessment", tags=["AI Assessment"])
+# The Anthropic clients live for the whole process - close them on shutdown
+router = APIRouter(
+    prefix="/api/v1/ai-assessment",
+    tags=["AI Assessment"],
+    on_shutdown=[close_clients]
+)
 
 
 # ========== Pydantic Models ==========
@@ -124,7 +130,7 @@ async def start_assessment(
         
         # Create session WITHOUT batch pre-generation (faster startup!)
         # Scenarios will be generated on-demand for each question
-        session_info = engine.create_session(
+        session_info = await engine.create_session(
             session_id, 
             request.business_context,
             use_batch_generation=False  # On-demand is faster for first response
@@ -135,7 +141,7 @@ async def start_assessment(
         
         # Get first scenario (generated on-demand, ~2-3s)
         scenario_start = time.time()
-        next_data = engine.get_next_scenario(session_id)
+        next_data = await engine.get_next_scenario(session_id)
         scenario_time = time.time() - scenario_start
         logger.info(f"First scenario generated in {scenario_time:.2f}s")
         
@@ -182,7 +188,7 @@ async def submit_response(
     Claude generates the next scenario based on current ability estimate.
     """
     try:
-        result = engine.submit_response(session_id, request.option_id)
+        result = await engine.submit_response(session_id, request.option_id)
         
         if result.get('complete'):
             return AssessmentResponse(
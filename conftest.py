@@ -0,0 +1,95 @@
+"""
+Shared fakes and fixtures for the offline AI scenario generator tests
+(v1 and v2 share the Anthropic clients, so one fake replaces both)
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import ai_scenario_generator
+import ai_scenario_generator_v2
+
+
+SCENARIO_JSON = {
+    'situation': 'Ein Stammgast fragt nach einem neuen Gericht.',
+    'question': 'Wie reagierst du?',
+    'theme': 'Speisekarte',
+    'options': [
+        {'id': 'A', 'text': 'Alles bleibt', 'theta_value': -1.5},
+        {'id': 'B', 'text': 'Tagesspecial', 'theta_value': -0.5},
+        {'id': 'C', 'text': 'Kleine Ecke', 'theta_value': 0.5},
+        {'id': 'D', 'text': 'Neue Karte', 'theta_value': 1.5},
+    ],
+}
+
+RESTAURANT = {
+    'business_type': 'restaurant',
+    'target_customer': 'Familien',
+    'stage': 'Planung',
+    'description': 'Italienisches Restaurant',
+}
+
+
+class FakeMessages:
+    """Records create() calls and answers with a fixed scenario"""
+
+    def __init__(self, text, cache_read=0):
+        self.text = text
+        self.cache_read = cache_read
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=self.text)],
+            usage=SimpleNamespace(
+                cache_read_input_tokens=self.cache_read,
+                cache_creation_input_tokens=0,
+            ),
+        )
+
+
+class FakeAsyncMessages(FakeMessages):
+    """Async counterpart of FakeMessages"""
+
+    async def create(self, **kwargs):
+        return FakeMessages.create(self, **kwargs)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = SimpleNamespace(messages=FakeMessages(json.dumps(SCENARIO_JSON)))
+    monkeypatch.setattr(ai_scenario_generator, 'client', client)
+    monkeypatch.setattr(ai_scenario_generator_v2, 'sync_client', client)
+    return client
+
+
+@pytest.fixture
+def fake_async_client(monkeypatch):
+    client = SimpleNamespace(messages=FakeAsyncMessages(json.dumps(SCENARIO_JSON)))
+    monkeypatch.setattr(ai_scenario_generator, 'async_client', client)
+    monkeypatch.setattr(ai_scenario_generator_v2, 'async_client', client)
+    return client
@@ -0,0 +1,289 @@
+"""
+Tests for the AI Scenario Generator (v1)
+Runs offline: the Anthropic client is replaced by a recording fake
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import ai_scenario_generator as generator
+from ai_scenario_generator import (
+    AIScenarioCAT,
+    DIMENSIONS,
+    RedisSessionStore,
+    create_session_store,
+    format_for_frontend,
+    generate_scenario,
+    generate_scenario_prompt,
+    stream_scenario_async,
+    get_theta_for_option,
+    theta_to_percentile,
+    theta_to_percentiles,
+    update_theta_estimate,
+)
+from conftest import RESTAURANT, SCENARIO_JSON, FakeMessages, FakeRedis
+
+
+class FakeStream:
+    """Async context manager mimicking messages.stream() with fixed chunks"""
+
+    def __init__(self, chunks, message):
+        self.chunks = chunks
+        self.message = message
+        self.consumed = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    async def get_final_message(self):
+        return self.message
+
+
+# ============================================================================
+# PROMPT
+# ============================================================================
+
+class TestScenarioPrompt:
+    """Test the cached preamble / dynamic tail split"""
+
+    def test_prompt_contains_context_and_dimension(self):
+        prompt = generate_scenario_prompt('risk_taking', 0.0, RESTAURANT, ['Preise'])
+        assert 'Risikobereitschaft' in prompt
+        assert 'Zielkunden: Familien' in prompt
+        assert 'Preise' in prompt
+
+    def test_unknown_keys_share_the_fallback_preamble(self):
+        fallback = generate_scenario_prompt('innovativeness', 0.0, {'business_type': 'services'})
+        assert generate_scenario_prompt('unknown', 0.0, {'business_type': 'bakery'}) == fallback
+
+    def test_preamble_is_cached_system_prompt(self, fake_client):
+        generate_scenario('innovativeness', 0.0, RESTAURANT, session_id='a')
+        generate_scenario('innovativeness', 1.0, dict(RESTAURANT, target_customer='Touristen'), session_id='b')
+        first, second = fake_client.messages.calls
+        assert first['system'] == second['system']
+        assert first['system'][0]['cache_control'] == {'type': 'ephemeral'}
+        assert 'Touristen' in second['messages'][0]['content']
+        assert 'Touristen' not in second['system'][0]['text']
+
+
+# ============================================================================
+# SCENARIO GENERATION
+# ============================================================================
+
+class TestGenerateScenario:
+    """Test parsing of Claude responses"""
+
+    def test_parses_fenced_json(self, monkeypatch):
+        text = 'Hier:\n```json\n' + json.dumps(SCENARIO_JSON) + '\n```'
+        monkeypatch.setattr(generator, 'client', SimpleNamespace(messages=FakeMessages(text)))
+        scenario = generate_scenario('innovativeness', 0.0, RESTAURANT, session_id='s')
+        assert scenario.situation == SCENARIO_JSON['situation']
+        assert scenario.scenario_id.startswith('AI_INNO_')
+        assert len(scenario.scenario_id) == len('AI_INNO_') + 8
+
+    @pytest.mark.parametrize('template', [
+        '```\n{}\n```',
+        '```json\n{}',
+        'Vorab ```text``` dann ```json\n{}\n```',
+    ])
+    def test_parses_other_fence_shapes(self, monkeypatch, template):
+        text = template.format(json.dumps(SCENARIO_JSON))
+        monkeypatch.setattr(generator, 'client', SimpleNamespace(messages=FakeMessages(text)))
+        scenario = generate_scenario('innovativeness', 0.0, RESTAURANT, session_id='s')
+        assert scenario.question == SCENARIO_JSON['question']
+
+    def test_options_are_split_into_parallel_tuples(self, fake_client):
+        scenario = generate_scenario('innovativeness', 0.0, RESTAURANT, session_id='s')
+        assert scenario.option_ids == ('A', 'B', 'C', 'D')
+        assert scenario.options == SCENARIO_JSON['options']
+        assert get_theta_for_option(scenario, 'C') == 0.5
+        assert get_theta_for_option(scenario, 'X') == 0.0
+        assert format_for_frontend(scenario)['options'][0] == {'id': 'A', 'text': 'Alles bleibt'}
+        with pytest.raises(AttributeError):
+            scenario.situation = ''
+
+    def test_stream_yields_situation_before_options(self, monkeypatch):
+        text = json.dumps(dict(SCENARIO_JSON, situation='Ein "Stammgast" fragt.'))
+        chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+        stream = FakeStream(chunks, FakeMessages(text).create())
+        messages = SimpleNamespace(stream=lambda **kwargs: stream)
+        monkeypatch.setattr(generator, 'async_client', SimpleNamespace(messages=messages))
+
+        async def collect():
+            events = []
+            async for kind, value in stream_scenario_async('innovativeness', 0.0, RESTAURANT, session_id='s'):
+                events.append((kind, value, stream.consumed))
+            return events
+
+        (first, situation, consumed), (last, scenario, _) = asyncio.run(collect())
+        assert (first, situation) == ('situation', 'Ein "Stammgast" fragt.')
+        assert consumed < len(chunks)
+        assert last == 'scenario'
+        assert scenario.situation == situation
+        assert scenario.option_ids == ('A', 'B', 'C', 'D')
+
+    def test_scenario_id_depends_on_session(self, fake_client):
+        first = generate_scenario('risk_taking', 0.0, RESTAURANT, session_id='a')
+        again = generate_scenario('risk_taking', 0.0, RESTAURANT, session_id='a')
+        other = generate_scenario('risk_taking', 0.0, RESTAURANT, session_id='b')
+        assert first.scenario_id == again.scenario_id
+        assert first.scenario_id != other.scenario_id
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+class TestPercentiles:
+    """Test the theta to percentile conversion"""
+
+    def test_vectorized_matches_scalar(self):
+        thetas = np.linspace(-3, 3, 601)
+        assert theta_to_percentiles(thetas).tolist() == [
+            theta_to_percentile(t) for t in thetas.tolist()
+        ]
+
+    def test_percentiles_are_clamped(self):
+        assert theta_to_percentiles(np.array([-10.0, 0.0, 10.0])).tolist() == [1, 50, 99]
+
+
+class TestThetaUpdate:
+    """Test the per-answer estimate update"""
+
+    def test_first_answer_moves_theta_most(self):
+        assert update_theta_estimate(0.0, 1.0, 0, 1.5) == pytest.approx((0.9, 0.85))
+        assert update_theta_estimate(0.9, 0.85, 1, 1.5) == pytest.approx((1.08, 0.7225))
+
+
+# ============================================================================
+# CAT ENGINE
+# ============================================================================
+
+class TestAIScenarioCAT:
+    """Test the assessment flow"""
+
+    def test_full_session_covers_every_dimension_twice(self, fake_client):
+        engine = AIScenarioCAT()
+        engine.create_session('s1', RESTAURANT)
+        data = engine.get_next_scenario('s1')
+        asked = []
+        while True:
+            asked.append(data['scenario']['dimension'])
+            assert data['progress']['current_item'] == len(asked)
+            assert data['progress']['dimensions_assessed'] == len(asked) // 2
+            data = engine.submit_response('s1', 'D')
+            if data['complete']:
+                break
+        assert asked == [dim for dim in DIMENSIONS for _ in range(2)]
+        results = data['results']
+        assert set(results['dimensions']) == set(DIMENSIONS)
+        assert all(d['level'] == 'high' for d in results['dimensions'].values())
+
+    def test_seen_themes_are_tracked_and_bounded(self, monkeypatch):
+        themes = iter(f'Thema{i}' for i in range(100))
+
+        class ThemedMessages(FakeMessages):
+            def create(self, **kwargs):
+                self.text = json.dumps(dict(SCENARIO_JSON, theme=next(themes)))
+                return super().create(**kwargs)
+
+        messages = ThemedMessages('')
+        monkeypatch.setattr(generator, 'client', SimpleNamespace(messages=messages))
+        engine = AIScenarioCAT()
+        engine.create_session('t', RESTAURANT)
+        engine.get_next_scenario('t')
+        for _ in range(6):
+            engine.submit_response('t', 'B')
+
+        assert list(engine.sessions['t']['seen_themes']) == [f'Thema{i}' for i in range(1, 6)]
+        request = messages.calls[-1]['messages'][0]['content']
+        assert 'VERMEIDE diese bereits verwendeten Themen: Thema1, Thema2, Thema3, Thema4, Thema5' in request
+
+    def test_gz_readiness_lists_ranked_strengths_and_gaps(self):
+        percentiles = [66, 90, 40, 70, 80, 30, 45]
+        dimensions = {
+            dim: {'percentile': p, 'level_de': DIMENSIONS[dim]['name_de']}
+            for dim, p in zip(DIMENSIONS, percentiles)
+        }
+        readiness = AIScenarioCAT()._calculate_gz_readiness(dimensions)
+        names = [DIMENSIONS[dim]['name_de'] for dim in DIMENSIONS]
+        assert readiness['strengths'] == [names[1], names[4], names[3]]
+        assert readiness['development_areas'] == [names[5], names[2]]
+
+    def test_pre_generated_pool_serves_items(self, fake_client, fake_async_client):
+        engine = AIScenarioCAT()
+        info = asyncio.run(engine.create_session_async('s2', RESTAURANT))
+        assert info['scenarios_ready'] == len(DIMENSIONS) * 2
+        assert len(fake_async_client.messages.calls) == len(DIMENSIONS) * 2
+
+        engine.get_next_scenario('s2')
+        engine.submit_response('s2', 'B')  # theta stays within tolerance
+        assert fake_client.messages.calls == []
+
+    def test_second_pooled_item_avoids_the_first_theme(self, fake_client, fake_async_client):
+        asyncio.run(AIScenarioCAT().create_session_async('s4', RESTAURANT))
+        prompts = [call['messages'][0]['content'] for call in fake_async_client.messages.calls]
+        first, second = prompts[:len(DIMENSIONS)], prompts[len(DIMENSIONS):]
+        assert not any('VERMEIDE' in prompt for prompt in first)
+        assert all('VERMEIDE diese bereits verwendeten Themen: Speisekarte' in prompt for prompt in second)
+
+    def test_pooled_follow_up_dropped_when_theta_moves(self, fake_client, fake_async_client):
+        engine = AIScenarioCAT()
+        asyncio.run(engine.create_session_async('s3', RESTAURANT))
+        engine.get_next_scenario('s3')
+        engine.submit_response('s3', 'D')  # theta 0.9 -> regenerate for the new estimate
+        assert len(fake_client.messages.calls) == 1
+        request = fake_client.messages.calls[0]['messages'][0]['content']
+        assert 'IRT Difficulty: 0.9' in request
+
+
+# ============================================================================
+# SESSION STORE
+# ============================================================================
+
+class TestRedisSessionStore:
+    """Test sessions persisted through the Redis store"""
+
+    def test_session_round_trip(self, fake_client, fake_async_client):
+        store = RedisSessionStore(FakeRedis())
+        engine = AIScenarioCAT(store)
+        asyncio.run(engine.create_session_async('r1', RESTAURANT))
+        engine.get_next_scenario('r1')
+
+        session = store['r1']
+        assert session['current_scenario'].option_ids == ('A', 'B', 'C', 'D')
+        assert len(session['scenario_pool']['innovativeness']) == 1
+        assert session['seen_themes'].maxlen == generator.MAX_AVOID_THEMES
+        assert 'r1' in store and 'other' not in store
+        assert store.get('other') is None
+
+    def test_full_session_matches_in_memory_engine(self, fake_client):
+        redis_client = FakeRedis()
+        engines = AIScenarioCAT(), AIScenarioCAT(RedisSessionStore(redis_client))
+        results = []
+        for engine in engines:
+            engine.create_session('s', RESTAURANT)
+            engine.get_next_scenario('s')
+            answers = iter('ABCDDCBAABCDDC')
+            while not (data := engine.submit_response('s', next(answers)))['complete']:
+                pass
+            results.append(data['results'])
+        assert results[0] == results[1]
+        assert set(redis_client.ttls.values()) == {generator.SESSION_TTL_SECONDS}
+
+    def test_falls_back_to_memory_without_redis_url(self, monkeypatch):
+        monkeypatch.delenv('REDIS_URL', raising=False)
+        assert create_session_store() == {}
@@ -0,0 +1,499 @@
+"""
+Offline tests for the AI Scenario Generator V2
+Unlike test_ai_scenario_v2.py these need no API key - the Anthropic
+clients are replaced by recording fakes
+"""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import ai_scenario_generator_v2 as generator
+from ai_scenario_generator_v2 import (
+    ARCHETYPES,
+    BUSINESS_CONTEXTS,
+    DIMENSIONS,
+    GAP_DIMENSION_MAPPING,
+    calculate_personalized_gaps,
+    determine_archetype,
+    generate_scenario_sync,
+    generate_user_prompt,
+    pre_generate_all_scenarios_async,
+    pre_generate_all_scenarios_sync,
+)
+from conftest import RESTAURANT, SCENARIO_JSON, FakeAsyncMessages, FakeMessages, FakeRedis
+
+
+@pytest.fixture(autouse=True)
+def empty_scenario_cache():
+    generator._scenario_cache.clear()
+    yield
+    generator._scenario_cache.clear()
+
+
+# ============================================================================
+# USER PROMPT
+# ============================================================================
+
+class TestUserPrompt:
+    """Test the dynamic user prompt"""
+
+    def test_prompt_contains_context(self):
+        prompt = generate_user_prompt('risk_taking', 0.04, RESTAURANT, ['Preise'])
+        assert 'Dimension "Risikobereitschaft"' in prompt
+        assert '- Zielkunden: Familien' in prompt
+        assert 'IRT Difficulty: 0.0' in prompt
+        assert 'VERMEIDE diese bereits verwendeten Themen: Preise' in prompt
+
+    def test_only_last_five_themes_are_listed(self):
+        prompt = generate_user_prompt('risk_taking', 0.0, RESTAURANT, list('abcdefg'))
+        assert 'Themen: c, d, e, f, g\n' in prompt
+
+    def test_unknown_keys_fall_back(self):
+        fallback = generate_user_prompt('innovativeness', 0.0, {'business_type': 'services'})
+        assert generate_user_prompt('unknown', 0.0, {'business_type': 'bakery'}) == fallback
+        assert '- Beschreibung: Neugründung' in fallback
+
+    def test_difficulty_hint_follows_raw_difficulty(self):
+        # -0.52 and -0.48 print the same, but get different hints
+        assert 'ein einfaches Alltagsszenario' in generate_user_prompt('risk_taking', -0.52, RESTAURANT)
+        assert 'eine mittelschwere' in generate_user_prompt('risk_taking', -0.48, RESTAURANT)
+        assert 'eine komplexe' in generate_user_prompt('risk_taking', 0.5, RESTAURANT)
+
+    def test_prompts_are_cached(self):
+        generator._build_user_prompt.cache_clear()
+        generate_user_prompt('risk_taking', 0.0, RESTAURANT, ['Preise'])
+        generate_user_prompt('risk_taking', 0.01, dict(RESTAURANT), ['Preise'])
+        assert generator._build_user_prompt.cache_info().hits == 1
+
+
+# ============================================================================
+# SCENARIO GENERATION
+# ============================================================================
+
+class TestGenerateScenario:
+    """Test scenario generation against a fake client"""
+
+    def test_generated_scenario(self, fake_client):
+        scenario = generate_scenario_sync('innovativeness', 0.0, RESTAURANT, session_id='s')
+        assert scenario.situation == SCENARIO_JSON['situation']
+        assert scenario.theme == 'Speisekarte'
+        assert scenario.options == SCENARIO_JSON['options']
+        assert scenario.option_thetas == {'A': -1.5, 'B': -0.5, 'C': 0.5, 'D': 1.5}
+        assert scenario.scenario_id.startswith('AI_INNO_')
+        assert not scenario.cached
+
+    @pytest.mark.parametrize('cache_read, cached', [(1800, True), (0, False), (None, False)])
+    def test_prompt_cache_hit_from_usage(self, monkeypatch, cache_read, cached):
+        messages = FakeMessages(json.dumps(SCENARIO_JSON), cache_read=cache_read)
+        monkeypatch.setattr(generator, 'sync_client', SimpleNamespace(messages=messages))
+        scenario = generate_scenario_sync('innovativeness', 0.0, RESTAURANT, session_id='s')
+        assert scenario.cached is cached
+
+    def test_system_prompt_is_cached(self, fake_client):
+        generate_scenario_sync('innovativeness', 0.0, RESTAURANT, session_id='s')
+        generate_scenario_sync('risk_taking', 0.5, RESTAURANT, session_id='s')
+        first, second = fake_client.messages.calls
+        assert first['system'] == second['system']
+        assert first['system'][0]['text'] == generator.CACHED_SYSTEM_PROMPT
+        assert first['system'][0]['cache_control'] == {'type': 'ephemeral'}
+
+    def test_scenario_ids_are_unique(self, fake_client):
+        ids = {
+            generate_scenario_sync(
+                'risk_taking', 0.0, dict(RESTAURANT, target_customer=f'Kunde {i}'), session_id='s'
+            ).scenario_id
+            for i in range(20)
+        }
+        assert len(ids) == 20
+        assert all(len(scenario_id) == len('AI_RISK_') + 8 for scenario_id in ids)
+
+    def test_repeated_prompt_is_served_from_cache(self, fake_client):
+        fake_client.messages.cache_read = 1800
+        first = generate_scenario_sync('risk_taking', 0.0, RESTAURANT, session_id='a')
+        again = generate_scenario_sync('risk_taking', 0.04, dict(RESTAURANT), session_id='b')
+        harder = generate_scenario_sync('risk_taking', 0.5, RESTAURANT, session_id='a')
+        assert again.scenario_id == first.scenario_id
+        assert harder.scenario_id != first.scenario_id
+        assert len(fake_client.messages.calls) == 2
+        # Only the scenario from the API call read the prompt cache
+        assert first.cached and first.cache_read_tokens == 1800
+        assert not again.cached and again.cache_read_tokens == 0
+
+    def test_scenario_cache_is_bounded(self, fake_client, monkeypatch):
+        monkeypatch.setattr(generator, 'SCENARIO_CACHE_SIZE', 3)
+        for i in range(5):
+            generate_scenario_sync('risk_taking', 0.0, dict(RESTAURANT, stage=str(i)))
+        generate_scenario_sync('risk_taking', 0.0, dict(RESTAURANT, stage='0'))
+        assert len(generator._scenario_cache) == 3
+        assert len(fake_client.messages.calls) == 6
+
+    @pytest.mark.parametrize('template', [
+        'Hier:\n```json\n{}\n```',
+        '```\n{}\n```',
+        '```json\n{}',
+        'Vorab ```text``` dann ```json\n{}\n```',
+        'Hier ist das Szenario: {} Viel Erfolg!',
+    ])
+    def test_parses_wrapped_json(self, template):
+        parsed = generator._parse_scenario_json(template.format(json.dumps(SCENARIO_JSON)))
+        assert parsed == SCENARIO_JSON
+
+    def test_unparseable_response_raises(self):
+        with pytest.raises(ValueError):
+            generator._parse_scenario_json('Leider kein JSON')
+
+    def test_scenarios_are_immutable(self, fake_client):
+        scenario = generate_scenario_sync('innovativeness', 0.0, RESTAURANT, session_id='s')
+        with pytest.raises(AttributeError):
+            scenario.cached = True
+        assert not hasattr(scenario, '__dict__')
+
+
+# ============================================================================
+# BATCH PRE-GENERATION
+# ============================================================================
+
+class SlowAsyncMessages(FakeAsyncMessages):
+    """Tracks how many calls are in flight; one dimension always fails"""
+
+    def __init__(self, text):
+        super().__init__(text)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (len(self.calls) % 3))
+            if 'Selbstwirksamkeit' in kwargs['messages'][0]['content']:
+                raise RuntimeError('rate limited')
+            return await super().create(**kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+class TestBatchPreGeneration:
+    """Test parallel pre-generation"""
+
+    def test_async_batch_is_bounded_and_ordered(self, monkeypatch):
+        messages = SlowAsyncMessages(json.dumps(SCENARIO_JSON))
+        monkeypatch.setattr(generator, 'async_client', SimpleNamespace(messages=messages))
+
+        scenarios = asyncio.run(pre_generate_all_scenarios_async(RESTAURANT, 'batch'))
+
+        assert messages.max_in_flight == generator.MAX_CONCURRENT_GENERATIONS
+        expected = [dim for dim in DIMENSIONS if dim != 'self_efficacy' for _ in range(2)]
+        assert [s.dimension for s in scenarios] == expected
+        assert [s.difficulty for s in scenarios[:2]] == [0.0, 0.5]
+
+    def test_async_batch_starts_calls_in_spec_order(self, fake_async_client):
+        started = []
+        create = fake_async_client.messages.create
+
+        async def recording_create(**kwargs):
+            started.append(kwargs['messages'][0]['content'])
+            return await create(**kwargs)
+
+        fake_async_client.messages.create = recording_create
+        asyncio.run(pre_generate_all_scenarios_async(RESTAURANT, 'batch'))
+
+        expected = [
+            (DIMENSIONS[dim]['name_de'], f'Difficulty: {difficulty}')
+            for dim, difficulty, _ in generator._SPEC_TEMPLATE
+        ]
+        assert all(name in prompt and difficulty in prompt
+                   for prompt, (name, difficulty) in zip(started, expected))
+
+    def test_sync_batch_runs_on_threads_in_order(self, fake_client):
+        threads = set()
+        create = fake_client.messages.create
+
+        def slow_create(**kwargs):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return create(**kwargs)
+
+        fake_client.messages.create = slow_create
+        scenarios = pre_generate_all_scenarios_sync(RESTAURANT, 'batch')
+
+        assert len(threads) > 1
+        assert [s.dimension for s in scenarios] == [dim for dim in DIMENSIONS for _ in range(2)]
+        assert [s.difficulty for s in scenarios[:2]] == [0.0, 0.5]
+        # The second wave avoids the themes of the first
+        first_wave, second_wave = fake_client.messages.calls[:7], fake_client.messages.calls[7:]
+        assert all('VERMEIDE' not in call['messages'][0]['content'] for call in first_wave)
+        assert all('Speisekarte' in call['messages'][0]['content'] for call in second_wave)
+
+
+# ============================================================================
+# GAP ANALYSIS & ARCHETYPES
+# ============================================================================
+
+PROFILE = {
+    'innovativeness': 65,
+    'risk_taking': 30,
+    'achievement_orientation': 55,
+    'autonomy_orientation': 70,
+    'proactiveness': 35,
+    'locus_of_control': 45,
+    'self_efficacy': 38,
+}
+
+
+def profile_dimensions(percentiles=PROFILE):
+    return {dim: {'percentile': p} for dim, p in percentiles.items()}
+
+
+class TestGapAnalysis:
+    """Test gap analysis and archetypes on the read-only configuration"""
+
+    def test_configuration_is_read_only(self):
+        for mapping in (DIMENSIONS, BUSINESS_CONTEXTS, ARCHETYPES, GAP_DIMENSION_MAPPING):
+            with pytest.raises(TypeError):
+                mapping['new'] = {}
+        with pytest.raises(TypeError):
+            GAP_DIMENSION_MAPPING['risk_taking']['gap']['weight'] = 0
+
+    def test_gaps_are_independent_copies(self):
+        result = calculate_personalized_gaps(profile_dimensions(), 'restaurant')
+        gap = result['gaps'][0]
+        gap['weight'] = 0
+        assert 'reason' not in GAP_DIMENSION_MAPPING['risk_taking']['gap']
+        assert calculate_personalized_gaps(profile_dimensions(), 'restaurant')['gaps'][0]['weight'] != 0
+
+    def test_gaps_are_ordered_by_weight(self):
+        result = calculate_personalized_gaps(profile_dimensions(), 'restaurant')
+        # Equal weights (proactiveness, self_efficacy) keep the assessment order
+        assert [gap['id'] for gap in result['gaps']] == [
+            'finance_gap', 'marketing_gap', 'qualification_gap'
+        ]
+        assert [c['dimension'] for c in result['completed']] == [
+            'innovativeness', 'achievement_orientation', 'autonomy_orientation', 'locus_of_control'
+        ]
+
+    def test_archetype_is_a_plain_dict(self):
+        archetype = determine_archetype(profile_dimensions())
+        assert archetype['id'] == 'independent'
+        assert isinstance(archetype, dict)
+        assert archetype is determine_archetype(profile_dimensions())
+        assert {**ARCHETYPES['independent'], 'id': 'independent'} == archetype
+
+
+# ============================================================================
+# CAT ENGINE
+# ============================================================================
+
+class TestAIScenarioCATv2:
+    """Test the v2 CAT engine against a fake client"""
+
+    def test_on_demand_cache_usage_is_counted(self, monkeypatch):
+        messages = FakeAsyncMessages(json.dumps(SCENARIO_JSON), cache_read=1800)
+        monkeypatch.setattr(generator, 'async_client', SimpleNamespace(messages=messages))
+        engine = generator.AIScenarioCATv2()
+
+        async def run():
+            await engine.create_session('s', RESTAURANT, use_batch_generation=False)
+            await engine.get_next_scenario('s')
+            await engine.submit_response('s', 'C')
+
+        asyncio.run(run())
+        stats = engine.get_results('s')['session_stats']
+        assert stats['cache_hits'] == 2
+        assert stats['cache_read_tokens'] == 3600
+
+    def test_batch_session_is_generated_concurrently(self, fake_async_client):
+        engine = generator.AIScenarioCATv2()
+
+        async def run():
+            await engine.create_session('s', RESTAURANT)
+            await engine.wait_for_batch('s')
+            await engine.get_next_scenario('s')
+
+        asyncio.run(run())
+        assert len(fake_async_client.messages.calls) == len(DIMENSIONS) * 2
+        assert len(engine.sessions['s']['scenarios']) == len(DIMENSIONS) * 2
+
+    def test_first_batch_scenario_is_served_before_the_batch_finishes(self, fake_async_client):
+        engine = generator.AIScenarioCATv2()
+        create = fake_async_client.messages.create
+
+        async def run():
+            release = asyncio.Event()
+
+            async def gated_create(**kwargs):
+                # Only the first scenario (innovativeness at 0.0) is quick
+                prompt = kwargs['messages'][0]['content']
+                if 'Innovationsfreude' not in prompt or 'Difficulty: 0.5' in prompt:
+                    await release.wait()
+                return await create(**kwargs)
+
+            fake_async_client.messages.create = gated_create
+            info = await engine.create_session('s', RESTAURANT)
+            first = await engine.get_next_scenario('s')
+            pending = 's' in engine._pending_batches
+            release.set()
+            second = await engine.submit_response('s', 'B')
+            return info, first, pending, second
+
+        info, first, pending, second = asyncio.run(asyncio.wait_for(run(), timeout=5))
+        assert info['scenarios_ready'] == 1 and pending
+        assert first['scenario']['dimension'] == second['scenario']['dimension'] == 'innovativeness'
+        assert len(engine.sessions['s']['scenarios']) == len(DIMENSIONS) * 2
+        assert not engine._pending_batches
+
+    def test_slow_batch_falls_back_to_on_demand(self, fake_async_client, monkeypatch):
+        monkeypatch.setattr(generator, 'BATCH_WAIT_TIMEOUT_SECONDS', 0.01)
+        engine = generator.AIScenarioCATv2()
+        create = fake_async_client.messages.create
+
+        async def run():
+            release = asyncio.Event()
+
+            async def gated_create(**kwargs):
+                # The batch is stuck after its first scenario; on-demand
+                # calls (which avoid the seen themes) go through
+                prompt = kwargs['messages'][0]['content']
+                first = 'Innovationsfreude' in prompt and 'Difficulty: 0.0' in prompt
+                if not first and 'VERMEIDE' not in prompt:
+                    await release.wait()
+                return await create(**kwargs)
+
+            fake_async_client.messages.create = gated_create
+            await engine.create_session('s', RESTAURANT)
+            await engine.get_next_scenario('s')
+            second = await engine.submit_response('s', 'D')
+            return second
+
+        second = asyncio.run(asyncio.wait_for(run(), timeout=5))
+        session = engine.sessions['s']
+        assert not session['use_batch'] and not session['batch_pending']
+        assert len(session['scenarios']) == 1
+        assert second['scenario']['dimension'] == 'risk_taking'
+        assert not engine._pending_batches
+        assert engine.sessions['s']['responses'][0]['theta_value'] == 1.5
+
+    def test_clients_are_shared_with_v1(self):
+        import ai_scenario_generator
+        assert generator.sync_client is ai_scenario_generator.client
+        assert generator.async_client is ai_scenario_generator.async_client
+
+    def test_results_convert_all_thetas(self, fake_async_client):
+        engine = generator.AIScenarioCATv2()
+
+        async def run():
+            await engine.create_session('s', RESTAURANT, use_batch_generation=False)
+            await engine.get_next_scenario('s')
+            await engine.submit_response('s', 'D')
+
+        asyncio.run(run())
+        dimensions = engine.get_results('s')['personality_profile']['dimensions']
+        first = next(iter(DIMENSIONS))
+        assert dimensions[first]['percentile'] == generator.theta_to_percentile(0.6 * 1.5)
+        assert dimensions[first]['level'] == 'high'
+        for data in dimensions.values():
+            assert type(data['percentile']) is int and type(data['level']) is str
+        assert json.dumps(dimensions)
+
+    def test_progress_counts_items_and_dimensions(self, fake_async_client):
+        engine = generator.AIScenarioCATv2()
+
+        async def run():
+            await engine.create_session('s', RESTAURANT)
+            first = (await engine.get_next_scenario('s'))['progress']
+            for _ in range(3):
+                progress = (await engine.submit_response('s', 'B'))['progress']
+            return first, progress
+
+        first, progress = asyncio.run(run())
+        assert first == {
+            'current_item': 1, 'estimated_total': 14, 'percentage': 0, 'dimensions_assessed': 0
+        }
+        assert progress == {
+            'current_item': 4, 'estimated_total': 14, 'percentage': 21, 'dimensions_assessed': 2
+        }
+
+    def test_on_demand_dimensions_cycle_in_assessment_order(self, fake_async_client):
+        engine = generator.AIScenarioCATv2()
+
+        async def run():
+            await engine.create_session('s', RESTAURANT, use_batch_generation=False)
+            # Asking again without answering does not skip a dimension
+            await engine.get_next_scenario('s')
+            dims = [(await engine.get_next_scenario('s'))['scenario']['dimension']]
+            while not (data := await engine.submit_response('s', 'A'))['complete']:
+                dims.append(data['scenario']['dimension'])
+            return dims
+
+        assert asyncio.run(run()) == list(DIMENSIONS) * 2
+
+
+# ============================================================================
+# SESSION STORE
+# ============================================================================
+
+class TestRedisSessionStore:
+    """Test v2 sessions persisted through the Redis store"""
+
+    def test_session_round_trip(self, fake_async_client):
+        redis_client = FakeRedis()
+        store = generator.RedisSessionStore(redis_client)
+        engine = generator.AIScenarioCATv2(store)
+
+        async def run():
+            await engine.create_session('r1', RESTAURANT)
+            await engine.wait_for_batch('r1')
+            assert 'gv:ai_cat_v2:r1:batch' in redis_client.data
+            await engine.get_next_scenario('r1')
+
+        asyncio.run(run())
+        session = store['r1']
+        assert session['current_scenario'] == session['scenarios'][0]
+        assert session['current_scenario'].options == SCENARIO_JSON['options']
+        assert len(session['scenarios']) == len(DIMENSIONS) * 2
+        assert list(redis_client.data) == ['gv:ai_cat_v2:r1']
+        assert 'r1' in store and store.get('other') is None
+
+    def test_finished_batch_does_not_overwrite_the_session(self, fake_async_client):
+        store = generator.RedisSessionStore(FakeRedis())
+        engine, other_worker = generator.AIScenarioCATv2(store), generator.AIScenarioCATv2(store)
+
+        async def run():
+            await engine.create_session('r1', RESTAURANT)
+            await other_worker.get_next_scenario('r1')
+            await other_worker.submit_response('r1', 'A')
+            await engine.wait_for_batch('r1')
+
+        asyncio.run(run())
+        session = store['r1']
+        # The other worker's answer is kept; it went on demand without the
+        # batch, and the batch stays parked instead of being merged
+        assert session['total_items'] == 1 and not session['use_batch']
+        assert len(session['scenarios']) == 1
+
+    def test_full_session_matches_in_memory_engine(self, fake_async_client):
+        redis_client = FakeRedis()
+        engines = generator.AIScenarioCATv2(), generator.AIScenarioCATv2(
+            generator.RedisSessionStore(redis_client)
+        )
+
+        async def run(engine):
+            await engine.create_session('s', RESTAURANT, use_batch_generation=False)
+            await engine.get_next_scenario('s')
+            answers = iter('ABCDDCBAABCDDC')
+            while not (data := await engine.submit_response('s', next(answers)))['complete']:
+                pass
+            return data['results']
+
+        results = [asyncio.run(run(engine)) for engine in engines]
+        assert results[0] == results[1]
+        assert set(redis_client.ttls.values()) == {generator.ai_scenario_generator.SESSION_TTL_SECONDS}
+
+    def test_falls_back_to_memory_without_redis_url(self, monkeypatch):
+        monkeypatch.delenv('REDIS_URL', raising=False)
+        assert generator.create_session_store() == {}
@@ -141,35 +141,39 @@ def test_full_session():
         "description": "Nachhaltiger Mode-Shop",
     }
 
-    print("\n📝 Creating session with batch generation...")
-    start = time.time()
-    session_info = engine.create_session(
-        "full_test_session", business_context, use_batch_generation=True
-    )
-    creation_time = time.time() - start
-
-    print(f"   Session created in {creation_time:.2f}s")
-    print(f"   Scenarios ready: {session_info['scenarios_ready']}")
-    print(f"   Cache hits: {session_info['cache_hits']}")
-
-    # Get first scenario  <-- NEU!
-    first_scenario = engine.get_next_scenario("full_test_session")
-    print(f"   First scenario loaded: {first_scenario['scenario']['dimension']}")
-
-    # Simulate answering questions
-    print("\n🎯 Simulating assessment (answering all questions)...")
-    answers = ["A", "B", "C", "D", "B", "C", "A", "D", "C", "B", "A", "D", "B", "C"]
-
-    for i, answer in enumerate(answers):
-        result = engine.submit_response("full_test_session", answer)
-        if result.get("complete"):
-            print(f"   ✅ Assessment complete after {i+1} questions")
-            break
-        else:
-            progress = result.get("progress", {})
-            print(
-                f"   Question {progress.get('current_item', i+1)}: answered '{answer}'"
-            )
+    async def run_session():
+        print("\n📝 Creating session with batch generation...")
+        start = time.time()
+        session_info = await engine.create_session(
+            "full_test_session", business_context, use_batch_generation=True
+        )
+        creation_time = time.time() - start
+
+        # The rest of the batch keeps generating in the background
+        print(f"   Session created in {creation_time:.2f}s")
+        print(f"   Scenarios ready: {session_info['scenarios_ready']}")
+        print(f"   Cache hits: {session_info['cache_hits']}")
+
+        # Get first scenario  <-- NEU!
+        first_scenario = await engine.get_next_scenario("full_test_session")
+        print(f"   First scenario loaded: {first_scenario['scenario']['dimension']}")
+
+        # Simulate answering questions
+        print("\n🎯 Simulating assessment (answering all questions)...")
+        answers = ["A", "B", "C", "D", "B", "C", "A", "D", "C", "B", "A", "D", "B", "C"]
+
+        for i, answer in enumerate(answers):
+            result = await engine.submit_response("full_test_session", answer)
+            if result.get("complete"):
+                print(f"   ✅ Assessment complete after {i+1} questions")
+                break
+            else:
+                progress = result.get("progress", {})
+                print(
+                    f"   Question {progress.get('current_item', i+1)}: answered '{answer}'"
+                )
+
+    asyncio.run(run_session())
 
     # Get results
     results = engine.get_results("full_test_session")
@@ -0,0 +1,408 @@
+"""
+Tests for the Adaptive Financial Calculator
+Tests GZ validations (scalar and batch) with legal citations
+"""
+
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from dataclasses import FrozenInstanceError
+
+from adaptive_financial_calculator_full import (
+    AdaptiveFinancialCalculator,
+    validate_hauptberuflich_hours,
+    validate_part_time_job,
+    validate_startup_capital,
+    make_capital_validator,
+    validate_hauptberuflich_batch,
+    validate_part_time_batch,
+    validate_startup_capital_batch,
+    validate_batch,
+    validation_result_to_json,
+    severity_codes,
+    SEV_OK,
+    SEV_INFO,
+    SEV_WARNING,
+    SEV_HIGH,
+    SEV_CRITICAL,
+    get_ramp,
+    ramp_curve,
+    INDUSTRY_RAMP_PROFILES,
+    IndustryType,
+)
+
+
+# ============================================================================
+# SCALAR VALIDATORS
+# ============================================================================
+
+class TestScalarValidators:
+    """Test the single-applicant validators"""
+
+    def test_hours_below_minimum_is_critical(self):
+        result = validate_hauptberuflich_hours(12)
+        assert result.valid is False
+        assert result.severity == SEV_CRITICAL
+        assert '12 Stunden' in result.error
+
+    def test_hours_low_is_info(self):
+        result = validate_hauptberuflich_hours(17)
+        assert result.valid is True
+        assert result.severity == SEV_INFO
+        assert result.warning is not None
+
+    def test_hours_ok(self):
+        result = validate_hauptberuflich_hours(30)
+        assert result.valid is True
+        assert result.note is not None
+        assert result.error is None
+
+    def test_part_time_double_violation(self):
+        result = validate_part_time_job(20, 1500, 1000)
+        assert result.valid is False
+        assert 'DOPPELTE VERLETZUNG' in result.error
+
+    def test_part_time_close_to_limits(self):
+        result = validate_part_time_job(13, 500, 3000)
+        assert result.valid is True
+        assert result.severity == SEV_WARNING
+
+    def test_part_time_ok_has_reminder(self):
+        result = validate_part_time_job(10, 500, 3000)
+        assert result.valid is True
+        assert result.reminder is not None
+
+    def test_capital_too_low(self):
+        result = validate_startup_capital(3000, 2000)
+        assert result.valid is False
+        assert result.severity == SEV_HIGH
+
+    def test_capital_without_living_costs(self):
+        result = validate_startup_capital(20000, 0)
+        assert result.valid is True
+        assert '0.0 Monate' in result.warning
+
+    @pytest.mark.parametrize('living', [2000.0, 0.0])
+    def test_specialized_capital_validator_matches_generic(self, living):
+        validate = make_capital_validator(living)
+        for capital in [1000.0, 4000.0, 6000.0, 20000.0]:
+            assert validate(capital) == validate_startup_capital(capital, living)
+
+    def test_cached_results_are_immutable(self):
+        result = validate_hauptberuflich_hours(12)
+        with pytest.raises(FrozenInstanceError):
+            result.valid = True
+        assert validate_hauptberuflich_hours(12).valid is False
+
+    def test_cache_keeps_int_and_float_inputs_apart(self):
+        assert '13h/Woche' in validate_part_time_job(13, 500, 2000).warning
+        assert '13.0h/Woche' in validate_part_time_job(13.0, 500, 2000).warning
+        assert '12 Stunden' in validate_hauptberuflich_hours(12).error
+        assert '12.0 Stunden' in validate_hauptberuflich_hours(12.0).error
+
+    def test_to_dict_formats_text_and_omits_unset_fields(self):
+        data = validate_part_time_job(10, 500, 3000).to_dict()
+        assert isinstance(data['note'], str)
+        assert isinstance(data['legal_citations'], list)
+        assert 'error' not in data
+
+    def test_to_dict_renders_severity_name(self):
+        assert validate_hauptberuflich_hours(12).to_dict()['severity'] == 'CRITICAL'
+        assert 'severity' not in validate_hauptberuflich_hours(30).to_dict()
+
+    def test_json_matches_to_dict(self):
+        result = validate_startup_capital(3000, 2000)
+        assert json.loads(validation_result_to_json(result)) == result.to_dict()
+
+
+# ============================================================================
+# BATCH VALIDATORS
+# ============================================================================
+
+class TestBatchValidators:
+    """Batch results must match the scalar validators"""
+
+    def test_hours_batch_matches_scalar(self):
+        hours = [0, 14, 15, 19, 20, 40]
+        assert validate_hauptberuflich_batch(hours) == [
+            validate_hauptberuflich_hours(h) for h in hours
+        ]
+
+    @pytest.mark.parametrize('hours,income,main', [
+        (20, 1500, 1000),
+        (20, 100, 3000),
+        (5, 2500, 1000),
+        (12, 100, 3000),
+        (5, 900, 1200),
+        (5, 0, 0),
+        (10, 500, 3000),
+    ])
+    def test_part_time_batch_matches_scalar(self, hours, income, main):
+        assert validate_part_time_batch([hours], [income], [main]) == [
+            validate_part_time_job(hours, income, main)
+        ]
+
+    def test_capital_batch_matches_scalar(self):
+        capital = [1000.0, 6000.0, 20000.0, 20000.0]
+        living = [2000.0, 4000.0, 2000.0, 0.0]
+        assert validate_startup_capital_batch(capital, living) == [
+            validate_startup_capital(c, l) for c, l in zip(capital, living)
+        ]
+
+    def test_validate_batch_skips_part_time_when_not_applicable(self):
+        results = validate_batch([
+            {'hours_per_week_available': 30, 'startup_capital': 10000, 'monthly_living_costs': 2000},
+            {
+                'hours_per_week_available': 10,
+                'startup_capital': 3000,
+                'monthly_living_costs': 2000,
+                'part_time_job_possible': True,
+                'part_time_hours_per_week': 10,
+                'part_time_income_monthly': 500,
+                'main_income_expected': 3000,
+            },
+        ])
+        assert results[0]['part_time'] is None
+        assert results[1]['part_time'] == validate_part_time_job(10, 500, 3000)
+        assert results[1]['hours'].valid is False
+        assert results[1]['capital'].valid is False
+
+    def test_severity_codes_reduce_to_worst(self):
+        results = validate_hauptberuflich_batch([30, 17, 12])
+        assert severity_codes(results).tolist() == [SEV_OK, SEV_INFO, SEV_CRITICAL]
+        assert severity_codes(results).max() == SEV_CRITICAL
+        assert severity_codes([None]).max() == SEV_OK
+
+
+# ============================================================================
+# INDUSTRY RAMP PROFILES
+# ============================================================================
+
+class TestRampCurve:
+    """Test the vectorized industry ramp-up"""
+
+    @pytest.mark.parametrize('industry', list(INDUSTRY_RAMP_PROFILES))
+    def test_matches_profile_formula(self, industry):
+        profile = INDUSTRY_RAMP_PROFILES[industry]
+        expected = [
+            min(profile['base'] + profile['growth'] * m, profile['max'])
+            for m in range(24)
+        ]
+        assert ramp_curve(industry, 24).tolist() == pytest.approx(expected)
+
+    @pytest.mark.parametrize('industry', list(INDUSTRY_RAMP_PROFILES))
+    def test_get_ramp_matches_profile(self, industry):
+        profile = INDUSTRY_RAMP_PROFILES[industry]
+        assert get_ramp(industry) == (
+            profile['base'], profile['growth'], profile['max'], profile['months_to_max']
+        )
+
+    def test_unknown_industry_uses_default(self):
+        assert ramp_curve('unknown', 6).tolist() == ramp_curve('dienstleistung', 6).tolist()
+
+    def test_industry_enum_indexes_table(self):
+        for member in IndustryType:
+            key = getattr(member, 'value', member)
+            if not isinstance(key, str):
+                key = member.name.lower()
+            assert ramp_curve(member, 12).tolist() == ramp_curve(key, 12).tolist()
+
+
+# ============================================================================
+# ADAPTIVE CALCULATOR
+# ============================================================================
+
+def make_profile(**overrides):
+    """Minimal founder profile with attribute access"""
+    data = {
+        'industry': 'consulting',
+        'experience_level': 'senior',
+        'network_strength': 'medium',
+        'first_customers_pipeline': 2,
+        'previous_self_employment': False,
+        'hours_per_week_available': 30,
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+class TestAdaptiveCalculator:
+    """Test the financial plan generation"""
+
+    def setup_method(self):
+        self.calc = AdaptiveFinancialCalculator()
+
+    def test_utilization_curve_matches_monthwise_formula(self):
+        profile = make_profile()
+        base, growth, max_util, _ = get_ramp('consulting')
+        bonus = 0.07 + 0.05 + 0.06
+        adjusted_max = min(0.90, max_util + bonus * 0.5)
+        expected = [
+            round(min(adjusted_max, base + growth * (m - 1) + bonus * max(0, 1 - m / 12)), 3)
+            for m in range(1, 13)
+        ]
+        assert self.calc.calculate_utilization_curve(profile) == expected
+
+    def test_utilization_curve_is_cached_per_signature(self):
+        curve = self.calc.calculate_utilization_curve(make_profile(first_customers_pipeline=4))
+        curve[0] = -1.0
+        again = self.calc.calculate_utilization_curve(make_profile(first_customers_pipeline=9))
+        assert again[0] != -1.0
+        assert again == self.calc.calculate_utilization_curve(make_profile(first_customers_pipeline=4))
+
+    def test_living_costs_apply_temporary_reduction(self):
+        profile = make_profile(
+            partner_income_monthly=500,
+            can_reduce_living_costs=True,
+            living_reduction_months=3,
+            living_reduction_percent=20,
+        )
+        costs, meta = self.calc.calculate_flexible_living_costs(profile, 2000)
+        assert costs == [1200.0] * 3 + [1500.0] * 9
+        assert meta['effective_base'] == 1500
+        assert meta['reduction_applied'] is True
+
+    def test_scenario_balance_and_totals(self):
+        scenario = self.calc._generate_scenario(
+            'Test',
+            [0.5] * 12,
+            (100, 0, 0),
+            1000,
+            [1500.0] * 12,
+            10000,
+            part_time_income=600,
+            part_time_months=6
+        )
+        monate = scenario['monate']
+        assert [m['monat'] for m in monate] == list(range(1, 13))
+        assert monate[0]['kosten_geschaeft'] == 1530
+        assert [m['zusatz_einkommen'] for m in monate] == [600] * 6 + [0] * 6
+        assert scenario['gesamt_umsatz'] == pytest.approx(12 * 4000)
+        assert scenario['endkontostand'] == pytest.approx(10000 + scenario['jahresergebnis'])
+        assert scenario['break_even_month'] == 1
+        assert scenario['break_even_monat'] == 'Monat 1'
+
+    def test_scenarios_in_one_pass_match_single_runs(self):
+        specs = [
+            ('Base', [0.4] * 12, 1000, 0, 0),
+            ('Worst', [0.28] * 12, 1050, 0, 0),
+            ('Optimal', [0.4] * 12, 1000, 600, 6),
+        ]
+        args = ((120, 500, 4000), [1800.0] * 12, 8000)
+        combined = self.calc._generate_scenarios(specs, *args)
+        for spec, scenario in zip(specs, combined):
+            name, curve, costs, pt_income, pt_months = spec
+            assert scenario == self.calc._generate_scenario(
+                name, curve, args[0], costs, args[1], args[2],
+                part_time_income=pt_income, part_time_months=pt_months
+            )
+
+    @pytest.mark.parametrize('balance,break_even,profit,expected', [
+        (10000.01, 3, 30000.01, 30 + 25 + 12 + 20),
+        (10000, 4, 30000, 25 + 20 + 12 + 15),
+        (0, 0, 0, 5 + 12),
+        (-5000, 12, -1, 10 + 12),
+    ])
+    def test_confidence_buckets_use_strict_thresholds(self, balance, break_even, profit, expected):
+        scenario = {
+            'endkontostand': balance,
+            'break_even_month': break_even,
+            'gesamt_gewinn_geschaeft': profit,
+        }
+        assert self.calc._calculate_confidence(scenario, make_profile()) == expected
+
+    def test_utilization_percent_is_correctly_rounded_on_ties(self):
+        # 0.0035 * 100 lies just below 0.35; ndarray rounding would show 0.4
+        args = ('Worst', [0.005 * 0.7] * 12, (100, 0, 0), 1000, [1500.0] * 12, 10000)
+        monate = self.calc._generate_scenario(*args)['monate']
+        assert [m['auslastung'] for m in monate] == [0.3] * 12
+
+    def test_amounts_are_rounded_in_one_array_pass(self):
+        # round(0.015, 2) gives 0.01; the vectorized pass rounds this tie up
+        args = ('Base', [0.5] * 12, (100, 0, 0), 1000, [0.015] * 12, 10000)
+        monate = self.calc._generate_scenario(*args)['monate']
+        assert [m['privatentnahme'] for m in monate] == [0.02] * 12
+
+    def test_repeated_scenarios_do_not_share_state(self):
+        args = ('Base', [0.5] * 12, (100, 0, 0), 1000, [1500.0] * 12, 10000)
+        first = self.calc._generate_scenario(*args)
+        first['monate'][0] = None
+        second = self.calc._generate_scenario(*args)
+        assert second['monate'][0]['umsatz'] == pytest.approx(4000)
+
+    def test_month_rows_are_plain_dicts_in_column_order(self):
+        args = ('Base', [0.5] * 12, (100, 0, 0), 1000, [1500.0] * 12, 10000)
+        scenario = self.calc._generate_scenario(*args)
+        row = scenario['monate'][0]
+        assert isinstance(row, dict)
+        assert list(row) == [
+            'monat', 'umsatz', 'kosten_geschaeft', 'gewinn_geschaeft', 'privatentnahme',
+            'zusatz_einkommen', 'saldo', 'kontostand', 'auslastung'
+        ]
+        assert json.loads(json.dumps(scenario))['monate'][0] == row
+
+    def test_revenue_starts_retainers_and_projects_later(self):
+        month = np.arange(1, 13)
+        revenue = self.calc._calculate_revenue(
+            (0, 1000, 5000),
+            np.full(12, 0.5),
+            month
+        )
+        assert revenue[:3].tolist() == [0, 0, 0]
+        assert revenue[3:6].tolist() == pytest.approx([750] * 3)
+        assert revenue[6:].tolist() == pytest.approx([1500] * 6)
+
+    def test_batch_matches_single_plans(self):
+        plans = [
+            {
+                'profile': make_profile(),
+                'revenue_sources': [{'type': 'hourly', 'price': 120}],
+                'base_living_costs': 2000,
+                'business_costs_monthly': 500,
+                'startup_capital': 15000,
+            },
+            {
+                'profile': make_profile(hours_per_week_available=10),
+                'revenue_sources': [{'type': 'hourly', 'price': 80}],
+                'base_living_costs': 1800,
+                'business_costs_monthly': 300,
+                'startup_capital': 5000,
+            },
+            {
+                'profile': make_profile(
+                    industry='handwerk',
+                    part_time_job_possible=True,
+                    part_time_hours_per_week=10,
+                    part_time_income_monthly=500,
+                    part_time_duration_months=6,
+                ),
+                'revenue_sources': [
+                    {'type': 'project', 'price': 4000},
+                    {'type': 'monthly', 'price': 800},
+                ],
+                'base_living_costs': 2200,
+                'business_costs_monthly': 700,
+                'startup_capital': 12000,
+            },
+        ]
+        batch = self.calc.generate_adaptive_financials_batch(plans)
+        assert 'error' in batch[1]
+        assert batch == [self.calc.generate_adaptive_financials(**plan) for plan in plans]
+
+    def test_failed_validation_skips_planning(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError('planning ran for an invalid profile')
+
+        monkeypatch.setattr(self.calc, 'calculate_utilization_curve', fail)
+        monkeypatch.setattr(self.calc, 'calculate_flexible_living_costs', fail)
+        result = self.calc.generate_adaptive_financials(
+            make_profile(hours_per_week_available=10, part_time_job_possible=True),
+            [],
+            2000,
+            500,
+            10000
+        )
+        assert result['error'] == 'VALIDATION_FAILED'
+        assert result['validations']['part_time'] is not None